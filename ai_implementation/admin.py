@@ -38,7 +38,7 @@ class TravelSearchAdmin(admin.ModelAdmin):
 class ConsolidatedResultAdmin(admin.ModelAdmin):
     list_display = ['search', 'created_at']
     search_fields = ['search__destination', 'summary']
-    readonly_fields = ['id', 'created_at', 'updated_at']
+    readonly_fields = ['id', 'created_at', 'updated_at', 'raw_openai_response']
     date_hierarchy = 'created_at'
     
     fieldsets = (
@@ -158,7 +158,7 @@ class GroupConsensusAdmin(admin.ModelAdmin):
     list_display = ['group', 'generated_by', 'is_active', 'created_at']
     list_filter = ['is_active', 'created_at']
     search_fields = ['group__name', 'generated_by__username']
-    readonly_fields = ['id', 'created_at']
+    readonly_fields = ['id', 'created_at', 'raw_openai_response']
     date_hierarchy = 'created_at'
     
     fieldsets = (
@@ -260,6 +260,8 @@ class GroupItineraryOptionAdmin(admin.ModelAdmin):
 @admin.register(ItineraryVote)
 class ItineraryVoteAdmin(admin.ModelAdmin):
     list_display = ['user', 'option', 'group', 'voted_at']
+    # Option.__str__ also reads its group, which the automatic join would miss
+    list_select_related = ['user', 'group', 'option__group']
     list_filter = ['voted_at', 'group']
     search_fields = ['user__username', 'group__name', 'option__title', 'comment']
     readonly_fields = ['id', 'voted_at']
@@ -85,6 +85,34 @@ MAJOR_AIRPORTS = [
 ]
 
 
+def _build_search_rows(airports):
+    """
+    Precompute the lowercased match fields and display strings for each
+    airport so a search only has to compare strings.
+    """
+    rows = []
+    for airport in airports:
+        rows.append((
+            airport['code'].lower(),
+            airport['city'].lower(),
+            airport['name'].lower(),
+            airport['country'].lower(),
+            {
+                'code': airport['code'],
+                'name': airport['name'],
+                'city': airport['city'],
+                'country': airport['country'],
+                'display': f"{airport['code']} - {airport['city']}, {airport['country']}",
+                'full_display': f"{airport['name']} ({airport['code']})",
+            },
+        ))
+    return tuple(rows)
+
+
+# Built once at import; MAJOR_AIRPORTS is static
+_SEARCH_ROWS = _build_search_rows(MAJOR_AIRPORTS)
+
+
 def search_airports(query: str, limit: int = 10) -> list:
     """
     Search airports by code, city name, or airport name.
@@ -102,41 +130,31 @@ def search_airports(query: str, limit: int = 10) -> list:
     query_lower = query.lower().strip()
     matches = []
     
-    for airport in MAJOR_AIRPORTS:
-        score = 0
-        
+    for code, city, name, country, entry in _SEARCH_ROWS:
         # Exact code match (highest priority)
-        if airport['code'].lower() == query_lower:
+        if code == query_lower:
             score = 100
         # Code starts with query
-        elif airport['code'].lower().startswith(query_lower):
+        elif code.startswith(query_lower):
             score = 80
         # Code contains query
-        elif query_lower in airport['code'].lower():
+        elif query_lower in code:
             score = 60
         # City name match
-        elif query_lower in airport['city'].lower():
+        elif query_lower in city:
             score = 50
         # Airport name match
-        elif query_lower in airport['name'].lower():
+        elif query_lower in name:
             score = 40
         # Country match
-        elif query_lower in airport['country'].lower():
+        elif query_lower in country:
             score = 20
+        else:
+            continue
         
-        if score > 0:
-            matches.append({
-                'code': airport['code'],
-                'name': airport['name'],
-                'city': airport['city'],
-                'country': airport['country'],
-                'display': f"{airport['code']} - {airport['city']}, {airport['country']}",
-                'full_display': f"{airport['name']} ({airport['code']})",
-                'score': score
-            })
+        matches.append({**entry, 'score': score})
     
     # Sort by score (highest first), then by city name
     matches.sort(key=lambda x: (-x['score'], x['city']))
     
     return matches[:limit]
-
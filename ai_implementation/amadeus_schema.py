@@ -0,0 +1,99 @@
+"""
+Amadeus Flight Offers Schema
+Typed msgspec structs for the subset of the Amadeus flight-offers response
+that FlightAPIConnector uses. Decoding straight into these structs skips
+building the generic dict tree that response.json() would produce.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+import msgspec
+
+
+class _Record(msgspec.Struct, frozen=True, gc=False):
+    """
+    Base for decoded records. The decoded tree never contains reference
+    cycles, so instances are kept out of the garbage collector entirely.
+    """
+
+
+class Endpoint(_Record):
+    """Departure or arrival point of a segment"""
+
+    at: str = "N/A"
+
+
+class Segment(_Record):
+    """Single flight segment within an itinerary"""
+
+    carrierCode: str = "Unknown"
+    cabin: str = "Economy"
+    departure: Optional[Endpoint] = None
+    arrival: Optional[Endpoint] = None
+
+
+class Itinerary(_Record):
+    """One direction of travel in a flight offer"""
+
+    duration: str = "N/A"
+    segments: List[Segment] = []
+
+
+class Price(_Record):
+    """Offer price; Amadeus sends the total as a decimal string"""
+
+    total: Union[str, float] = 0
+    currency: str = "USD"
+
+
+class FlightOffer(_Record):
+    """Flight offer as returned by /shopping/flight-offers"""
+
+    id: str = "N/A"
+    price: Optional[Price] = None
+    itineraries: List[Itinerary] = []
+    numberOfBookableSeats: Union[int, str] = "N/A"
+
+
+class FlightOffersResponse(_Record):
+    """Top-level flight-offers response body"""
+
+    data: List[FlightOffer] = []
+
+
+class RawFlightOffersResponse(_Record):
+    """Response body with each offer left undecoded, so one bad offer can be skipped"""
+
+    data: List[msgspec.Raw] = []
+
+
+# Decoders are reusable and thread-safe, so build them once at import time
+FLIGHT_OFFERS_DECODER = msgspec.json.Decoder(FlightOffersResponse)
+RAW_FLIGHT_OFFERS_DECODER = msgspec.json.Decoder(RawFlightOffersResponse)
+FLIGHT_OFFER_DECODER = msgspec.json.Decoder(FlightOffer)
+
+_EMPTY_ENDPOINT = Endpoint()
+_EMPTY_PRICE = Price()
+_EMPTY_ITINERARY = Itinerary()
+_EMPTY_SEGMENT = Segment()
+
+
+def flight_offer_to_dict(offer: FlightOffer) -> Dict[str, Any]:
+    """Map a decoded FlightOffer to the connector's simplified flight format"""
+    price = offer.price or _EMPTY_PRICE
+    first_itinerary = offer.itineraries[0] if offer.itineraries else _EMPTY_ITINERARY
+    segments = first_itinerary.segments
+    first_segment = segments[0] if segments else _EMPTY_SEGMENT
+
+    return {
+        "id": offer.id,
+        "price": float(price.total),
+        "currency": price.currency,
+        "airline": first_segment.carrierCode,
+        "departure_time": (first_segment.departure or _EMPTY_ENDPOINT).at,
+        "arrival_time": (first_segment.arrival or _EMPTY_ENDPOINT).at,
+        "duration": first_itinerary.duration,
+        "stops": len(segments) - 1,
+        "booking_class": first_segment.cabin,
+        "seats_available": offer.numberOfBookableSeats,
+    }
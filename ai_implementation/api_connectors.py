@@ -5,11 +5,41 @@ This module provides a unified interface for searching across multiple travel se
 """
 
 import os
+import logging
+import random
 import requests
-import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Default for settings.AMADEUS_FLIGHT_CACHE_TIMEOUT (seconds)
+FLIGHT_CACHE_TIMEOUT = 600
+
+# Default for settings.GEOCODE_CACHE_TIMEOUT (seconds); place names resolve to
+# the same coordinates for a long time
+GEOCODE_CACHE_TIMEOUT = 1800
+
+# Try to import the typed msgspec decoder for Amadeus flight offers
+try:
+    from .amadeus_schema import (
+        FLIGHT_OFFER_DECODER,
+        RAW_FLIGHT_OFFERS_DECODER,
+        flight_offer_to_dict,
+    )
+
+    USE_MSGSPEC = True
+except ImportError:
+    # msgspec not installed, parse offers as generic dicts
+    USE_MSGSPEC = False
+
+# Shared read-only fallback for optional nested objects in API payloads
+_EMPTY: Dict[str, Any] = {}
 
 
 class BaseAPIConnector:
@@ -21,6 +51,25 @@ class BaseAPIConnector:
             "Content-Type": "application/json",
             "User-Agent": "GroupGo-TravelApp/1.0",
         }
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create an HTTP session that retries rate-limited and transient
+        server errors with exponential backoff, honoring Retry-After.
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods={"GET", "POST"},
+            respect_retry_after_header=True,
+        )
+        session = requests.Session()
+        adapter = HTTPAdapter(max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def _make_request(
         self,
@@ -32,11 +81,11 @@ class BaseAPIConnector:
         """Make HTTP request with error handling"""
         try:
             if method == "GET":
-                response = requests.get(
+                response = self.session.get(
                     url, params=params, headers=self.headers, timeout=self.timeout
                 )
             elif method == "POST":
-                response = requests.post(
+                response = self.session.post(
                     url, json=data, headers=self.headers, timeout=self.timeout
                 )
             else:
@@ -46,7 +95,9 @@ class BaseAPIConnector:
             return response.json()
         except requests.exceptions.RequestException:
             # Log error without exposing sensitive details
-            print("API request failed - check network connectivity and credentials")
+            logger.warning(
+                "API request failed - check network connectivity and credentials"
+            )
             return None
 
 
@@ -70,7 +121,7 @@ class FlightAPIConnector(BaseAPIConnector):
     def _get_access_token(self) -> Optional[str]:
         """Get OAuth2 access token for Amadeus API"""
         if not self.api_key or not self.api_secret:
-            print("Amadeus API credentials not configured")
+            logger.warning("Amadeus API credentials not configured")
             return None
 
         url = "https://test.api.amadeus.com/v1/security/oauth2/token"
@@ -81,13 +132,13 @@ class FlightAPIConnector(BaseAPIConnector):
         }
 
         try:
-            response = requests.post(url, data=data, timeout=self.timeout)
+            response = self.session.post(url, data=data, timeout=self.timeout)
             response.raise_for_status()
             self.access_token = response.json().get("access_token")
             return self.access_token
         except Exception:
             # Log error without exposing sensitive credentials
-            print("Error getting access token: Authentication failed")
+            logger.warning("Error getting access token: Authentication failed")
             return None
 
     def search_flights(
@@ -98,6 +149,7 @@ class FlightAPIConnector(BaseAPIConnector):
         return_date: Optional[str] = None,
         adults: int = 1,
         max_results: int = 10,
+        no_cache: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Search for flights.
@@ -109,6 +161,7 @@ class FlightAPIConnector(BaseAPIConnector):
             return_date: Return date in YYYY-MM-DD format (for round trip)
             adults: Number of adult passengers
             max_results: Maximum number of results to return
+            no_cache: Skip the cached results and query the API directly
 
         Returns:
             List of flight options
@@ -120,6 +173,18 @@ class FlightAPIConnector(BaseAPIConnector):
                 origin, destination, departure_date, return_date, adults
             )
 
+        # Serve repeated searches for the same route from the cache
+        cache_timeout = getattr(
+            settings, "AMADEUS_FLIGHT_CACHE_TIMEOUT", FLIGHT_CACHE_TIMEOUT
+        )
+        cache_key = self._get_cache_key(
+            origin, destination, departure_date, return_date, adults, max_results
+        )
+        if cache_timeout and not no_cache:
+            cached_flights = cache.get(cache_key)
+            if cached_flights is not None:
+                return cached_flights
+
         # Get access token
         if not self.access_token:
             if not self._get_access_token():
@@ -143,44 +208,86 @@ class FlightAPIConnector(BaseAPIConnector):
         self.headers["Authorization"] = f"Bearer {self.access_token}"
 
         try:
-            response = requests.get(
-                url, params=params, headers=self.headers, timeout=self.timeout
+            response = self.session.get(
+                url,
+                params=params,
+                headers=self.headers,
+                timeout=self.timeout,
             )
             response.raise_for_status()
-            data = response.json()
 
             # Parse and format the results
-            flights = []
-            for offer in data.get("data", []):
-                flight = self._parse_flight_offer(offer)
-                flights.append(flight)
+            if USE_MSGSPEC:
+                decode_offer = self._decode_flight_offer
+                offers = RAW_FLIGHT_OFFERS_DECODER.decode(response.content).data
+                flights = [decode_offer(offer) for offer in offers]
+            else:
+                parse_offer = self._parse_flight_offer
+                offers = response.json().get("data", [])
+                flights = [parse_offer(offer) for offer in offers]
 
+            if cache_timeout:
+                cache.set(cache_key, flights, cache_timeout)
             return flights
         except Exception:
             # Log error without exposing sensitive details
-            print("Flight search failed - using mock data")
+            logger.warning("Flight search failed - using mock data")
             return self._get_mock_flight_data(
                 origin, destination, departure_date, return_date, adults
             )
 
+    def _get_cache_key(
+        self,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        return_date: Optional[str],
+        adults: int,
+        max_results: int,
+    ) -> str:
+        """Build a cache key that treats case and whitespace variants as equal"""
+        route = "|".join(
+            str(part).strip().upper()
+            for part in (
+                origin,
+                destination,
+                departure_date,
+                return_date or "",
+                adults,
+                max_results,
+            )
+        )
+        return f"flights:amadeus:{route}"
+
+    def _decode_flight_offer(self, offer) -> Dict[str, Any]:
+        """Decode one raw Amadeus flight offer with the typed schema"""
+        try:
+            return flight_offer_to_dict(FLIGHT_OFFER_DECODER.decode(offer))
+        except Exception:
+            # Log error without exposing sensitive details
+            logger.exception("Failed to parse flight offer data")
+            return {"error": "Failed to parse flight data"}
+
     def _parse_flight_offer(self, offer: Dict) -> Dict[str, Any]:
         """Parse Amadeus flight offer into simplified format"""
         try:
-            price = offer.get("price", {})
-            itineraries = offer.get("itineraries", [])
+            price = offer.get("price") or _EMPTY
+            itineraries = offer.get("itineraries")
 
             # Get first itinerary details
-            first_itinerary = itineraries[0] if itineraries else {}
-            segments = first_itinerary.get("segments", [])
-            first_segment = segments[0] if segments else {}
+            first_itinerary = itineraries[0] if itineraries else _EMPTY
+            segments = first_itinerary.get("segments") or ()
+            first_segment = segments[0] if segments else _EMPTY
+            departure = first_segment.get("departure") or _EMPTY
+            arrival = first_segment.get("arrival") or _EMPTY
 
             return {
                 "id": offer.get("id", "N/A"),
                 "price": float(price.get("total", 0)),
                 "currency": price.get("currency", "USD"),
                 "airline": first_segment.get("carrierCode", "Unknown"),
-                "departure_time": first_segment.get("departure", {}).get("at", "N/A"),
-                "arrival_time": first_segment.get("arrival", {}).get("at", "N/A"),
+                "departure_time": departure.get("at", "N/A"),
+                "arrival_time": arrival.get("at", "N/A"),
                 "duration": first_itinerary.get("duration", "N/A"),
                 "stops": len(segments) - 1,
                 "booking_class": first_segment.get("cabin", "Economy"),
@@ -188,7 +295,7 @@ class FlightAPIConnector(BaseAPIConnector):
             }
         except Exception:
             # Log error without exposing sensitive details
-            print("Failed to parse flight offer data")
+            logger.exception("Failed to parse flight offer data")
             return {"error": "Failed to parse flight data"}
 
     def _get_mock_flight_data(
@@ -200,36 +307,72 @@ class FlightAPIConnector(BaseAPIConnector):
         adults: int,
     ) -> List[Dict[str, Any]]:
         """Generate mock flight data for testing/development"""
-        import random
-
         airlines = ["AA", "UA", "DL", "SW", "B6", "AS"]
         base_price = 250
 
-        flights = []
-        for i in range(5):
-            price = base_price + random.randint(-100, 300)
-            stops = random.choice([0, 1, 2])
-
-            flights.append(
-                {
-                    "id": f"MOCK-FL-{i+1}",
-                    "price": price * adults,
-                    "currency": "USD",
-                    "airline": random.choice(airlines),
-                    "departure_time": f"{departure_date}T{random.randint(6, 20):02d}:{random.choice([0, 30]):02d}:00",
-                    "arrival_time": f"{departure_date}T{random.randint(10, 23):02d}:{random.choice([0, 30]):02d}:00",
-                    "duration": f"PT{random.randint(2, 8)}H{random.randint(0, 59)}M",
-                    "stops": stops,
-                    "booking_class": random.choice(
-                        ["Economy", "Premium Economy", "Business"]
-                    ),
-                    "seats_available": random.randint(1, 9),
-                    "route": f"{origin} → {destination}",
-                    "is_mock": True,
-                }
+        # Draw each field for all flights at once, then build the rows in a
+        # single pass over the zipped columns
+        count = 5
+        prices = [
+            (base_price + offset) * adults
+            for offset in random.choices(range(-100, 301), k=count)
+        ]
+        departure_times = [
+            f"{departure_date}T{hour:02d}:{minute:02d}:00"
+            for hour, minute in zip(
+                random.choices(range(6, 21), k=count), random.choices([0, 30], k=count)
             )
-
-        return flights
+        ]
+        arrival_times = [
+            f"{departure_date}T{hour:02d}:{minute:02d}:00"
+            for hour, minute in zip(
+                random.choices(range(10, 24), k=count), random.choices([0, 30], k=count)
+            )
+        ]
+        durations = [
+            f"PT{hours}H{minutes}M"
+            for hours, minutes in zip(
+                random.choices(range(2, 9), k=count), random.choices(range(0, 60), k=count)
+            )
+        ]
+        columns = zip(
+            prices,
+            random.choices(airlines, k=count),
+            departure_times,
+            arrival_times,
+            durations,
+            random.choices([0, 1, 2], k=count),
+            random.choices(["Economy", "Premium Economy", "Business"], k=count),
+            random.choices(range(1, 10), k=count),
+        )
+        route = f"{origin} → {destination}"
+
+        return [
+            {
+                "id": f"MOCK-FL-{i}",
+                "price": price,
+                "currency": "USD",
+                "airline": airline,
+                "departure_time": departure_time,
+                "arrival_time": arrival_time,
+                "duration": duration,
+                "stops": stops,
+                "booking_class": booking_class,
+                "seats_available": seats,
+                "route": route,
+                "is_mock": True,
+            }
+            for i, (
+                price,
+                airline,
+                departure_time,
+                arrival_time,
+                duration,
+                stops,
+                booking_class,
+                seats,
+            ) in enumerate(columns, start=1)
+        ]
 
 
 class HotelAPIConnector(BaseAPIConnector):
@@ -278,8 +421,6 @@ class HotelAPIConnector(BaseAPIConnector):
         self, destination: str, check_in: str, check_out: str, adults: int, rooms: int
     ) -> List[Dict[str, Any]]:
         """Generate mock hotel data for testing/development"""
-        import random
-
         hotel_types = ["Hotel", "Resort", "Inn", "Boutique Hotel", "Apartment"]
         amenities_pool = [
             "WiFi",
@@ -292,48 +433,68 @@ class HotelAPIConnector(BaseAPIConnector):
             "Pet Friendly",
         ]
 
-        hotels = []
-        for i in range(8):
-            base_price = random.randint(80, 400)
-            rating = round(random.uniform(3.5, 5.0), 1)
-
-            # Select random amenities
-            num_amenities = random.randint(3, 6)
-            amenities = random.sample(amenities_pool, num_amenities)
-
-            hotels.append(
-                {
-                    "id": f"MOCK-HT-{i+1}",
-                    "name": f'{random.choice(["Grand", "Luxury", "Comfort", "Downtown", "Seaside"])} {random.choice(hotel_types)}',
-                    "price_per_night": base_price,
-                    "total_price": base_price
-                    * self._calculate_nights(check_in, check_out)
-                    * rooms,
-                    "currency": "USD",
-                    "rating": rating,
-                    "review_count": random.randint(50, 500),
-                    "address": f"{random.randint(100, 9999)} Main St, {destination}",
-                    "amenities": amenities,
-                    "room_type": random.choice(
-                        ["Standard Room", "Deluxe Room", "Suite", "Family Room"]
-                    ),
-                    "cancellation_policy": random.choice(
-                        ["Free cancellation", "Non-refundable", "Partially refundable"]
-                    ),
-                    "distance_from_center": f"{random.uniform(0.5, 10):.1f} km",
-                    "breakfast_included": random.choice([True, False]),
-                    "is_mock": True,
-                }
+        nights = self._calculate_nights(check_in, check_out)
+
+        # Draw each field for all hotels at once, then build the rows in a
+        # single pass over the zipped columns
+        count = 8
+        names = [
+            f"{prefix} {hotel_type}"
+            for prefix, hotel_type in zip(
+                random.choices(
+                    ["Grand", "Luxury", "Comfort", "Downtown", "Seaside"], k=count
+                ),
+                random.choices(hotel_types, k=count),
             )
+        ]
+        columns = zip(
+            names,
+            random.choices(range(80, 401), k=count),
+            random.choices(range(50, 501), k=count),
+            random.choices(range(100, 10000), k=count),
+            random.choices(range(3, 7), k=count),
+            random.choices(
+                ["Standard Room", "Deluxe Room", "Suite", "Family Room"], k=count
+            ),
+            random.choices(
+                ["Free cancellation", "Non-refundable", "Partially refundable"], k=count
+            ),
+            random.choices([True, False], k=count),
+        )
 
-        return hotels
+        return [
+            {
+                "id": f"MOCK-HT-{i}",
+                "name": name,
+                "price_per_night": base_price,
+                "total_price": base_price * nights * rooms,
+                "currency": "USD",
+                "rating": round(random.uniform(3.5, 5.0), 1),
+                "review_count": review_count,
+                "address": f"{street_number} Main St, {destination}",
+                "amenities": random.sample(amenities_pool, amenity_count),
+                "room_type": room_type,
+                "cancellation_policy": cancellation_policy,
+                "distance_from_center": f"{random.uniform(0.5, 10):.1f} km",
+                "breakfast_included": breakfast_included,
+                "is_mock": True,
+            }
+            for i, (
+                name,
+                base_price,
+                review_count,
+                street_number,
+                amenity_count,
+                room_type,
+                cancellation_policy,
+                breakfast_included,
+            ) in enumerate(columns, start=1)
+        ]
 
     def _calculate_nights(self, check_in: str, check_out: str) -> int:
         """Calculate number of nights between dates"""
         try:
-            check_in_date = datetime.strptime(check_in, "%Y-%m-%d")
-            check_out_date = datetime.strptime(check_out, "%Y-%m-%d")
-            return (check_out_date - check_in_date).days
+            return (date.fromisoformat(check_out) - date.fromisoformat(check_in)).days
         except:
             return 1
 
@@ -379,8 +540,6 @@ class ActivityAPIConnector(BaseAPIConnector):
         self, destination: str, categories: List[str]
     ) -> List[Dict[str, Any]]:
         """Generate mock activity data for testing/development"""
-        import random
-
         activity_types = {
             "museums": ["Museum Tour", "Art Gallery Visit", "Historical Site Tour"],
             "outdoor": [
@@ -400,46 +559,53 @@ class ActivityAPIConnector(BaseAPIConnector):
             "default": ["City Tour", "Sightseeing", "Local Experience"],
         }
 
-        activities = []
-        for i in range(10):
-            # Pick a category
-            if categories:
-                category = random.choice(categories)
-                activity_list = activity_types.get(category, activity_types["default"])
-            else:
-                category = random.choice(list(activity_types.keys()))
-                activity_list = activity_types[category]
+        # Draw each field for all activities at once rather than per iteration
+        count = 10
+        chosen_categories = random.choices(
+            categories or list(activity_types.keys()), k=count
+        )
+        prices = random.choices(range(20, 201), k=count)
+        durations = random.choices([2, 3, 4, 6, 8], k=count)
+        review_counts = random.choices(range(10, 301), k=count)
+        included = random.choices(
+            [
+                "Guide, Equipment",
+                "Tickets, Transportation",
+                "Meals, Guide",
+                "Equipment only",
+            ],
+            k=count,
+        )
+        cancellation_policies = random.choices(
+            ["Free cancellation up to 24h", "Non-refundable", "50% refund"], k=count
+        )
+        group_sizes = random.choices(range(6, 21), k=count)
+        language_counts = random.choices(range(1, 4), k=count)
 
+        activities = []
+        for i in range(count):
+            # Pick an activity from the category, or the defaults if unknown
+            category = chosen_categories[i]
+            activity_list = activity_types.get(category, activity_types["default"])
             activity_name = random.choice(activity_list)
-            price = random.randint(20, 200)
-            duration_hours = random.choice([2, 3, 4, 6, 8])
 
             activities.append(
                 {
                     "id": f"MOCK-ACT-{i+1}",
                     "name": f"{activity_name} in {destination}",
                     "category": category,
-                    "price": price,
+                    "price": prices[i],
                     "currency": "USD",
-                    "duration_hours": duration_hours,
+                    "duration_hours": durations[i],
                     "rating": round(random.uniform(4.0, 5.0), 1),
-                    "review_count": random.randint(10, 300),
+                    "review_count": review_counts[i],
                     "description": f"Experience an amazing {activity_name.lower()} in {destination}. Perfect for all ages!",
-                    "included": random.choice(
-                        [
-                            "Guide, Equipment",
-                            "Tickets, Transportation",
-                            "Meals, Guide",
-                            "Equipment only",
-                        ]
-                    ),
+                    "included": included[i],
                     "meeting_point": f"{destination} Central Location",
-                    "cancellation_policy": random.choice(
-                        ["Free cancellation up to 24h", "Non-refundable", "50% refund"]
-                    ),
-                    "max_group_size": random.randint(6, 20),
+                    "cancellation_policy": cancellation_policies[i],
+                    "max_group_size": group_sizes[i],
                     "languages": random.sample(
-                        ["English", "Spanish", "French", "German"], random.randint(1, 3)
+                        ["English", "Spanish", "French", "German"], language_counts[i]
                     ),
                     "is_mock": True,
                 }
@@ -487,50 +653,56 @@ class TravelAPIAggregator:
 
         results = {"flights": [], "hotels": [], "activities": [], "errors": []}
 
-        # Search flights
-        if origin and start_date:
-            try:
-                results["flights"] = self.flight_api.search_flights(
+        # The three searches are independent blocking I/O calls, so run them
+        # on threads and wait for the slowest rather than the sum of all three
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {}
+
+            # Search flights
+            if origin and start_date:
+                futures["flights"] = executor.submit(
+                    self.flight_api.search_flights,
                     origin=origin,
                     destination=destination,
                     departure_date=start_date,
                     return_date=end_date,
                     adults=adults,
                 )
-            except Exception:
-                # Don't expose sensitive exception details
-                results["errors"].append("Flight search error: Request failed")
-
-        # Search hotels
-        if start_date and end_date:
-            try:
-                results["hotels"] = self.hotel_api.search_hotels(
+
+            # Search hotels
+            if start_date and end_date:
+                futures["hotels"] = executor.submit(
+                    self.hotel_api.search_hotels,
                     destination=destination,
                     check_in=start_date,
                     check_out=end_date,
                     adults=adults,
                     rooms=rooms,
                 )
-            except Exception:
-                # Don't expose sensitive exception details
-                results["errors"].append("Hotel search error: Request failed")
 
-        # Search activities
-        if start_date and end_date:
-            try:
+            # Search activities
+            if start_date and end_date:
                 categories = None
                 if preferences and "activity_preferences" in preferences:
                     categories = preferences["activity_preferences"]
 
-                results["activities"] = self.activity_api.search_activities(
+                futures["activities"] = executor.submit(
+                    self.activity_api.search_activities,
                     destination=destination,
                     start_date=start_date,
                     end_date=end_date,
                     categories=categories,
                 )
-            except Exception:
-                # Don't expose sensitive exception details
-                results["errors"].append("Activity search error: Request failed")
+
+            labels = {"flights": "Flight", "hotels": "Hotel", "activities": "Activity"}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception:
+                    # Don't expose sensitive exception details
+                    results["errors"].append(
+                        f"{labels[key]} search error: Request failed"
+                    )
 
         return results
 
@@ -558,6 +730,24 @@ class WeatherAPIConnector(BaseAPIConnector):
         Returns:
             Dictionary with latitude, longitude, and location info, or None if not found
         """
+        # Serve repeated lookups for the same place from the cache
+        cache_timeout = getattr(
+            settings, "GEOCODE_CACHE_TIMEOUT", GEOCODE_CACHE_TIMEOUT
+        )
+        cache_key = "geocode:open-meteo:" + "-".join(location_name.lower().split())
+        if cache_timeout:
+            cached_location = cache.get(cache_key)
+            if cached_location is not None:
+                return cached_location
+
+        location = self._geocode_location(location_name)
+        # Only successful lookups are cached so a failure is retried next time
+        if cache_timeout and location is not None:
+            cache.set(cache_key, location, cache_timeout)
+        return location
+
+    def _geocode_location(self, location_name: str) -> Optional[Dict[str, Any]]:
+        """Query the Open-Meteo geocoding API for a location name"""
         try:
             # First try: direct geocoding
             params = {
@@ -567,8 +757,8 @@ class WeatherAPIConnector(BaseAPIConnector):
                 "format": "json",
             }
 
-            print(f"[WEATHER DEBUG] Geocoding location: {location_name}")
-            response = requests.get(
+            logger.debug("[WEATHER DEBUG] Geocoding location: %s", location_name)
+            response = self.session.get(
                 self.geocoding_base_url,
                 params=params,
                 headers=self.headers,
@@ -602,8 +792,10 @@ class WeatherAPIConnector(BaseAPIConnector):
                 if not city_result:
                     city_result = results[0]
 
-                print(
-                    f"[WEATHER DEBUG] Geocoded to: {city_result.get('name')}, {city_result.get('country')}"
+                logger.debug(
+                    "[WEATHER DEBUG] Geocoded to: %s, %s",
+                    city_result.get("name"),
+                    city_result.get("country"),
                 )
                 return {
                     "latitude": city_result.get("latitude"),
@@ -636,7 +828,9 @@ class WeatherAPIConnector(BaseAPIConnector):
                     if region in major_cities:
                         for city in major_cities[region]:
                             city_location = f"{city}, {country}"
-                            print(f"[WEATHER DEBUG] Trying major city: {city_location}")
+                            logger.debug(
+                                "[WEATHER DEBUG] Trying major city: %s", city_location
+                            )
 
                             city_params = {
                                 "name": city_location,
@@ -645,7 +839,7 @@ class WeatherAPIConnector(BaseAPIConnector):
                                 "format": "json",
                             }
 
-                            city_response = requests.get(
+                            city_response = self.session.get(
                                 self.geocoding_base_url,
                                 params=city_params,
                                 headers=self.headers,
@@ -659,8 +853,10 @@ class WeatherAPIConnector(BaseAPIConnector):
                                 and len(city_data["results"]) > 0
                             ):
                                 result = city_data["results"][0]
-                                print(
-                                    f"[WEATHER DEBUG] Geocoded to major city: {result.get('name')}, {result.get('country')}"
+                                logger.debug(
+                                    "[WEATHER DEBUG] Geocoded to major city: %s, %s",
+                                    result.get("name"),
+                                    result.get("country"),
                                 )
                                 return {
                                     "latitude": result.get("latitude"),
@@ -671,12 +867,15 @@ class WeatherAPIConnector(BaseAPIConnector):
                                     "timezone": result.get("timezone", "UTC"),
                                 }
 
-            print(f"[WEATHER DEBUG] No geocoding results found for: {location_name}")
+            logger.debug(
+                "[WEATHER DEBUG] No geocoding results found for: %s", location_name
+            )
             return None
         except Exception:
             # Log error without exposing sensitive data or full stack traces
-            print(
-                f"[WEATHER ERROR] Error geocoding location '{location_name}': Geocoding failed"
+            logger.warning(
+                "[WEATHER ERROR] Error geocoding location '%s': Geocoding failed",
+                location_name,
             )
             return None
 
@@ -702,8 +901,6 @@ class WeatherAPIConnector(BaseAPIConnector):
             Dictionary with current weather and forecast data, or None if error
         """
         try:
-            from datetime import datetime, timedelta
-
             # Calculate forecast days
             start = datetime.strptime(start_date, "%Y-%m-%d")
             end = datetime.strptime(end_date, "%Y-%m-%d")
@@ -731,10 +928,12 @@ class WeatherAPIConnector(BaseAPIConnector):
                 "precipitation_unit": "inch",
             }
 
-            print(
-                f"[WEATHER DEBUG] Fetching weather forecast for dates={start_date} to {end_date}"
+            logger.debug(
+                "[WEATHER DEBUG] Fetching weather forecast for dates=%s to %s",
+                start_date,
+                end_date,
             )
-            response = requests.get(
+            response = self.session.get(
                 self.weather_base_url,
                 params=params,
                 headers=self.headers,
@@ -742,13 +941,18 @@ class WeatherAPIConnector(BaseAPIConnector):
             )
             response.raise_for_status()
             data = response.json()
-            print(
-                f"[WEATHER DEBUG] Weather API response received. Has current: {bool(data.get('current'))}, Has daily: {bool(data.get('daily'))}"
+            logger.debug(
+                "[WEATHER DEBUG] Weather API response received. "
+                "Has current: %s, Has daily: %s",
+                bool(data.get("current")),
+                bool(data.get("daily")),
             )
             return data
         except Exception:
             # Log error without exposing sensitive data or full stack traces
-            print("[WEATHER ERROR] Error fetching weather forecast: Request failed")
+            logger.warning(
+                "[WEATHER ERROR] Error fetching weather forecast: Request failed"
+            )
             return None
 
     def get_historical_averages(
@@ -774,8 +978,6 @@ class WeatherAPIConnector(BaseAPIConnector):
             Dictionary with historical average weather data, or None if error
         """
         try:
-            from datetime import datetime
-
             # Parse dates to extract month and day
             start = datetime.strptime(start_date, "%Y-%m-%d")
             end = datetime.strptime(end_date, "%Y-%m-%d")
@@ -811,7 +1013,7 @@ class WeatherAPIConnector(BaseAPIConnector):
                 "models": "best_match",  # Uses best available model which includes historical context
             }
 
-            response = requests.get(
+            response = self.session.get(
                 self.weather_base_url,
                 params=params,
                 headers=self.headers,
@@ -821,7 +1023,7 @@ class WeatherAPIConnector(BaseAPIConnector):
             return response.json()
         except Exception:
             # Log error without exposing sensitive details
-            print("Failed to fetch historical weather averages")
+            logger.warning("Failed to fetch historical weather averages")
             return None
 
     def get_weather_for_trip(
@@ -847,7 +1049,9 @@ class WeatherAPIConnector(BaseAPIConnector):
         # First, geocode the destination
         location_data = self.geocode_location(destination)
         if not location_data:
-            print(f"[WEATHER DEBUG] Failed to geocode destination: {destination}")
+            logger.debug(
+                "[WEATHER DEBUG] Failed to geocode destination: %s", destination
+            )
             return None
 
         # Get weather forecast (uses numerical weather prediction models)
@@ -860,7 +1064,9 @@ class WeatherAPIConnector(BaseAPIConnector):
         )
 
         if not weather_data:
-            print(f"[WEATHER DEBUG] Failed to get weather forecast for {destination}")
+            logger.debug(
+                "[WEATHER DEBUG] Failed to get weather forecast for %s", destination
+            )
             return None
 
         # Optionally get historical averages for comparison
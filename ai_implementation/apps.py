@@ -6,6 +6,9 @@ class AiImplementationConfig(AppConfig):
     name = 'ai_implementation'
     verbose_name = 'AI Implementation'
 
+    def ready(self):
+        import ai_implementation.signals  # noqa
+
 
 
 
@@ -0,0 +1,48 @@
+"""
+Custom model fields for AI Implementation
+"""
+
+import zlib
+
+from django.db import models
+
+
+class CompressedTextField(models.BinaryField):
+    """
+    Text stored zlib-compressed in a binary column.
+
+    Used for large write-mostly payloads such as raw OpenAI responses, which are
+    mostly repetitive JSON. Python code reads and writes plain str values.
+    """
+
+    def __init__(self, *args, compression_level=6, **kwargs):
+        self.compression_level = compression_level
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.compression_level != 6:
+            kwargs["compression_level"] = self.compression_level
+        return name, path, args, kwargs
+
+    def get_prep_value(self, value):
+        if value is None:
+            return None
+        return zlib.compress(str(value).encode("utf-8"), self.compression_level)
+
+    def from_db_value(self, value, expression, connection):
+        return self.to_python(value)
+
+    def to_python(self, value):
+        if value is None or isinstance(value, str):
+            # Rows written before compression still hold plain text
+            return value
+        value = bytes(value)
+        try:
+            value = zlib.decompress(value)
+        except zlib.error:
+            pass
+        return value.decode("utf-8")
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
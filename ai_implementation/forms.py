@@ -10,36 +10,106 @@ from datetime import datetime, timedelta
 from .models import TravelSearch, AIGeneratedItinerary
 
 
+# Widget attrs shared by reference; Django copies attrs when building a widget
+_FORM_CONTROL_ATTRS = {'class': 'form-control'}
+_CHECK_INPUT_ATTRS = {'class': 'form-check-input'}
+_DATE_ATTRS = {**_FORM_CONTROL_ATTRS, 'type': 'date'}
+
+# Longest trip a search may cover
+MAX_TRIP_LENGTH = timedelta(days=30)
+
+
+def validate_not_in_past(value):
+    """Reject dates before today (timezone-aware)"""
+    if value < timezone.now().date():
+        raise ValidationError('Start date cannot be in the past.')
+
+
+def validate_trip_dates(start_date, end_date, max_length=None):
+    """
+    Validate the cross-field date rules shared by the search forms.
+    Past start dates are handled separately by validate_not_in_past.
+    """
+    if end_date <= start_date:
+        raise ValidationError('End date must be after start date.')
+    
+    # Limit to reasonable trip duration (e.g., 30 days)
+    if max_length is not None and end_date - start_date > max_length:
+        raise ValidationError(
+            f'Trip duration cannot exceed {max_length.days} days.'
+        )
+
+
+# Choice lists shared by the forms below, defined once at import time
+TRAVEL_METHOD_CHOICES = (
+    ('flight', 'Flight'),
+    ('car', 'Car'),
+    ('train', 'Train'),
+    ('bus', 'Bus'),
+)
+
+ACTIVITY_CHOICES = (
+    ('museums', 'Museums & Culture'),
+    ('outdoor', 'Outdoor Activities'),
+    ('food', 'Food & Dining'),
+    ('adventure', 'Adventure Sports'),
+    ('shopping', 'Shopping'),
+    ('nightlife', 'Nightlife'),
+    ('relaxation', 'Relaxation & Spa'),
+)
+
+ACCOMMODATION_CHOICES = (
+    ('', 'Any'),
+    ('hotel', 'Hotel'),
+    ('resort', 'Resort'),
+    ('apartment', 'Apartment/Airbnb'),
+    ('hostel', 'Hostel'),
+    ('boutique', 'Boutique Hotel'),
+)
+
+FEEDBACK_CHOICES = (
+    ('yes', 'Yes, very helpful'),
+    ('somewhat', 'Somewhat helpful'),
+    ('no', 'Not helpful'),
+)
+
+SORT_BY_CHOICES = (
+    ('ai_score', 'AI Recommendation'),
+    ('price_low', 'Price: Low to High'),
+    ('price_high', 'Price: High to Low'),
+    ('rating', 'Rating'),
+)
+
+FILTER_TYPE_CHOICES = (
+    ('free_cancellation', 'Free Cancellation'),
+    ('breakfast_included', 'Breakfast Included'),
+    ('high_rating', 'Highly Rated (4+)'),
+)
+
+
 class TravelSearchForm(forms.ModelForm):
     """Form for creating a new travel search"""
     
     # Additional fields not in the model
     travel_method = forms.ChoiceField(
-        choices=[
-            ('flight', 'Flight'),
-            ('car', 'Car'),
-            ('train', 'Train'),
-            ('bus', 'Bus'),
-        ],
-        widget=forms.Select(attrs={'class': 'form-control'}),
+        choices=TRAVEL_METHOD_CHOICES,
+        widget=forms.Select(attrs=_FORM_CONTROL_ATTRS),
         required=False,
         initial='flight'
     )
     
     activity_preferences = forms.MultipleChoiceField(
-        choices=[
-            ('museums', 'Museums & Culture'),
-            ('outdoor', 'Outdoor Activities'),
-            ('food', 'Food & Dining'),
-            ('adventure', 'Adventure Sports'),
-            ('shopping', 'Shopping'),
-            ('nightlife', 'Nightlife'),
-            ('relaxation', 'Relaxation & Spa'),
-        ],
-        widget=forms.CheckboxSelectMultiple(attrs={'class': 'form-check-input'}),
+        choices=ACTIVITY_CHOICES,
+        widget=forms.CheckboxSelectMultiple(attrs=_CHECK_INPUT_ATTRS),
         required=False
     )
     
+    # Declared explicitly so the past-date check runs as a field validator
+    start_date = forms.DateField(
+        widget=forms.DateInput(attrs=_DATE_ATTRS),
+        validators=[validate_not_in_past]
+    )
+    
     class Meta:
         model = TravelSearch
         fields = [
@@ -56,14 +126,7 @@ class TravelSearchForm(forms.ModelForm):
                 'class': 'form-control',
                 'placeholder': 'e.g., Los Angeles, LAX'
             }),
-            'start_date': forms.DateInput(attrs={
-                'class': 'form-control',
-                'type': 'date'
-            }),
-            'end_date': forms.DateInput(attrs={
-                'class': 'form-control',
-                'type': 'date'
-            }),
+            'end_date': forms.DateInput(attrs=_DATE_ATTRS),
             'adults': forms.NumberInput(attrs={
                 'class': 'form-control',
                 'min': '1',
@@ -85,15 +148,8 @@ class TravelSearchForm(forms.ModelForm):
                 'step': '50'
             }),
             'accommodation_type': forms.Select(
-                choices=[
-                    ('', 'Any'),
-                    ('hotel', 'Hotel'),
-                    ('resort', 'Resort'),
-                    ('apartment', 'Apartment/Airbnb'),
-                    ('hostel', 'Hostel'),
-                    ('boutique', 'Boutique Hotel'),
-                ],
-                attrs={'class': 'form-control'}
+                choices=ACCOMMODATION_CHOICES,
+                attrs=_FORM_CONTROL_ATTRS
             ),
             'activity_categories': forms.HiddenInput(),
         }
@@ -112,30 +168,19 @@ class TravelSearchForm(forms.ModelForm):
         budget_min = cleaned_data.get('budget_min')
         budget_max = cleaned_data.get('budget_max')
         
-        # Validate dates
+        # Validate dates; past start dates are rejected by the field validator
         if start_date and end_date:
-            if end_date <= start_date:
-                raise ValidationError('End date must be after start date.')
-            
-            # Use timezone-aware date comparison
-            today = timezone.now().date()
-            if start_date < today:
-                raise ValidationError('Start date cannot be in the past.')
-            
-            # Limit to reasonable trip duration (e.g., 30 days)
-            if (end_date - start_date).days > 30:
-                raise ValidationError('Trip duration cannot exceed 30 days.')
+            validate_trip_dates(start_date, end_date, MAX_TRIP_LENGTH)
         
         # Validate budget
         if budget_min and budget_max:
             if budget_max < budget_min:
                 raise ValidationError('Maximum budget must be greater than minimum budget.')
         
-        # Process activity preferences
-        if 'activity_preferences' in self.data:
-            activity_prefs = self.data.getlist('activity_preferences')
-            if activity_prefs:
-                cleaned_data['activity_categories'] = ','.join(activity_prefs)
+        # Process activity preferences (already validated by the declared field)
+        activity_prefs = cleaned_data.get('activity_preferences')
+        if activity_prefs:
+            cleaned_data['activity_categories'] = ','.join(activity_prefs)
         
         return cleaned_data
 
@@ -152,17 +197,12 @@ class QuickSearchForm(forms.Form):
     )
     
     start_date = forms.DateField(
-        widget=forms.DateInput(attrs={
-            'class': 'form-control',
-            'type': 'date'
-        })
+        widget=forms.DateInput(attrs=_DATE_ATTRS),
+        validators=[validate_not_in_past]
     )
     
     end_date = forms.DateField(
-        widget=forms.DateInput(attrs={
-            'class': 'form-control',
-            'type': 'date'
-        })
+        widget=forms.DateInput(attrs=_DATE_ATTRS)
     )
     
     adults = forms.IntegerField(
@@ -181,13 +221,7 @@ class QuickSearchForm(forms.Form):
         end_date = cleaned_data.get('end_date')
         
         if start_date and end_date:
-            if end_date <= start_date:
-                raise ValidationError('End date must be after start date.')
-            
-            # Use timezone-aware date comparison
-            today = timezone.now().date()
-            if start_date < today:
-                raise ValidationError('Start date cannot be in the past.')
+            validate_trip_dates(start_date, end_date)
         
         return cleaned_data
 
@@ -198,28 +232,28 @@ class GroupConsensusForm(forms.Form):
     include_budget = forms.BooleanField(
         required=False,
         initial=True,
-        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+        widget=forms.CheckboxInput(attrs=_CHECK_INPUT_ATTRS),
         label='Include budget analysis'
     )
     
     include_activities = forms.BooleanField(
         required=False,
         initial=True,
-        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+        widget=forms.CheckboxInput(attrs=_CHECK_INPUT_ATTRS),
         label='Include activity recommendations'
     )
     
     include_accommodation = forms.BooleanField(
         required=False,
         initial=True,
-        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+        widget=forms.CheckboxInput(attrs=_CHECK_INPUT_ATTRS),
         label='Include accommodation preferences'
     )
     
     prioritize_cost = forms.BooleanField(
         required=False,
         initial=False,
-        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+        widget=forms.CheckboxInput(attrs=_CHECK_INPUT_ATTRS),
         label='Prioritize lowest cost options'
     )
 
@@ -228,12 +262,8 @@ class ItineraryFeedbackForm(forms.Form):
     """Form for collecting user feedback on AI-generated results"""
     
     was_helpful = forms.ChoiceField(
-        choices=[
-            ('yes', 'Yes, very helpful'),
-            ('somewhat', 'Somewhat helpful'),
-            ('no', 'Not helpful'),
-        ],
-        widget=forms.RadioSelect(attrs={'class': 'form-check-input'}),
+        choices=FEEDBACK_CHOICES,
+        widget=forms.RadioSelect(attrs=_CHECK_INPUT_ATTRS),
         label='Were these results helpful?'
     )
     
@@ -289,25 +319,16 @@ class RefineSearchForm(forms.Form):
     )
     
     sort_by = forms.ChoiceField(
-        choices=[
-            ('ai_score', 'AI Recommendation'),
-            ('price_low', 'Price: Low to High'),
-            ('price_high', 'Price: High to Low'),
-            ('rating', 'Rating'),
-        ],
-        widget=forms.Select(attrs={'class': 'form-control'}),
+        choices=SORT_BY_CHOICES,
+        widget=forms.Select(attrs=_FORM_CONTROL_ATTRS),
         initial='ai_score',
         label='Sort By'
     )
     
     filter_type = forms.MultipleChoiceField(
-        choices=[
-            ('free_cancellation', 'Free Cancellation'),
-            ('breakfast_included', 'Breakfast Included'),
-            ('high_rating', 'Highly Rated (4+)'),
-        ],
+        choices=FILTER_TYPE_CHOICES,
         required=False,
-        widget=forms.CheckboxSelectMultiple(attrs={'class': 'form-check-input'}),
+        widget=forms.CheckboxSelectMultiple(attrs=_CHECK_INPUT_ATTRS),
         label='Filters'
     )
 
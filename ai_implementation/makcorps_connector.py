@@ -5,11 +5,193 @@ API Documentation: https://api.makcorps.com/free
 """
 
 import os
+import random
 import requests
 import json
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import List, Dict, Any, Iterator, Optional
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import quote
+from datetime import date
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.conf import settings
+from django.core.cache import cache
+
+# Try to import msgspec's C JSON decoder, fall back to response.json()
+try:
+    import msgspec
+
+    USE_MSGSPEC = True
+except ImportError:
+    # msgspec not installed, let requests decode with the stdlib parser
+    msgspec = None
+    USE_MSGSPEC = False
+
+# Default for settings.MAKCORPS_HOTEL_CACHE_TIMEOUT (seconds)
+HOTEL_CACHE_TIMEOUT = 3600
+
+
+def _create_session() -> requests.Session:
+    """
+    Create a pooled HTTP session for api.makcorps.com that keeps TLS
+    connections alive between searches and retries transient gateway errors.
+    """
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods={"GET"},
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry),
+    )
+    return session
+
+
+# Every search goes to the same host, so connectors share one connection pool
+_SESSION = _create_session()
+
+# Candidate keys for each field, in priority order. Makcorps responses are
+# not consistent about field names, so each field is tried under several.
+_HOTEL_LIST_KEYS = ("hotels", "results", "data", "items")
+_ID_KEYS = ("id", "hotel_id", "_id")
+_NAME_KEYS = ("name", "hotel_name", "title")
+_PRICE_KEYS = ("price_per_night", "price", "rate", "nightly_rate")
+_RATING_KEYS = ("rating", "star_rating", "stars")
+_ADDRESS_KEYS = ("address", "location", "address_line")
+_ROOM_TYPE_KEYS = ("room_type", "room")
+_REVIEW_COUNT_KEYS = ("review_count", "reviews", "num_reviews")
+_DISTANCE_KEYS = ("distance", "distance_from_center")
+_BREAKFAST_KEYS = ("breakfast_included", "breakfast")
+_IMAGE_KEYS = ("image_url", "image", "photo", "thumbnail", "imageUrl")
+_IMAGE_URL_KEYS = ("url", "src", "link", "thumbnail")
+_URL_PREFIXES = ("http://", "https://")
+
+# Static pools for _get_mock_hotel_data, built once instead of per call
+_MOCK_HOTEL_CHAINS = (
+    "Hilton",
+    "Marriott",
+    "Hyatt",
+    "InterContinental",
+    "Radisson",
+    "Best Western",
+    "Holiday Inn",
+    "Sheraton",
+    "Courtyard",
+)
+_MOCK_HOTEL_TYPES = ("Hotel", "Resort", "Inn", "Suites", "Grand Hotel")
+_MOCK_AMENITIES = (
+    "WiFi",
+    "Pool",
+    "Gym",
+    "Spa",
+    "Restaurant",
+    "Bar",
+    "Room Service",
+    "Parking",
+    "Business Center",
+    "Pet Friendly",
+)
+_MOCK_STREETS = ("Main", "Central", "Park", "Ocean")
+# Star ratings from 3.5 to 5.0 in 0.1 steps
+_MOCK_RATINGS = tuple(tenths / 10 for tenths in range(35, 51))
+_MOCK_ROOM_TYPES = (
+    "Standard Room",
+    "Deluxe Room",
+    "Suite",
+    "Family Room",
+    "Executive Suite",
+)
+_MOCK_CANCELLATION_POLICIES = (
+    "Free cancellation up to 24h before",
+    "Non-refundable",
+    "Partially refundable",
+)
+# Placeholder Unsplash hotel images, cycled by result index for variety
+_MOCK_HOTEL_IMAGE_IDS = (
+    "rDEOVtE7vOs",  # Modern hotel exterior
+    "BfrQnKBulYQ",  # Luxury hotel lobby
+    "kKvQJ6rK6S4",  # Hotel room
+    "YrtFlrLo2DQ",  # Resort pool
+    "Z8Y7jJqJ6J4",  # Hotel exterior
+    "nXOB-wh4Oyc",  # Hotel suite
+    "rDEOVtE7vOs",  # Modern hotel
+    "BfrQnKBulYQ",  # Luxury hotel
+)
+
+
+def _safe_float(value: Any, default: Optional[float] = 0.0) -> Optional[float]:
+    """Convert value to float, returning default when it is missing or invalid"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _safe_int(value: Any, default: int = 0) -> int:
+    """Convert value to int, returning default when it is missing or invalid"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _first_present(data: Dict[str, Any], keys: tuple) -> Any:
+    """Return the value of the first key present in data, or None"""
+    for key in keys:
+        if key in data:
+            return data[key]
+    return None
+
+
+def _first_truthy(data: Dict[str, Any], keys: tuple, default: Any = None) -> Any:
+    """Return the first truthy value among keys, like chained ``or`` lookups"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return default
+
+
+@lru_cache(maxsize=None)
+def _get_api_key() -> Optional[str]:
+    """
+    Read the Makcorps API key on first use. It is fixed for the life of the
+    process, so later connectors skip the environment and settings lookups.
+    """
+    return os.environ.get("HOTEL_API_KEY", getattr(settings, "HOTEL_API_KEY", None))
+
+
+@lru_cache(maxsize=1024)
+def _extract_city_name(location: str) -> str:
+    """
+    Extract city name from location string.
+    Handles formats like "Alberta, Canada" -> "Alberta" or "Sicily, Italy" -> "Sicily"
+    """
+    # Remove country if present (after comma)
+    if "," in location:
+        city_name = location.split(",")[0].strip()
+    else:
+        city_name = location.strip()
+
+    # Percent-encode the name so spaces, "&", "#", "/" and non-ASCII
+    # characters can't break the path segment it is placed in
+    return quote(city_name, safe="")
+
+
+@lru_cache(maxsize=1024)
+def _calculate_nights(check_in: str, check_out: str) -> int:
+    """Calculate number of nights between dates"""
+    try:
+        return max(
+            0, (date.fromisoformat(check_out) - date.fromisoformat(check_in)).days
+        )
+    except (TypeError, ValueError):
+        return 0
 
 
 class MakcorpsHotelConnector:
@@ -20,11 +202,12 @@ class MakcorpsHotelConnector:
 
     def __init__(self):
         """Initialize Makcorps API client"""
-        self.api_key = os.environ.get(
-            "HOTEL_API_KEY", getattr(settings, "HOTEL_API_KEY", None)
-        )
+        self.api_key = _get_api_key()
         self.base_url = "https://api.makcorps.com"
-        self.timeout = 30
+        # (connect, read): fail fast on an unreachable host and cap slow
+        # responses so one search can't hold a worker for half a minute
+        self.timeout = (3.05, 10)
+        self.session = _SESSION
 
         if not self.api_key:
             print("WARNING: Makcorps Hotel API key not configured. Using mock data.")
@@ -71,26 +254,53 @@ class MakcorpsHotelConnector:
 
         try:
             # Clean location name (remove country if present, use city name)
-            city_name = self._extract_city_name(location)
+            city_name = _extract_city_name(location)
 
-            # Build endpoint URL
+            # Build endpoint URL in a single f-string (compiled to one BUILD_STRING)
             # Format: /citysearch/{city_name}/{page}/{currency}/{num_of_rooms}/{num_of_adults}/{check_in_date}/{check_out_date}
-            endpoint = f"/citysearch/{city_name}/{page}/{currency}/{rooms}/{adults}/{check_in}/{check_out}"
-            url = f"{self.base_url}{endpoint}"
+            url = f"{self.base_url}/citysearch/{city_name}/{page}/{currency}/{rooms}/{adults}/{check_in}/{check_out}"
 
             print(
                 f"Searching Makcorps hotels: {city_name} from {check_in} to {check_out}"
             )
 
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            # Identical searches reuse the parsed hotels, skipping both the
+            # Makcorps round trip and the parse
+            cache_timeout = getattr(
+                settings, "MAKCORPS_HOTEL_CACHE_TIMEOUT", HOTEL_CACHE_TIMEOUT
+            )
+            cache_key = self._get_cache_key(
+                location,
+                check_in,
+                check_out,
+                adults,
+                rooms,
+                currency,
+                page,
+                max_results,
+            )
+            if cache_timeout:
+                cached_hotels = cache.get(cache_key)
+                if cached_hotels is not None:
+                    return cached_hotels
+
+            response = self.session.get(
+                url, headers=self.headers, timeout=self.timeout
+            )
 
             if response.status_code == 200:
-                data = response.json()
+                if USE_MSGSPEC:
+                    data = msgspec.json.decode(response.content)
+                else:
+                    data = response.json()
                 hotels = self._parse_makcorps_response(
-                    data, location, check_in, check_out, rooms
+                    data, location, check_in, check_out, rooms, max_results
                 )
                 print(f"Successfully retrieved {len(hotels)} hotels from Makcorps")
-                return hotels[:max_results]
+                # Empty results may come from a parse failure, so don't keep them
+                if cache_timeout and hotels:
+                    cache.set(cache_key, hotels, cache_timeout)
+                return hotels
             else:
                 print(f"Makcorps API returned status code {response.status_code}")
                 if response.status_code == 401:
@@ -115,19 +325,36 @@ class MakcorpsHotelConnector:
                 location, check_in, check_out, adults, rooms
             )
 
-    def _extract_city_name(self, location: str) -> str:
-        """
-        Extract city name from location string.
-        Handles formats like "Alberta, Canada" -> "Alberta" or "Sicily, Italy" -> "Sicily"
-        """
-        # Remove country if present (after comma)
-        if "," in location:
-            city_name = location.split(",")[0].strip()
-        else:
-            city_name = location.strip()
+    @staticmethod
+    def _get_cache_key(
+        location: str,
+        check_in: str,
+        check_out: str,
+        adults: int,
+        rooms: int,
+        currency: str,
+        page: int,
+        max_results: int,
+    ) -> str:
+        """Build a cache key that treats case and whitespace variants as equal"""
+        search = "|".join(
+            "-".join(str(part).lower().split())
+            for part in (
+                location,
+                check_in,
+                check_out,
+                adults,
+                rooms,
+                currency,
+                page,
+                max_results,
+            )
+        )
+        return f"hotels:makcorps:{search}"
 
-        # URL encode spaces as needed (API might handle this, but be safe)
-        return city_name.replace(" ", "%20")
+    # Pure helpers, cached at module level and exposed for existing callers
+    _extract_city_name = staticmethod(_extract_city_name)
+    _calculate_nights = staticmethod(_calculate_nights)
 
     def _parse_makcorps_response(
         self,
@@ -136,6 +363,7 @@ class MakcorpsHotelConnector:
         check_in: str,
         check_out: str,
         rooms: int,
+        max_results: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Parse Makcorps API response into standardized format.
@@ -146,167 +374,19 @@ class MakcorpsHotelConnector:
             check_in: Check-in date
             check_out: Check-out date
             rooms: Number of rooms
+            max_results: Stop after this many hotels (default: parse all)
 
         Returns:
             List of hotel dictionaries in our standard format
         """
-        hotels = []
-        nights = self._calculate_nights(check_in, check_out)
-
         try:
-            # Makcorps API response structure may vary
-            # Common structures: data.hotels, data.results, data.data, or direct array
-            hotel_list = []
-
-            if isinstance(data, list):
-                hotel_list = data
-            elif isinstance(data, dict):
-                if "hotels" in data:
-                    hotel_list = data["hotels"]
-                elif "results" in data:
-                    hotel_list = data["results"]
-                elif "data" in data:
-                    hotel_list = data["data"]
-                elif "items" in data:
-                    hotel_list = data["items"]
-
-            for hotel_data in hotel_list:
-                try:
-                    # Extract hotel information (field names may vary)
-                    hotel_id = (
-                        hotel_data.get("id")
-                        or hotel_data.get("hotel_id")
-                        or hotel_data.get("_id", f"MAKCORPS-{len(hotels) + 1}")
-                    )
-                    name = (
-                        hotel_data.get("name")
-                        or hotel_data.get("hotel_name")
-                        or hotel_data.get("title", "Unknown Hotel")
-                    )
-
-                    # Extract pricing
-                    price_per_night = 0
-                    if "price_per_night" in hotel_data:
-                        price_per_night = float(hotel_data["price_per_night"])
-                    elif "price" in hotel_data:
-                        price_per_night = float(hotel_data["price"])
-                    elif "rate" in hotel_data:
-                        price_per_night = float(hotel_data["rate"])
-                    elif "nightly_rate" in hotel_data:
-                        price_per_night = float(hotel_data["nightly_rate"])
-
-                    # If price is total, divide by nights
-                    if "total_price" in hotel_data and price_per_night == 0:
-                        total = float(hotel_data["total_price"])
-                        price_per_night = total / nights if nights > 0 else total
-
-                    total_price = (
-                        price_per_night * nights * rooms if price_per_night > 0 else 0
-                    )
-
-                    # Extract rating
-                    rating = None
-                    if "rating" in hotel_data:
-                        rating = float(hotel_data["rating"])
-                    elif "star_rating" in hotel_data:
-                        rating = float(hotel_data["star_rating"])
-                    elif "stars" in hotel_data:
-                        rating = float(hotel_data["stars"])
-
-                    # Extract address
-                    address = (
-                        hotel_data.get("address")
-                        or hotel_data.get("location")
-                        or hotel_data.get("address_line", "")
-                    )
-
-                    # Extract amenities
-                    amenities = []
-                    if "amenities" in hotel_data:
-                        if isinstance(hotel_data["amenities"], list):
-                            amenities = hotel_data["amenities"]
-                        elif isinstance(hotel_data["amenities"], str):
-                            amenities = hotel_data["amenities"].split(",")
-                    elif "facilities" in hotel_data:
-                        if isinstance(hotel_data["facilities"], list):
-                            amenities = hotel_data["facilities"]
-
-                    # Extract room type
-                    room_type = (
-                        hotel_data.get("room_type")
-                        or hotel_data.get("room")
-                        or "Standard Room"
-                    )
-
-                    # Extract review count
-                    review_count = (
-                        hotel_data.get("review_count")
-                        or hotel_data.get("reviews")
-                        or hotel_data.get("num_reviews", 0)
-                    )
-
-                    # Extract image URL (if available from Makcorps)
-                    image_url = None
-                    
-                    # Try multiple possible image fields
-                    for field in ["image_url", "image", "photo", "thumbnail", "imageUrl", "image_url"]:
-                        if field in hotel_data:
-                            img_val = hotel_data.get(field)
-                            if isinstance(img_val, str) and img_val.startswith(("http://", "https://")):
-                                image_url = img_val
-                                break
-                            elif isinstance(img_val, dict):
-                                # Try nested URL fields
-                                for url_field in ["url", "src", "link", "thumbnail"]:
-                                    if url_field in img_val:
-                                        url_val = img_val.get(url_field)
-                                        if isinstance(url_val, str) and url_val.startswith(("http://", "https://")):
-                                            image_url = url_val
-                                            break
-                                if image_url:
-                                    break
-                    
-                    # Debug logging if enabled
-                    import os
-                    if os.environ.get('DEBUG', '').lower() == 'true' and not image_url:
-                        print(f"[DEBUG] Hotel '{name}' - Available keys: {list(hotel_data.keys())}")
-                        print(f"[DEBUG] Hotel '{name}' - No image URL found")
-
-                    # Create standardized hotel dictionary
-                    hotel = {
-                        "id": str(hotel_id),
-                        "name": name,
-                        "price_per_night": price_per_night,
-                        "total_price": total_price,
-                        "currency": hotel_data.get("currency", "USD"),
-                        "rating": rating,
-                        "review_count": int(review_count) if review_count else 0,
-                        "address": address,
-                        "amenities": amenities if isinstance(amenities, list) else [],
-                        "room_type": room_type,
-                        "cancellation_policy": hotel_data.get(
-                            "cancellation_policy", ""
-                        ),
-                        "distance_from_center": hotel_data.get("distance", "")
-                        or hotel_data.get("distance_from_center", ""),
-                        "breakfast_included": hotel_data.get(
-                            "breakfast_included", False
-                        )
-                        or hotel_data.get("breakfast", False),
-                        "check_in": check_in,
-                        "check_out": check_out,
-                        "nights": nights,
-                        "image_url": image_url,
-                        "is_mock": False,
-                    }
-
-                    hotels.append(hotel)
-
-                except Exception as e:
-                    print(f"  [WARNING] Error parsing hotel: {str(e)}")
-                    continue
-
-            return hotels
+            # Hotels are parsed lazily, so records past max_results are skipped
+            return list(
+                islice(
+                    self._iter_parsed_hotels(data, check_in, check_out, rooms),
+                    max_results,
+                )
+            )
 
         except Exception as e:
             print(f"Error parsing Makcorps response: {str(e)}")
@@ -315,104 +395,196 @@ class MakcorpsHotelConnector:
             )
             return []
 
-    def _calculate_nights(self, check_in: str, check_out: str) -> int:
-        """Calculate number of nights between dates"""
-        try:
-            check_in_date = datetime.strptime(check_in, "%Y-%m-%d")
-            check_out_date = datetime.strptime(check_out, "%Y-%m-%d")
-            return max(0, (check_out_date - check_in_date).days)
-        except:
-            return 0
+    def _iter_parsed_hotels(
+        self,
+        data: Dict[str, Any],
+        check_in: str,
+        check_out: str,
+        rooms: int,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield hotels from a Makcorps response in our standard format"""
+        nights = _calculate_nights(check_in, check_out)
+
+        # Makcorps API response structure may vary
+        # Common structures: data.hotels, data.results, data.data, or direct array
+        hotel_list = []
+
+        if isinstance(data, list):
+            hotel_list = data
+        elif isinstance(data, dict):
+            hotel_list = _first_present(data, _HOTEL_LIST_KEYS) or []
+
+        # Read the environment once per response rather than once per hotel
+        debug_images = os.environ.get("DEBUG", "").lower() == "true"
+
+        count = 0
+        for hotel_data in hotel_list:
+            # Skip malformed entries instead of failing the whole response
+            if not isinstance(hotel_data, dict):
+                continue
+
+            try:
+                hotel = self._parse_hotel(
+                    hotel_data,
+                    f"MAKCORPS-{count + 1}",
+                    check_in,
+                    check_out,
+                    nights,
+                    rooms,
+                    debug_images,
+                )
+            except Exception as e:
+                # An unexpected record shape costs only that record, not the
+                # hotels already parsed
+                print(f"  [WARNING] Error parsing hotel: {str(e)}")
+                continue
+
+            if hotel is not None:
+                count += 1
+                yield hotel
+
+    def _parse_hotel(
+        self,
+        hotel_data: Dict[str, Any],
+        fallback_id: str,
+        check_in: str,
+        check_out: str,
+        nights: int,
+        rooms: int,
+        debug_images: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """Convert one Makcorps record, or return None if its price can't be read"""
+        # Extract hotel information (field names may vary)
+        hotel_id = _first_truthy(hotel_data, _ID_KEYS, fallback_id)
+        name = _first_truthy(hotel_data, _NAME_KEYS, "Unknown Hotel")
+
+        # Extract pricing; a missing price counts as 0, but a price that can't
+        # be read would make the hotel look free, so the record is skipped
+        price = _first_present(hotel_data, _PRICE_KEYS)
+        price_per_night = 0.0 if price is None else _safe_float(price, None)
+        if price_per_night is None:
+            return None
+
+        # If price is total, divide by nights
+        if "total_price" in hotel_data and price_per_night == 0:
+            total = _safe_float(hotel_data["total_price"], None)
+            if total is None:
+                return None
+            price_per_night = total / nights if nights > 0 else total
+
+        total_price = price_per_night * nights * rooms if price_per_night > 0 else 0
+
+        # Extract rating
+        rating = _safe_float(_first_present(hotel_data, _RATING_KEYS), None)
+
+        address = _first_truthy(hotel_data, _ADDRESS_KEYS, "")
+
+        # Extract amenities
+        amenities = []
+        if "amenities" in hotel_data:
+            if isinstance(hotel_data["amenities"], list):
+                amenities = hotel_data["amenities"]
+            elif isinstance(hotel_data["amenities"], str):
+                amenities = hotel_data["amenities"].split(",")
+        elif "facilities" in hotel_data:
+            if isinstance(hotel_data["facilities"], list):
+                amenities = hotel_data["facilities"]
+
+        room_type = _first_truthy(hotel_data, _ROOM_TYPE_KEYS, "Standard Room")
+        review_count = _first_truthy(hotel_data, _REVIEW_COUNT_KEYS, 0)
+
+        # Extract image URL (if available from Makcorps), either
+        # directly or from a nested object such as {"url": ...}
+        image_url = None
+        for field in _IMAGE_KEYS:
+            img_val = hotel_data.get(field)
+            if isinstance(img_val, str) and img_val.startswith(_URL_PREFIXES):
+                image_url = img_val
+                break
+            elif isinstance(img_val, dict):
+                for url_field in _IMAGE_URL_KEYS:
+                    url_val = img_val.get(url_field)
+                    if isinstance(url_val, str) and url_val.startswith(_URL_PREFIXES):
+                        image_url = url_val
+                        break
+                if image_url:
+                    break
+
+        # Debug logging if enabled
+        if debug_images and not image_url:
+            print(
+                f"[DEBUG] Hotel '{name}' - Available keys: {list(hotel_data.keys())}"
+            )
+            print(f"[DEBUG] Hotel '{name}' - No image URL found")
+
+        # Create standardized hotel dictionary
+        return {
+            "id": str(hotel_id),
+            "name": name,
+            "price_per_night": price_per_night,
+            "total_price": total_price,
+            "currency": hotel_data.get("currency", "USD"),
+            "rating": rating,
+            "review_count": _safe_int(review_count),
+            "address": address,
+            "amenities": amenities if isinstance(amenities, list) else [],
+            "room_type": room_type,
+            "cancellation_policy": hotel_data.get("cancellation_policy", ""),
+            "distance_from_center": _first_truthy(hotel_data, _DISTANCE_KEYS, ""),
+            "breakfast_included": _first_truthy(hotel_data, _BREAKFAST_KEYS, False),
+            "check_in": check_in,
+            "check_out": check_out,
+            "nights": nights,
+            "image_url": image_url,
+            "is_mock": False,
+        }
 
     def _get_mock_hotel_data(
         self, location: str, check_in: str, check_out: str, adults: int, rooms: int
     ) -> List[Dict[str, Any]]:
         """Generate mock hotel data when Makcorps API is unavailable"""
-        import random
-
-        hotel_chains = [
-            "Hilton",
-            "Marriott",
-            "Hyatt",
-            "InterContinental",
-            "Radisson",
-            "Best Western",
-            "Holiday Inn",
-            "Sheraton",
-            "Courtyard",
-        ]
-
-        hotel_types = ["Hotel", "Resort", "Inn", "Suites", "Grand Hotel"]
-        amenities_pool = [
-            "WiFi",
-            "Pool",
-            "Gym",
-            "Spa",
-            "Restaurant",
-            "Bar",
-            "Room Service",
-            "Parking",
-            "Business Center",
-            "Pet Friendly",
-        ]
-
+        nights = _calculate_nights(check_in, check_out)
+
+        # Draw each field for all hotels at once rather than per iteration
+        count = 8
+        choices = random.choices
+        base_prices = choices(range(80, 401), k=count)
+        ratings = choices(_MOCK_RATINGS, k=count)
+        chains = choices(_MOCK_HOTEL_CHAINS, k=count)
+        hotel_types = choices(_MOCK_HOTEL_TYPES, k=count)
+        amenity_counts = choices(range(4, 8), k=count)
+        review_counts = choices(range(50, 501), k=count)
+        street_numbers = choices(range(100, 10000), k=count)
+        streets = choices(_MOCK_STREETS, k=count)
+        room_types = choices(_MOCK_ROOM_TYPES, k=count)
+        policies = choices(_MOCK_CANCELLATION_POLICIES, k=count)
+        # Distances between 0.5 and 10 km in 0.1 km steps
+        distances = choices(range(5, 101), k=count)
+        breakfasts = choices((True, False), k=count)
+
+        sample = random.sample
         hotels = []
-        nights = self._calculate_nights(check_in, check_out)
-
-        for i in range(8):
-            base_price = random.randint(80, 400)
-            rating = round(random.uniform(3.5, 5.0), 1)
-            chain = random.choice(hotel_chains)
-            hotel_type = random.choice(hotel_types)
-
-            # Select random amenities
-            num_amenities = random.randint(4, 7)
-            amenities = random.sample(amenities_pool, num_amenities)
-
-            # Generate a placeholder hotel image URL using Unsplash
-            # Using different hotel images based on hotel type for variety
-            hotel_image_ids = [
-                "rDEOVtE7vOs",  # Modern hotel exterior
-                "BfrQnKBulYQ",  # Luxury hotel lobby
-                "kKvQJ6rK6S4",  # Hotel room
-                "YrtFlrLo2DQ",  # Resort pool
-                "Z8Y7jJqJ6J4",  # Hotel exterior
-                "nXOB-wh4Oyc",  # Hotel suite
-                "rDEOVtE7vOs",  # Modern hotel
-                "BfrQnKBulYQ",  # Luxury hotel
-            ]
-            image_id = hotel_image_ids[i % len(hotel_image_ids)]
+        for i in range(count):
+            base_price = base_prices[i]
+            image_id = _MOCK_HOTEL_IMAGE_IDS[i % len(_MOCK_HOTEL_IMAGE_IDS)]
             image_url = f"https://images.unsplash.com/photo-{image_id}?w=800&h=600&fit=crop"
-            
+
             hotels.append(
                 {
                     "id": f"MOCK-MAKCORPS-HT-{i+1}",
-                    "name": f"{chain} {hotel_type} {location}",
+                    "name": f"{chains[i]} {hotel_types[i]} {location}",
                     "price_per_night": base_price,
                     "total_price": base_price * nights * rooms,
                     "currency": "USD",
-                    "rating": rating,
-                    "review_count": random.randint(50, 500),
-                    "address": f'{random.randint(100, 9999)} {random.choice(["Main", "Central", "Park", "Ocean"])} St, {location}',
-                    "amenities": amenities,
-                    "room_type": random.choice(
-                        [
-                            "Standard Room",
-                            "Deluxe Room",
-                            "Suite",
-                            "Family Room",
-                            "Executive Suite",
-                        ]
-                    ),
-                    "cancellation_policy": random.choice(
-                        [
-                            "Free cancellation up to 24h before",
-                            "Non-refundable",
-                            "Partially refundable",
-                        ]
-                    ),
-                    "distance_from_center": f"{random.uniform(0.5, 10):.1f} km",
-                    "breakfast_included": random.choice([True, False]),
+                    "rating": ratings[i],
+                    "review_count": review_counts[i],
+                    "address": f"{street_numbers[i]} {streets[i]} St, {location}",
+                    # Amenities must be distinct, so they are sampled per hotel
+                    "amenities": sample(_MOCK_AMENITIES, amenity_counts[i]),
+                    "room_type": room_types[i],
+                    "cancellation_policy": policies[i],
+                    "distance_from_center": f"{distances[i] / 10:.1f} km",
+                    "breakfast_included": breakfasts[i],
                     "check_in": check_in,
                     "check_out": check_out,
                     "nights": nights,
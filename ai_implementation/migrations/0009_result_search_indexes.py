@@ -0,0 +1,52 @@
+# Generated by Django 5.2.8 on 2026-10-17 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_implementation", "0008_activityresult_image_url_hotelresult_image_url"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="flightresult",
+            index=models.Index(
+                fields=["search", "-ai_score", "price"],
+                name="flight_search_score_price_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="flightresult",
+            index=models.Index(
+                fields=["search", "external_id"], name="flight_search_external_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="hotelresult",
+            index=models.Index(
+                fields=["search", "-ai_score", "total_price"],
+                name="hotel_search_score_price_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="hotelresult",
+            index=models.Index(
+                fields=["search", "external_id"], name="hotel_search_external_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activityresult",
+            index=models.Index(
+                fields=["search", "-ai_score", "-rating"],
+                name="activity_search_score_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activityresult",
+            index=models.Index(
+                fields=["search", "external_id"], name="activity_search_external_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.8 on 2026-10-17 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_implementation", "0009_result_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="activityresult",
+            name="ai_score",
+            field=models.PositiveSmallIntegerField(
+                blank=True, help_text="AI-generated score (0-100)", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="activityresult",
+            name="currency",
+            field=models.CharField(default="USD", max_length=3),
+        ),
+        migrations.AlterField(
+            model_name="activityresult",
+            name="duration_hours",
+            field=models.PositiveSmallIntegerField(default=2),
+        ),
+        migrations.AlterField(
+            model_name="activityresult",
+            name="max_group_size",
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="flightresult",
+            name="ai_score",
+            field=models.PositiveSmallIntegerField(
+                blank=True, help_text="AI-generated score (0-100)", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="flightresult",
+            name="currency",
+            field=models.CharField(default="USD", max_length=3),
+        ),
+        migrations.AlterField(
+            model_name="flightresult",
+            name="stops",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name="groupitineraryoption",
+            name="vote_count",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name="hotelresult",
+            name="ai_score",
+            field=models.PositiveSmallIntegerField(
+                blank=True, help_text="AI-generated score (0-100)", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="hotelresult",
+            name="currency",
+            field=models.CharField(default="USD", max_length=3),
+        ),
+        migrations.AlterField(
+            model_name="travelsearch",
+            name="adults",
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AlterField(
+            model_name="travelsearch",
+            name="rooms",
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_implementation", "0010_narrow_result_columns"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="aigenerateditinerary",
+            index=models.Index(
+                condition=models.Q(("is_saved", True)),
+                fields=["user", "-created_at"],
+                name="saved_itinerary_user_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="groupconsensus",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["group", "-created_at"],
+                name="active_consensus_group_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="groupitineraryoption",
+            index=models.Index(
+                condition=models.Q(("status", "active")),
+                fields=["group"],
+                name="active_option_group_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="groupitineraryoption",
+            index=models.Index(
+                condition=models.Q(("is_winner", True)),
+                fields=["group"],
+                name="winner_option_group_idx",
+            ),
+        ),
+    ]
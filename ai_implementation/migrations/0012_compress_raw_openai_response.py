@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:31
+
+import ai_implementation.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_implementation", "0011_partial_status_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="consolidatedresult",
+            name="raw_openai_response",
+            field=ai_implementation.fields.CompressedTextField(
+                blank=True, help_text="Full OpenAI API response", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="groupconsensus",
+            name="raw_openai_response",
+            field=ai_implementation.fields.CompressedTextField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:58
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_implementation", "0012_compress_raw_openai_response"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="activityresult",
+            name="created_at",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(), editable=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="flightresult",
+            name="created_at",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(), editable=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="hotelresult",
+            name="created_at",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(), editable=False
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-17 16:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_implementation", "0013_result_created_at_db_default"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="groupitineraryoption",
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name="itineraryvote",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="groupitineraryoption",
+            constraint=models.UniqueConstraint(
+                fields=("group", "consensus", "option_letter"),
+                name="unique_option_per_consensus",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="itineraryvote",
+            constraint=models.UniqueConstraint(
+                fields=("group", "user"), name="unique_vote_per_group_user"
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-17 16:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_implementation", "0014_unique_constraints"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="travelsearch",
+            name="activity_categories",
+            field=models.CharField(
+                blank=True, help_text="Comma-separated list", max_length=200, null=True
+            ),
+        ),
+    ]
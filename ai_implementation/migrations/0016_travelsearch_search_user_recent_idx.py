@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-17 16:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_implementation", "0015_alter_travelsearch_activity_categories"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="travelsearch",
+            index=models.Index(
+                fields=["user", "-created_at"], name="search_user_recent_idx"
+            ),
+        ),
+    ]
@@ -3,12 +3,58 @@ Models for AI Implementation
 Stores travel search results, consolidated recommendations, and AI-generated content.
 """
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Q
+from django.db.models.functions import Now
 from django.contrib.auth.models import User
 from django.utils import timezone
 from decimal import Decimal
+import os
 import uuid
 
+from .fields import CompressedTextField
+
+
+def uuid4_batch(n):
+    """
+    Return n random UUID4s drawn from one os.urandom() call, instead of the
+    one urandom syscall per row that default=uuid.uuid4 costs.
+    """
+    blob = os.urandom(16 * n)
+    return [uuid.UUID(bytes=blob[i : i + 16], version=4) for i in range(0, 16 * n, 16)]
+
+
+class SearchResultQuerySet(models.QuerySet):
+    """QuerySet for the per-search result tables"""
+
+    def thin(self):
+        """Load only the summary columns (model.THIN_FIELDS) list paths read"""
+        return self.only(*self.model.THIN_FIELDS)
+
+
+class SearchResultMixin:
+    """Batched inserts for the per-search result tables"""
+
+    INGEST_BATCH_SIZE = 500
+
+    @classmethod
+    def bulk_ingest(cls, search, rows):
+        """
+        Create one result per dict in rows for search with batched INSERTs.
+        save() is not called, so per-row defaults belong in _prepare_ingest().
+        """
+        rows = list(rows)
+        objs = [
+            cls(id=pk, search=search, **row)
+            for pk, row in zip(uuid4_batch(len(rows)), rows)
+        ]
+        for obj in objs:
+            obj._prepare_ingest()
+        return cls.objects.bulk_create(objs, batch_size=cls.INGEST_BATCH_SIZE)
+
+    def _prepare_ingest(self):
+        """Hook for defaults that save() would otherwise fill in"""
+
 
 class TravelSearch(models.Model):
     """Model to store travel search queries and parameters"""
@@ -30,8 +76,8 @@ class TravelSearch(models.Model):
     origin = models.CharField(max_length=200, blank=True, null=True)
     start_date = models.DateField()
     end_date = models.DateField()
-    adults = models.PositiveIntegerField(default=1)
-    rooms = models.PositiveIntegerField(default=1)
+    adults = models.PositiveSmallIntegerField(default=1)
+    rooms = models.PositiveSmallIntegerField(default=1)
 
     # Preferences
     budget_min = models.DecimalField(
@@ -41,8 +87,8 @@ class TravelSearch(models.Model):
         max_digits=10, decimal_places=2, null=True, blank=True
     )
     accommodation_type = models.CharField(max_length=100, blank=True, null=True)
-    activity_categories = models.TextField(
-        blank=True, null=True, help_text="Comma-separated list"
+    activity_categories = models.CharField(
+        max_length=200, blank=True, null=True, help_text="Comma-separated list"
     )
 
     # Metadata
@@ -52,6 +98,10 @@ class TravelSearch(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Recent searches are listed per user, newest first
+            models.Index(fields=["user", "-created_at"], name="search_user_recent_idx"),
+        ]
         verbose_name = "Travel Search"
         verbose_name_plural = "Travel Searches"
 
@@ -59,6 +109,21 @@ class TravelSearch(models.Model):
         return f"Search: {self.destination} ({self.start_date} to {self.end_date})"
 
 
+class ConsolidatedResultManager(models.Manager):
+    """
+    Loads the search with each result; __str__ and templates read it.
+    The raw OpenAI payload is only needed in the admin, so it is deferred.
+    """
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .select_related("search")
+            .defer("raw_openai_response")
+        )
+
+
 class ConsolidatedResult(models.Model):
     """Model to store AI-consolidated search results"""
 
@@ -91,7 +156,7 @@ class ConsolidatedResult(models.Model):
     )
 
     # Raw data storage
-    raw_openai_response = models.TextField(
+    raw_openai_response = CompressedTextField(
         blank=True, null=True, help_text="Full OpenAI API response"
     )
 
@@ -99,6 +164,9 @@ class ConsolidatedResult(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ConsolidatedResultManager()
+    all_objects = models.Manager()
+
     class Meta:
         verbose_name = "Consolidated Result"
         verbose_name_plural = "Consolidated Results"
@@ -106,8 +174,13 @@ class ConsolidatedResult(models.Model):
     def __str__(self):
         return f"Results for {self.search.destination}"
 
+    @property
+    def cache_key(self):
+        """Cache key for derived content; changes whenever the result is saved"""
+        return f"consolidated:{self.pk}:{self.updated_at.timestamp()}"
 
-class FlightResult(models.Model):
+
+class FlightResult(SearchResultMixin, models.Model):
     """Model to store individual flight search results"""
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -119,17 +192,17 @@ class FlightResult(models.Model):
     external_id = models.CharField(max_length=200, help_text="ID from external API")
     airline = models.CharField(max_length=100)
     price = models.DecimalField(max_digits=10, decimal_places=2)
-    currency = models.CharField(max_length=10, default="USD")
+    currency = models.CharField(max_length=3, default="USD")  # ISO 4217
 
     departure_time = models.DateTimeField()
     arrival_time = models.DateTimeField()
     duration = models.CharField(max_length=50)
-    stops = models.PositiveIntegerField(default=0)
+    stops = models.PositiveSmallIntegerField(default=0)
     booking_class = models.CharField(max_length=50, default="Economy")
     seats_available = models.CharField(max_length=50, blank=True, null=True)
 
     # AI recommendation data
-    ai_score = models.PositiveIntegerField(
+    ai_score = models.PositiveSmallIntegerField(
         null=True, blank=True, help_text="AI-generated score (0-100)"
     )
     ai_reason = models.TextField(
@@ -144,12 +217,35 @@ class FlightResult(models.Model):
         help_text="Destination this result was searched for",
     )
 
-    # Metadata
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Metadata; stamped by the database so bulk_ingest doesn't send it
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     is_mock = models.BooleanField(default=False, help_text="Whether this is mock data")
 
+    objects = SearchResultQuerySet.as_manager()
+
+    THIN_FIELDS = (
+        "external_id",
+        "airline",
+        "price",
+        "currency",
+        "stops",
+        "ai_score",
+        "searched_destination",
+        "is_mock",
+    )
+
     class Meta:
         ordering = ["-ai_score", "price"]
+        indexes = [
+            # Results are always listed per search in Meta.ordering order
+            models.Index(
+                fields=["search", "-ai_score", "price"],
+                name="flight_search_score_price_idx",
+            ),
+            models.Index(
+                fields=["search", "external_id"], name="flight_search_external_idx"
+            ),
+        ]
         verbose_name = "Flight Result"
         verbose_name_plural = "Flight Results"
 
@@ -157,7 +253,7 @@ class FlightResult(models.Model):
         return f"{self.airline} - ${self.price} ({self.stops} stops)"
 
 
-class HotelResult(models.Model):
+class HotelResult(SearchResultMixin, models.Model):
     """Model to store individual hotel search results"""
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -174,7 +270,7 @@ class HotelResult(models.Model):
     total_price = models.DecimalField(
         max_digits=10, decimal_places=2, null=True, blank=True
     )
-    currency = models.CharField(max_length=10, default="USD")
+    currency = models.CharField(max_length=3, default="USD")  # ISO 4217
 
     rating = models.DecimalField(max_digits=3, decimal_places=1, null=True, blank=True)
     review_count = models.PositiveIntegerField(default=0)
@@ -188,7 +284,7 @@ class HotelResult(models.Model):
     cancellation_policy = models.CharField(max_length=200, blank=True, null=True)
 
     # AI recommendation data
-    ai_score = models.PositiveIntegerField(
+    ai_score = models.PositiveSmallIntegerField(
         null=True, blank=True, help_text="AI-generated score (0-100)"
     )
     ai_reason = models.TextField(
@@ -211,12 +307,35 @@ class HotelResult(models.Model):
         help_text="URL to hotel image/photo from API",
     )
 
-    # Metadata
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Metadata; stamped by the database so bulk_ingest doesn't send it
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     is_mock = models.BooleanField(default=False, help_text="Whether this is mock data")
 
+    objects = SearchResultQuerySet.as_manager()
+
+    THIN_FIELDS = (
+        "external_id",
+        "name",
+        "price_per_night",
+        "total_price",
+        "currency",
+        "rating",
+        "ai_score",
+        "searched_destination",
+        "is_mock",
+    )
+
     class Meta:
         ordering = ["-ai_score", "total_price"]
+        indexes = [
+            models.Index(
+                fields=["search", "-ai_score", "total_price"],
+                name="hotel_search_score_price_idx",
+            ),
+            models.Index(
+                fields=["search", "external_id"], name="hotel_search_external_idx"
+            ),
+        ]
         verbose_name = "Hotel Result"
         verbose_name_plural = "Hotel Results"
 
@@ -225,16 +344,20 @@ class HotelResult(models.Model):
 
     def save(self, *args, **kwargs):
         """Ensure total_price is populated when absent."""
+        self._prepare_ingest()
+        super().save(*args, **kwargs)
+
+    def _prepare_ingest(self):
+        """Derive total_price from the nightly rate and the search's stay length"""
         if (self.total_price is None or self.total_price == 0) and self.price_per_night:
             nights = 1
             if self.search and self.search.start_date and self.search.end_date:
                 nights = max((self.search.end_date - self.search.start_date).days, 1)
             nightly = Decimal(self.price_per_night)
             self.total_price = nightly * Decimal(nights)
-        super().save(*args, **kwargs)
 
 
-class ActivityResult(models.Model):
+class ActivityResult(SearchResultMixin, models.Model):
     """Model to store individual activity/tour search results"""
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -249,20 +372,20 @@ class ActivityResult(models.Model):
     description = models.TextField(blank=True, null=True)
 
     price = models.DecimalField(max_digits=10, decimal_places=2)
-    currency = models.CharField(max_length=10, default="USD")
-    duration_hours = models.PositiveIntegerField(default=2)
+    currency = models.CharField(max_length=3, default="USD")  # ISO 4217
+    duration_hours = models.PositiveSmallIntegerField(default=2)
 
     rating = models.DecimalField(max_digits=3, decimal_places=1, null=True, blank=True)
     review_count = models.PositiveIntegerField(default=0)
 
     included = models.TextField(blank=True, null=True, help_text="What's included")
     meeting_point = models.CharField(max_length=300, blank=True, null=True)
-    max_group_size = models.PositiveIntegerField(null=True, blank=True)
+    max_group_size = models.PositiveSmallIntegerField(null=True, blank=True)
     languages = models.CharField(max_length=200, blank=True, null=True)
     cancellation_policy = models.CharField(max_length=200, blank=True, null=True)
 
     # AI recommendation data
-    ai_score = models.PositiveIntegerField(
+    ai_score = models.PositiveSmallIntegerField(
         null=True, blank=True, help_text="AI-generated score (0-100)"
     )
     ai_reason = models.TextField(
@@ -293,12 +416,35 @@ class ActivityResult(models.Model):
         help_text="URL to activity image/photo from API",
     )
 
-    # Metadata
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Metadata; stamped by the database so bulk_ingest doesn't send it
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     is_mock = models.BooleanField(default=False, help_text="Whether this is mock data")
 
+    objects = SearchResultQuerySet.as_manager()
+
+    THIN_FIELDS = (
+        "external_id",
+        "name",
+        "category",
+        "price",
+        "currency",
+        "rating",
+        "ai_score",
+        "searched_destination",
+        "is_mock",
+    )
+
     class Meta:
         ordering = ["-ai_score", "-rating"]
+        indexes = [
+            models.Index(
+                fields=["search", "-ai_score", "-rating"],
+                name="activity_search_score_idx",
+            ),
+            models.Index(
+                fields=["search", "external_id"], name="activity_search_external_idx"
+            ),
+        ]
         verbose_name = "Activity Result"
         verbose_name_plural = "Activity Results"
 
@@ -306,6 +452,13 @@ class ActivityResult(models.Model):
         return f"{self.name} - ${self.price}"
 
 
+class GroupConsensusManager(models.Manager):
+    """Defers the raw OpenAI payload, which only the admin displays"""
+
+    def get_queryset(self):
+        return super().get_queryset().defer("raw_openai_response")
+
+
 class GroupConsensus(models.Model):
     """Model to store AI-generated group consensus preferences"""
 
@@ -333,14 +486,25 @@ class GroupConsensus(models.Model):
     group_dynamics_notes = models.TextField(blank=True, null=True)
 
     # Raw OpenAI response
-    raw_openai_response = models.TextField(blank=True, null=True)
+    raw_openai_response = CompressedTextField(blank=True, null=True)
 
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
 
+    objects = GroupConsensusManager()
+    all_objects = models.Manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Views only ever look up a group's current (active) consensus
+            models.Index(
+                fields=["group", "-created_at"],
+                condition=Q(is_active=True),
+                name="active_consensus_group_idx",
+            ),
+        ]
         verbose_name = "Group Consensus"
         verbose_name_plural = "Group Consensuses"
 
@@ -348,6 +512,17 @@ class GroupConsensus(models.Model):
         return f"Consensus for {self.group.name}"
 
 
+class AIGeneratedItineraryManager(models.Manager):
+    """Loads the owner, search and selected flight/hotel with each itinerary"""
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .select_related("user", "search", "selected_flight", "selected_hotel")
+        )
+
+
 class AIGeneratedItinerary(models.Model):
     """Model to store AI-generated itinerary descriptions"""
 
@@ -398,8 +573,18 @@ class AIGeneratedItinerary(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     is_saved = models.BooleanField(default=False)
 
+    objects = AIGeneratedItineraryManager()
+    all_objects = models.Manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at"],
+                condition=Q(is_saved=True),
+                name="saved_itinerary_user_idx",
+            ),
+        ]
         verbose_name = "AI Generated Itinerary"
         verbose_name_plural = "AI Generated Itineraries"
 
@@ -439,6 +624,20 @@ class SearchHistory(models.Model):
         return f"{self.user.username} - {self.search.destination}"
 
 
+class GroupItineraryOptionManager(models.Manager):
+    """Loads every forward relation an option card or __str__ renders"""
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .select_related(
+                "group", "consensus", "search", "selected_flight", "selected_hotel"
+            )
+            .defer("consensus__raw_openai_response")
+        )
+
+
 class GroupItineraryOption(models.Model):
     """Model for storing multiple itinerary options for group voting"""
 
@@ -531,16 +730,37 @@ class GroupItineraryOption(models.Model):
     )
 
     # Voting
-    vote_count = models.PositiveIntegerField(default=0)
+    vote_count = models.PositiveSmallIntegerField(default=0)
     is_winner = models.BooleanField(default=False)
 
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = GroupItineraryOptionManager()
+    all_objects = models.Manager()
+
     class Meta:
         ordering = ["display_order", "option_letter"]
-        unique_together = ["group", "consensus", "option_letter"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["group", "consensus", "option_letter"],
+                name="unique_option_per_consensus",
+            ),
+        ]
+        indexes = [
+            # Few options per group are ever active or winning
+            models.Index(
+                fields=["group"],
+                condition=Q(status="active"),
+                name="active_option_group_idx",
+            ),
+            models.Index(
+                fields=["group"],
+                condition=Q(is_winner=True),
+                name="winner_option_group_idx",
+            ),
+        ]
         verbose_name = "Group Itinerary Option"
         verbose_name_plural = "Group Itinerary Options"
 
@@ -548,10 +768,19 @@ class GroupItineraryOption(models.Model):
         return f"Option {self.option_letter} for {self.group.name} - {self.vote_count} votes"
 
     def update_vote_count(self):
-        """Update the vote count from related votes"""
+        """Recount votes from scratch; used to repair a drifted vote_count"""
         self.vote_count = self.votes.count()
         self.save()
 
+    @classmethod
+    def adjust_vote_count(cls, option_id, delta):
+        """Atomically add delta to an option's vote_count without recounting"""
+        options = cls.objects.filter(pk=option_id)
+        if delta < 0:
+            # Never drive a drifted count below zero
+            options = options.filter(vote_count__gte=-delta)
+        options.update(vote_count=F("vote_count") + delta)
+
 
 class ItineraryVote(models.Model):
     """Model for tracking group member votes on itinerary options"""
@@ -576,7 +805,12 @@ class ItineraryVote(models.Model):
     )
 
     class Meta:
-        unique_together = ["group", "user"]  # One vote per user per voting session
+        constraints = [
+            # One vote per user per voting session
+            models.UniqueConstraint(
+                fields=["group", "user"], name="unique_vote_per_group_user"
+            ),
+        ]
         ordering = ["-voted_at"]
         verbose_name = "Itinerary Vote"
         verbose_name_plural = "Itinerary Votes"
@@ -585,25 +819,23 @@ class ItineraryVote(models.Model):
         return f"{self.user.username} voted for Option {self.option.option_letter}"
 
     def save(self, *args, **kwargs):
-        # Store old option if this is an update
-        old_option = None
-        if self.pk:
-            try:
-                old_vote = ItineraryVote.objects.get(pk=self.pk)
-                old_option = old_vote.option
-            except ItineraryVote.DoesNotExist:
-                pass
-
-        super().save(*args, **kwargs)
-        # Update vote count on the new option
-        self.option.update_vote_count()
-        # Update vote count on old option if vote was changed
-        if old_option and old_option != self.option:
-            old_option.update_vote_count()
-
-    def delete(self, *args, **kwargs):
-        # Store option before deletion to update its vote count
-        option = self.option
-        super().delete(*args, **kwargs)
-        # Update vote count after deletion
-        option.update_vote_count()
+        with transaction.atomic():
+            # Lock the stored row so a concurrent move can't change it under us
+            old_option_id = None
+            if not self._state.adding:
+                old_option_id = (
+                    ItineraryVote.objects.select_for_update()
+                    .filter(pk=self.pk)
+                    .values_list("option_id", flat=True)
+                    .first()
+                )
+
+            super().save(*args, **kwargs)
+            if old_option_id != self.option_id:
+                # New vote, or the vote moved to a different option
+                GroupItineraryOption.adjust_vote_count(self.option_id, 1)
+                if old_option_id:
+                    GroupItineraryOption.adjust_vote_count(old_option_id, -1)
+
+    # Deleted votes are taken off vote_count by a post_delete receiver in
+    # signals.py, which also covers queryset deletes
@@ -5,10 +5,408 @@ Handles all interactions with the OpenAI API for consolidating and processing tr
 
 import os
 import json
+import logging
 import sys
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
+import hashlib
+import re
+from string import Template
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Callable
+import httpx
+from openai import DefaultHttpxClient, OpenAI, InternalServerError, RateLimitError
 from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Try to import tiktoken for exact prompt token counts, fall back to an estimate
+try:
+    import tiktoken
+
+    USE_TIKTOKEN = True
+except ImportError:
+    # tiktoken not installed, estimate roughly four characters per token
+    tiktoken = None
+    USE_TIKTOKEN = False
+
+# Default lifetime of cached completions (seconds); see OPENAI_RESPONSE_CACHE_TIMEOUT
+RESPONSE_CACHE_TIMEOUT = 3600
+
+# Default for settings.OPENAI_MAX_RETRIES; the SDK itself defaults to 2
+MAX_RETRIES = 4
+
+# Completions at or above this temperature are meant to vary, so never cache them
+UNCACHED_TEMPERATURE = 0.8
+
+# Shown when a travel question cannot be answered
+TRAVEL_QUESTION_ERROR_MESSAGE = (
+    "I apologize, but I'm unable to answer that question at the moment. "
+    "Please try again later."
+)
+
+# Token budgets for each result list embedded in a prompt
+CONSOLIDATION_LIST_TOKENS = 1200
+ITINERARY_OPTIONS_LIST_TOKENS = 400
+# Smallest list budget oversized prompts are trimmed down to
+MIN_LIST_TOKENS = 50
+
+# Default for settings.OPENAI_CONTEXT_TOKENS (gpt-4o-mini context window)
+CONTEXT_TOKENS = 128000
+# Headroom for chat message framing, which the token count does not include
+CONTEXT_MARGIN_TOKENS = 128
+
+# Result fields the model actually uses; everything else is dropped from prompts
+FLIGHT_PROMPT_FIELDS = (
+    "id",
+    "airline",
+    "price",
+    "total_amount",
+    "currency",
+    "departure_time",
+    "arrival_time",
+    "duration",
+    "stops",
+    "searched_destination",
+)
+HOTEL_PROMPT_FIELDS = (
+    "id",
+    "name",
+    "price_per_night",
+    "total_price",
+    "currency",
+    "rating",
+    "review_count",
+    "room_type",
+    "breakfast_included",
+    "searched_destination",
+)
+ACTIVITY_PROMPT_FIELDS = (
+    "id",
+    "name",
+    "category",
+    "price",
+    "rating",
+    "duration_hours",
+    "searched_destination",
+)
+
+
+def _create_http_client() -> httpx.Client:
+    """
+    Create a pooled HTTP client for api.openai.com that keeps TLS connections
+    alive between completions instead of reconnecting for every request.
+    """
+    return DefaultHttpxClient(
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=25)
+    )
+
+
+# OpenAIService is created per request, so every instance shares one
+# connection pool instead of opening a new one per view
+_HTTP_CLIENT = _create_http_client()
+
+# Static prompt text lives in module constants so it is built once, and every
+# user message leads with it before any request-specific data. Keeping this
+# prefix byte-for-byte identical across calls lets the provider's automatic
+# prompt caching reuse it; edit these blocks deliberately.
+
+_SYSTEM_CONSOLIDATOR = (
+    "You are an expert travel planner AI assistant. Your job is to analyze "
+    "multiple travel options (flights, hotels, activities) and consolidate them "
+    "into a coherent, ranked recommendation based on user preferences. "
+    "Provide practical advice and explain your reasoning."
+)
+
+_SYSTEM_ITINERARY_OPTIONS = (
+    "Travel AI: Create 5-8 diverse itinerary options balancing all group "
+    "preferences. When the group has several destinations, create options for "
+    "EACH destination. Return valid JSON matching exact structure."
+)
+
+_SYSTEM_GROUP_COORDINATOR = (
+    "You are an expert group travel coordinator. Your job is to analyze "
+    "multiple people's travel preferences and find the best consensus that "
+    "satisfies the group while being fair and practical."
+)
+
+_SYSTEM_TRAVEL_WRITER = (
+    "You are a creative travel writer who creates inspiring itinerary descriptions."
+)
+
+_SYSTEM_TRAVEL_ADVISOR = (
+    "You are a knowledgeable travel advisor. Provide accurate, helpful "
+    "information about travel destinations, planning, and logistics."
+)
+
+_CONSOLIDATION_INSTRUCTIONS = """\
+Please analyze the travel options below and provide consolidated recommendations.
+Rank items by how well they match the preferences, with scores from 0-100.
+Include only the top 5 recommendations for each category.
+
+Please provide a JSON response with the following structure:
+{
+    "summary": "Brief overview of the best options considering all preferences",
+    "recommended_flights": [
+        {
+            "rank": 1,
+            "flight_id": "id from original data",
+            "reason": "Why this flight is recommended",
+            "score": 95
+        }
+    ],
+    "recommended_hotels": [
+        {
+            "rank": 1,
+            "hotel_id": "id from original data",
+            "reason": "Why this hotel is recommended",
+            "score": 90
+        }
+    ],
+    "recommended_activities": [
+        {
+            "rank": 1,
+            "activity_id": "id from original data",
+            "reason": "Why this activity is recommended",
+            "score": 88
+        }
+    ],
+    "budget_analysis": {
+        "estimated_total": "Estimated total cost",
+        "breakdown": "Cost breakdown",
+        "savings_tips": "Tips for saving money"
+    },
+    "itinerary_suggestions": [
+        "Suggested day-by-day itinerary combining selected options"
+    ],
+    "warnings": ["Any concerns or warnings about the selections"]
+}
+"""
+
+_ITINERARY_OPTIONS_INSTRUCTIONS = """\
+Create 5-8 diverse itinerary options (letters A-H) for the group below to vote on.
+
+RULES:
+- Balance ALL members' preferences; mention every member by name in reasoning
+- Vary destination, style and budget across the Low, Med and High budgets given
+- With several destinations, cover EACH one; match "searched_destination" in DATA
+- Let different options favour different members, and say whose each one favours
+- Copy ONLY exact ids from DATA
+
+JSON OUTPUT:
+{"options":[{"option_letter":"A","title":"...","description":"1-2 sentences",\
+"intended_destination":"exact destination name from searched_destination field",\
+"selected_flight_id":"exact id","selected_hotel_id":"exact id",\
+"selected_activity_ids":["exact ids"],"estimated_total_cost":0.00,\
+"cost_per_person":0.00,"ai_reasoning":"Why this works for ALL members",\
+"compromise_explanation":"How this addresses EACH member by name",\
+"pros":["...","...","..."],"cons":["...","..."]},{"option_letter":"B",...}],
+"voting_guidance":"...","consensus_summary":"..."}
+"""
+
+# Request-specific lines of the itinerary options prompt
+_DATES_TMPL = Template("DATES: $start to $end ($days days). Match these dates.")
+_SINGLE_DESTINATION_TMPL = Template(
+    "DESTINATION: $destination. Vary budget tiers across options."
+)
+_MULTI_DESTINATION_TMPL = Template(
+    """\
+DESTINATIONS ($count, CRITICAL): $destinations
+- At least $per_destination options for EACH destination, at different budget tiers
+- Never put all options in one destination
+- Total: at least $min_total options, at most 8"""
+)
+
+_GROUP_CONSENSUS_INSTRUCTIONS = """\
+Analyze the travel preferences of the group members below and find the best consensus.
+
+Please provide a JSON response with:
+{
+    "consensus_preferences": {
+        "destination": "Most agreed upon or best compromise destination",
+        "date_range": "Optimal date range considering all preferences",
+        "budget_range": "Budget range that works for everyone",
+        "accommodation_type": "Best accommodation type for the group",
+        "activities": ["Activities that most members would enjoy"],
+        "dietary_accommodations": ["Dietary restrictions to consider"],
+        "accessibility_needs": ["Accessibility requirements to consider"]
+    },
+    "compromise_areas": [
+        {
+            "aspect": "What aspect requires compromise",
+            "options": ["Possible compromise solutions"],
+            "recommendation": "Best compromise solution"
+        }
+    ],
+    "unanimous_preferences": ["Things everyone agrees on"],
+    "conflicting_preferences": [
+        {
+            "aspect": "What's in conflict",
+            "members_affected": ["Members with this preference"],
+            "suggestion": "How to resolve"
+        }
+    ],
+    "group_dynamics_notes": "Notes about group compatibility and suggestions"
+}
+"""
+
+_ITINERARY_DESCRIPTION_INSTRUCTIONS = """\
+Create an engaging, detailed itinerary description for the trip below.
+
+Generate a compelling description that:
+1. Provides a day-by-day overview
+2. Highlights unique experiences
+3. Includes practical tips
+4. Mentions dining and accommodation suggestions
+5. Is enthusiastic but realistic
+
+Keep it under 300 words and make it inspiring!
+"""
+
+_SYSTEM_JSON_REPAIR = (
+    "The user message is a response that is not valid JSON. Return only the "
+    "corrected JSON object, keeping its content unchanged."
+)
+
+_TRAVEL_QUESTION_INSTRUCTIONS = """\
+Please provide a helpful, accurate answer to the travel question below.
+"""
+
+
+def _repair_json(content: str) -> Optional[Any]:
+    """
+    Parse a malformed JSON reply locally, or return None.
+
+    Handles the usual failure modes: markdown code fences, prose around the
+    object and trailing commas before a closing brace or bracket.
+    """
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0]
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0]
+
+    # Take the first balanced top-level object
+    start = content.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    for index in range(start, len(content)):
+        if content[index] == "{":
+            depth += 1
+        elif content[index] == "}":
+            depth -= 1
+            if depth == 0:
+                break
+    if depth:
+        return None
+
+    candidate = content[start : index + 1]
+    candidate = re.sub(r",\s*([}\]])", r"\1", candidate)
+    try:
+        return json.loads(candidate)
+    except json.JSONDecodeError:
+        return None
+
+
+def _compact_json(obj: Any) -> str:
+    """Serialize prompt data without whitespace to keep requests small."""
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """Return the tiktoken encoding for a model, with a default for unknown names"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _count_tokens_for(model: str, text: str) -> int:
+    """Count tokens for a model, or estimate them without tiktoken"""
+    if USE_TIKTOKEN:
+        return len(_get_encoding(model).encode(text))
+    return len(text) // 4 + 1
+
+
+def _fit_items(
+    model: str,
+    items: Iterable[Dict[str, Any]],
+    target_tokens: int,
+    fields: Optional[Iterable[str]] = None,
+) -> str:
+    """
+    Serialize as many leading items as fit within target_tokens.
+
+    Items are first projected onto fields so only data the model uses is
+    counted and sent. The first item is always kept so a list is never
+    emptied by one oversized entry.
+    """
+    parts = []
+    used = 1  # Opening and closing brackets
+    for item in items:
+        if fields is not None:
+            item = {key: item[key] for key in fields if key in item}
+        part = _compact_json(item)
+        cost = _count_tokens_for(model, part) + 1  # Separator
+        if parts and used + cost > target_tokens:
+            break
+        parts.append(part)
+        used += cost
+    return "[" + ",".join(parts) + "]"
+
+
+@lru_cache(maxsize=32)
+def _consolidation_data(model: str, budget: int, payload: str) -> str:
+    """
+    Render the request data of a consolidation prompt.
+
+    Keyed on the compact JSON of the inputs, so a replayed request with the
+    same results skips per-item projection and token counting.
+    """
+    flights, hotels, activities, preferences = json.loads(payload)
+    return f"""
+USER PREFERENCES:
+{_compact_json(preferences)}
+
+FLIGHT OPTIONS ({len(flights)} results, best first):
+{_fit_items(model, flights, budget, FLIGHT_PROMPT_FIELDS)}
+
+HOTEL OPTIONS ({len(hotels)} results, best first):
+{_fit_items(model, hotels, budget, HOTEL_PROMPT_FIELDS)}
+
+ACTIVITY OPTIONS ({len(activities)} results, best first):
+{_fit_items(model, activities, budget, ACTIVITY_PROMPT_FIELDS)}
+"""
+
+
+@lru_cache(maxsize=32)
+def _count_static_tokens(model: str, text: str) -> int:
+    """Token count of a static prompt block, computed once per model"""
+    return _count_tokens_for(model, text)
+
+
+@lru_cache(maxsize=256)
+def _calculate_budget_stats(raw_budgets: tuple) -> tuple:
+    """
+    Parse member budgets in one pass and return (budgets, min, median, max).
+
+    Takes the raw budget strings as a tuple so repeated calls for a group
+    whose budgets have not changed are served from the cache. Falls back to
+    default tiers when no member gave a positive budget.
+    """
+    budgets = []
+    for value in raw_budgets:
+        try:
+            budget = float(value.replace("$", "").replace(",", "").strip())
+        except ValueError:
+            continue
+        if budget > 0:
+            budgets.append(budget)
+
+    if not budgets:
+        return (), 1000, 3000, 5000
+    budgets.sort()
+    return tuple(budgets), budgets[0], budgets[len(budgets) // 2], budgets[-1]
 
 
 class OpenAIService:
@@ -24,34 +422,231 @@ class OpenAIService:
                 "OpenAI API key not found. Please set OPENAI_API_KEY in environment "
                 "variables or Django settings."
             )
-        self.client = OpenAI(api_key=api_key)
+        # The SDK retries 429s and 5xx with exponential backoff and jitter,
+        # honouring Retry-After, before the light-model fallback kicks in
+        self.client = OpenAI(
+            api_key=api_key,
+            http_client=_HTTP_CLIENT,
+            max_retries=getattr(settings, "OPENAI_MAX_RETRIES", MAX_RETRIES),
+        )
         self.model = getattr(settings, "OPENAI_MODEL", "gpt-4o-mini")
-
-    def _log_request_size(self, messages: List[Dict[str, str]], function_name: str):
+        # Cheaper tier for short free-text answers, and the fallback when the
+        # main model is rate limited or failing
+        self.light_model = getattr(settings, "OPENAI_LIGHT_MODEL", "gpt-4o-mini")
+        self.context_tokens = getattr(settings, "OPENAI_CONTEXT_TOKENS", CONTEXT_TOKENS)
+
+    def _log_request_size(
+        self, messages: List[Dict[str, str]], function_name: str
+    ) -> Optional[float]:
         """
         Calculate and log the size of the OpenAI request in KB.
 
+        The payload is only serialized when debug logging is enabled.
+
         Args:
             messages: List of message dictionaries being sent to OpenAI
             function_name: Name of the function making the request
         """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return None
+
         # Convert messages to JSON string to get actual payload size
         messages_json = json.dumps(messages)
         size_bytes = sys.getsizeof(messages_json)
         size_kb = size_bytes / 1024
 
-        print(
-            f"[INFO] OpenAI Request Size [{function_name}]: {size_kb:.2f} KB ({size_bytes:,} bytes)"
-        )
-
-        # Also log character count which correlates to token count
+        # Character count correlates to token count
         total_chars = sum(len(msg.get("content", "")) for msg in messages)
-        print(
-            f"   Total characters in messages: {total_chars:,} (~{total_chars//4} tokens estimated)"
+        logger.debug(
+            "OpenAI request size [%s]: %.2f KB (%d bytes), %d chars (~%d tokens)",
+            function_name,
+            size_kb,
+            size_bytes,
+            total_chars,
+            total_chars // 4,
         )
 
         return size_kb
 
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens for the main model, or estimate them without tiktoken"""
+        return _count_tokens_for(self.model, text)
+
+    def _fit_prompt(
+        self,
+        system: str,
+        instructions: str,
+        build_prompt: Callable[[int], str],
+        list_tokens: int,
+        max_tokens: int,
+    ) -> str:
+        """
+        Build a prompt that fits the model's context window with room for the reply.
+
+        build_prompt takes a per-list token budget and returns instructions
+        followed by the request data. The budget is halved until the prompt
+        fits, so an oversized request is trimmed locally instead of failing
+        with a 400 after a full round-trip. Static text is counted once.
+        """
+        limit = self.context_tokens - CONTEXT_MARGIN_TOKENS - max_tokens
+        static_tokens = _count_static_tokens(self.model, system + instructions)
+        while True:
+            prompt = build_prompt(list_tokens)
+            prompt_tokens = static_tokens + self._count_tokens(
+                prompt[len(instructions) :]
+            )
+            if prompt_tokens <= limit or list_tokens <= MIN_LIST_TOKENS:
+                return prompt
+            logger.warning(
+                "Prompt of %d tokens exceeds %d, trimming result lists to %d tokens",
+                prompt_tokens,
+                limit,
+                list_tokens // 2,
+            )
+            list_tokens //= 2
+
+    def _fit_to_budget(
+        self,
+        items: Iterable[Dict[str, Any]],
+        target_tokens: int,
+        fields: Optional[Iterable[str]] = None,
+    ) -> str:
+        """Serialize as many leading items as fit within target_tokens"""
+        return _fit_items(self.model, items, target_tokens, fields)
+
+    def _create_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        use_cache: bool = True,
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> str:
+        """Run a chat completion and return the message content."""
+        content, _ = self._complete(
+            messages, temperature, max_tokens, use_cache, model, **kwargs
+        )
+        return content
+
+    def _complete(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        use_cache: bool = True,
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> tuple:
+        """
+        Run a chat completion and return (content, finish_reason).
+
+        Identical requests are answered from the Django cache so repeated
+        polling does not pay for another round-trip. Callers pass
+        use_cache=False when every call should produce fresh output.
+
+        If the requested model is rate limited or returns a server error the
+        request is retried once on the light model, since a degraded answer
+        still beats the non-AI fallback.
+        """
+        model = model or self.model
+        cache_timeout = getattr(
+            settings, "OPENAI_RESPONSE_CACHE_TIMEOUT", RESPONSE_CACHE_TIMEOUT
+        )
+        use_cache = use_cache and cache_timeout and temperature < UNCACHED_TEMPERATURE
+        if use_cache:
+            cache_key = self._get_cache_key(
+                model, messages, temperature, max_tokens, kwargs
+            )
+            content = cache.get(cache_key)
+            if content is not None:
+                # Only complete replies are cached
+                return content, "stop"
+
+        ladder = [model] if model == self.light_model else [model, self.light_model]
+        for candidate in ladder:
+            try:
+                response = self.client.chat.completions.create(
+                    model=candidate,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs,
+                )
+                break
+            except (RateLimitError, InternalServerError) as e:
+                if candidate == ladder[-1]:
+                    raise
+                logger.warning(
+                    "%s unavailable, retrying on %s: %s", candidate, ladder[-1], e
+                )
+        choice = response.choices[0]
+
+        # Truncated completions are usually invalid JSON, so only keep full ones;
+        # answers from the fallback model are not stored under the main key
+        if use_cache and candidate == model and choice.finish_reason == "stop":
+            cache.set(cache_key, choice.message.content, cache_timeout)
+        return choice.message.content, choice.finish_reason
+
+    def _parse_json_content(
+        self, content: str, max_tokens: int, truncated: bool = False
+    ) -> Any:
+        """
+        Parse a JSON completion, salvaging malformed replies where possible.
+
+        Local cleanup is tried first. Only if that fails is the reply sent back
+        for a one-message repair, which is far cheaper than rerunning the
+        original prompt. Replies cut off by max_tokens are never sent for
+        repair, since the model could only invent the missing content.
+        Raises json.JSONDecodeError if the reply cannot be salvaged.
+        """
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError as e:
+            error = e
+
+        result = _repair_json(content)
+        if result is not None:
+            return result
+        if truncated:
+            raise error
+
+        repaired = self._create_completion(
+            [
+                {"role": "system", "content": _SYSTEM_JSON_REPAIR},
+                {"role": "user", "content": content},
+            ],
+            temperature=0,
+            max_tokens=max_tokens,
+            model=self.light_model,
+            response_format={"type": "json_object"},
+        )
+        return json.loads(repaired)
+
+    def _get_cache_key(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        options: Dict[str, Any],
+    ) -> str:
+        """Build a cache key from everything that shapes the completion"""
+        payload = json.dumps(
+            {
+                "m": model,
+                "t": temperature,
+                "mx": max_tokens,
+                "o": options,
+                "msgs": messages,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+        return f"openai:completion:{digest}"
+
     def consolidate_travel_results(
         self,
         flight_results: List[Dict[str, Any]],
@@ -72,42 +667,57 @@ class OpenAIService:
             Dictionary containing consolidated and ranked results with AI recommendations
         """
 
-        # Prepare the prompt for OpenAI
-        prompt = self._create_consolidation_prompt(
-            flight_results, hotel_results, activity_results, user_preferences
+        # Nothing to rank, so don't spend a request on an empty prompt
+        if not (flight_results or hotel_results or activity_results):
+            return {
+                "summary": "No travel options were found for this search.",
+                "recommended_flights": [],
+                "recommended_hotels": [],
+                "recommended_activities": [],
+                "budget_analysis": {},
+                "itinerary_suggestions": [],
+                "warnings": ["The search returned no flights, hotels or activities."],
+            }
+
+        # Prepare the prompt for OpenAI, trimmed to fit the context window
+        prompt = self._fit_prompt(
+            _SYSTEM_CONSOLIDATOR,
+            _CONSOLIDATION_INSTRUCTIONS,
+            lambda list_tokens: self._create_consolidation_prompt(
+                flight_results,
+                hotel_results,
+                activity_results,
+                user_preferences,
+                list_tokens,
+            ),
+            list_tokens=CONSOLIDATION_LIST_TOKENS,
+            max_tokens=1000,
         )
 
         try:
             messages = [
-                {
-                    "role": "system",
-                    "content": (
-                        "You are an expert travel planner AI assistant. Your job is to analyze "
-                        "multiple travel options (flights, hotels, activities) and consolidate them "
-                        "into a coherent, ranked recommendation based on user preferences. "
-                        "Provide practical advice and explain your reasoning."
-                    ),
-                },
+                {"role": "system", "content": _SYSTEM_CONSOLIDATOR},
                 {"role": "user", "content": prompt},
             ]
 
             # Log request size
             self._log_request_size(messages, "consolidate_travel_results")
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
+            content, finish_reason = self._complete(
+                messages,
                 temperature=0.7,
                 max_tokens=1000,
                 response_format={"type": "json_object"},
             )
 
             # Parse the response
-            result = json.loads(response.choices[0].message.content)
+            result = self._parse_json_content(
+                content, max_tokens=1000, truncated=finish_reason == "length"
+            )
             return result
 
         except Exception as e:
-            print(f"Error calling OpenAI API: {str(e)}")
+            logger.warning("Error calling OpenAI API: %s", e)
             return {
                 "error": str(e),
                 "flights": flight_results,
@@ -121,66 +731,14 @@ class OpenAIService:
         hotels: List[Dict],
         activities: List[Dict],
         preferences: Dict,
+        budget: int = CONSOLIDATION_LIST_TOKENS,
     ) -> str:
         """Create a detailed prompt for OpenAI to consolidate travel results"""
 
-        prompt = f"""
-Please analyze the following travel options and provide consolidated recommendations.
-
-USER PREFERENCES:
-{json.dumps(preferences, indent=2)}
-
-FLIGHT OPTIONS ({len(flights)} results):
-{json.dumps(flights[:10], indent=2)}  # Limit to top 10 to save tokens
-
-HOTEL OPTIONS ({len(hotels)} results):
-{json.dumps(hotels[:10], indent=2)}  # Limit to top 10
-
-ACTIVITY OPTIONS ({len(activities)} results):
-{json.dumps(activities[:10], indent=2)}  # Limit to top 10
-
-Please provide a JSON response with the following structure:
-{{
-    "summary": "Brief overview of the best options considering all preferences",
-    "recommended_flights": [
-        {{
-            "rank": 1,
-            "flight_id": "id from original data",
-            "reason": "Why this flight is recommended",
-            "score": 95
-        }}
-    ],
-    "recommended_hotels": [
-        {{
-            "rank": 1,
-            "hotel_id": "id from original data",
-            "reason": "Why this hotel is recommended",
-            "score": 90
-        }}
-    ],
-    "recommended_activities": [
-        {{
-            "rank": 1,
-            "activity_id": "id from original data",
-            "reason": "Why this activity is recommended",
-            "score": 88
-        }}
-    ],
-    "budget_analysis": {{
-        "estimated_total": "Estimated total cost",
-        "breakdown": "Cost breakdown",
-        "savings_tips": "Tips for saving money"
-    }},
-    "itinerary_suggestions": [
-        "Suggested day-by-day itinerary combining selected options"
-    ],
-    "warnings": ["Any concerns or warnings about the selections"]
-}}
-
-Rank items by how well they match the preferences, with scores from 0-100.
-Include only the top 5 recommendations for each category.
-"""
-        return prompt
+        payload = _compact_json([flights, hotels, activities, preferences])
+        return _CONSOLIDATION_INSTRUCTIONS + _consolidation_data(
+            self.model, budget, payload
+        )
 
     def generate_three_itinerary_options(
         self,
@@ -206,36 +764,21 @@ Include only the top 5 recommendations for each category.
             Dictionary containing 5-8 different itinerary options with reasoning
         """
 
-        # Calculate budget statistics from all members
-        budgets = []
-        for pref in member_preferences:
-            budget_val = pref.get("budget", "0")
-            budget_str = str(budget_val)  # Ensure it's a string for processing
-            # Handle both string and numeric budgets, remove $ and commas
-            if isinstance(budget_str, str):
-                budget_str = budget_str.replace("$", "").replace(",", "").strip()
-            try:
-                budget = float(budget_str)
-                if budget > 0:
-                    budgets.append(budget)
-            except (ValueError, TypeError):
-                continue
-
-        # Calculate min, median, max budgets
-        if budgets:
-            budgets.sort()
-            min_budget = budgets[0]
-            max_budget = budgets[-1]
-            median_budget = (
-                budgets[len(budgets) // 2]
-                if len(budgets) > 0
-                else sum(budgets) / len(budgets)
-            )
-        else:
-            # Fallback if no budgets found
-            min_budget = 1000
-            median_budget = 3000
-            max_budget = 5000
+        # Without search results the model has nothing to choose from; this is
+        # the same empty result the manual generator gives with no combinations
+        if not (flight_results or hotel_results or activity_results):
+            return {
+                "options": [],
+                "voting_guidance": "No travel options were found for this search.",
+                "consensus_summary": (
+                    "The search returned no flights, hotels or activities."
+                ),
+            }
+
+        # Calculate min, median, max budgets from all members
+        budgets, min_budget, median_budget, max_budget = _calculate_budget_stats(
+            tuple(str(pref.get("budget", "0")) for pref in member_preferences)
+        )
 
         # Extract unique destinations if not provided
         if unique_destinations is None:
@@ -248,17 +791,27 @@ Include only the top 5 recommendations for each category.
         # Build date info string
         date_info = ""
         if selected_dates:
-            date_info = f"Dates: {selected_dates.get('start_date')} to {selected_dates.get('end_date')} ({selected_dates.get('duration_days')}d). Match these dates."
-        
+            date_info = _DATES_TMPL.substitute(
+                start=selected_dates.get("start_date"),
+                end=selected_dates.get("end_date"),
+                days=selected_dates.get("duration_days"),
+            )
+
         # Build destination requirement string
         destination_requirement = ""
         if unique_destinations and len(unique_destinations) > 1:
             min_options_per_dest = 3
-            total_min_options = len(unique_destinations) * min_options_per_dest
-            destination_requirement = f"\n\n🚨 CRITICAL DESTINATION DISTRIBUTION REQUIREMENT 🚨\n- You have {len(unique_destinations)} DIFFERENT destinations: {', '.join(unique_destinations)}\n- You MUST create at least {min_options_per_dest} options for EACH destination\n- DO NOT create all options for the same destination - you MUST distribute across ALL destinations\n- Example: If destinations are [Paris, Tokyo], create at least 3 options for Paris AND at least 3 options for Tokyo\n- Each destination's options should vary in budget (budget, balanced, premium)\n- Use the 'searched_destination' field in flight/hotel data to match destinations correctly\n- Minimum total: {total_min_options} options (at least {min_options_per_dest} per destination), maximum: 8 total"
+            destination_requirement = _MULTI_DESTINATION_TMPL.substitute(
+                count=len(unique_destinations),
+                destinations=", ".join(unique_destinations),
+                per_destination=min_options_per_dest,
+                min_total=len(unique_destinations) * min_options_per_dest,
+            )
         elif unique_destinations and len(unique_destinations) == 1:
             # Single destination - just ensure variety
-            destination_requirement = f"\n- Create 5-8 diverse options for {unique_destinations[0]} with different budget tiers"
+            destination_requirement = _SINGLE_DESTINATION_TMPL.substitute(
+                destination=unique_destinations[0]
+            )
 
         # OPTIMIZATION: Summarize member preferences concisely
         member_summary = []
@@ -272,222 +825,81 @@ Include only the top 5 recommendations for each category.
                 f"{pref.get('user', 'M')}: ${pref.get('budget', '?')}, {pref.get('destination', '?')}, {activities}"
             )
 
-        # OPTIMIZATION: Ultra-compact data - only critical fields
-        flights_compact = [
-            {
-                "id": f.get("id"),
-                "to": f.get("searched_destination", "")[:20],
-                "$": f.get("total_amount"),
-            }
-            for f in flight_results[:5]
-        ]
-
-        hotels_compact = [
-            {
-                "id": h.get("id"),
-                "name": h.get("name", "")[:25],
-                "to": h.get("searched_destination", "")[:20],
-                "$": h.get("price_per_night"),
-            }
-            for h in hotel_results[:5]
-        ]
-
-        activities_compact = [
-            {
-                "id": a.get("id"),
-                "name": a.get("name", "")[:30],
-                "to": a.get("searched_destination", "")[:20],
-                "$": a.get("price"),
-            }
-            for a in activity_results[:6]
-        ]
-
-        prompt = f"""Analyze {len(member_preferences)} members' travel preferences. Create 5-8 diverse itinerary options for voting.
-
+        def build_prompt(list_tokens: int) -> str:
+            return _ITINERARY_OPTIONS_INSTRUCTIONS + f"""
+GROUP: {len(member_preferences)} members
 {date_info}
 MEMBERS: {member_summary}
 BUDGETS: Low=${min_budget:.2f}, Med=${median_budget:.2f}, High=${max_budget:.2f}
+{destination_requirement}
 
 DATA:
-{json.dumps(member_preferences, indent=2)}
-{json.dumps(flight_results[:5], indent=2)}
-{json.dumps(hotel_results[:5], indent=2)}
-{json.dumps(activity_results[:8], indent=2)}
+{_compact_json(member_preferences)}
+{self._fit_to_budget(flight_results, list_tokens, FLIGHT_PROMPT_FIELDS)}
+{self._fit_to_budget(hotel_results, list_tokens, HOTEL_PROMPT_FIELDS)}
+{self._fit_to_budget(activity_results, list_tokens, ACTIVITY_PROMPT_FIELDS)}
+"""
 
-REQUIREMENTS:
-- Balance ALL {len(member_preferences)} members' preferences
-{destination_requirement}
-- Create 5-8 DIVERSE options with different destinations, budgets, and styles
-- CRITICAL: If there are multiple unique destinations, you MUST create options for EACH destination - do not put all options in one destination
-- Use DIFFERENT destinations per option when multiple destinations exist (check "searched_destination" field in flight/hotel data)
-- Vary budgets: some at ${min_budget:.2f}, some at ${median_budget:.2f}, some at ${max_budget:.2f}
-- Include options that prioritize different members' preferences
-- Explain which member's destination each option prioritizes
+        prompt = self._fit_prompt(
+            _SYSTEM_ITINERARY_OPTIONS,
+            _ITINERARY_OPTIONS_INSTRUCTIONS,
+            build_prompt,
+            list_tokens=ITINERARY_OPTIONS_LIST_TOKENS,
+            max_tokens=2000,
+        )
 
-JSON OUTPUT:
-{{"options":[{{"option_letter":"A","title":"...","description":"1-2 sentences","intended_destination":"exact destination name from searched_destination field","selected_flight_id":"exact id","selected_hotel_id":"exact id","selected_activity_ids":["exact ids"],"estimated_total_cost":0.00,"cost_per_person":0.00,"ai_reasoning":"Why this works for ALL members","compromise_explanation":"How this addresses EACH member by name","pros":["...","...","..."],"cons":["...","..."]}},{{"option_letter":"B",...}},{{"option_letter":"C",...}},{{"option_letter":"D",...}},{{"option_letter":"E",...}},{{"option_letter":"F",...}},{{"option_letter":"G",...}},{{"option_letter":"H",...}}],
-"voting_guidance":"...","consensus_summary":"..."}}
-
-CRITICAL: Generate 5-8 options (use letters A-H). Use ONLY exact IDs from provided data. Mention ALL {len(member_preferences)} members in reasoning. Vary budgets and destinations. {destination_requirement}"""
-
-        # Log budget analysis for debugging
-        print(f"\n💰 BUDGET ANALYSIS:")
-        print(f"   All member budgets: {budgets}")
-        print(f"   Min Budget: ${min_budget:.2f}")
-        print(f"   Median Budget: ${median_budget:.2f}")
-        print(f"   Max Budget: ${max_budget:.2f}")
-        print(f"\n📋 MEMBER PREFERENCES:")
-        for i, pref in enumerate(member_preferences, 1):
-            print(
-                f"   {i}. {pref.get('user')}: ${pref.get('budget')} - {pref.get('destination')} - {pref.get('activity_preferences', '')[:50]}..."
-            )
+        logger.debug(
+            "Itinerary options: members=%d budgets=%s min=%.2f median=%.2f max=%.2f",
+            len(member_preferences),
+            budgets,
+            min_budget,
+            median_budget,
+            max_budget,
+        )
 
         try:
-            system_message = "Travel AI: Create 5-8 diverse itinerary options balancing all group preferences. "
-            if unique_destinations and len(unique_destinations) > 1:
-                system_message += f"CRITICAL: You have {len(unique_destinations)} different destinations ({', '.join(unique_destinations)}). You MUST create options for EACH destination - do not put all options in one destination. "
-            system_message += "Return valid JSON matching exact structure."
-            
             messages = [
-                {
-                    "role": "system",
-                    "content": system_message,
-                },
+                {"role": "system", "content": _SYSTEM_ITINERARY_OPTIONS},
                 {"role": "user", "content": prompt},
             ]
 
             # Log request size
             self._log_request_size(messages, "generate_three_itinerary_options")
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
+            # Voting options are regenerated on demand, so always ask for fresh ones
+            content, finish_reason = self._complete(
+                messages,
                 temperature=0.7,  # Reduced for more consistent results
                 max_tokens=2000,  # Increased for detailed responses
+                use_cache=False,
                 response_format={"type": "json_object"},
                 timeout=180,  # Increased timeout to 90 seconds
             )
 
-            content = response.choices[0].message.content
-
-            # Try to parse JSON, with fallback cleaning
             try:
-                result = json.loads(content)
-            except json.JSONDecodeError as json_error:
-                print(f"JSON parse error: {str(json_error)}")
-                print(f"Error at line {json_error.lineno}, column {json_error.colno}")
-                print(f"Response content length: {len(content)}")
-                print(f"Response content (first 1000 chars):\n{content[:1000]}")
-                if len(content) > 1000:
-                    print(f"Response content (last 500 chars):\n{content[-500:]}")
-
-                # Try to fix common JSON issues
-                try:
-                    # Remove markdown code blocks if present
-                    cleaned_content = content
-                    if "```json" in cleaned_content:
-                        cleaned_content = (
-                            cleaned_content.split("```json")[1].split("```")[0].strip()
-                        )
-                    elif "```" in cleaned_content:
-                        cleaned_content = (
-                            cleaned_content.split("```")[1].split("```")[0].strip()
-                        )
-
-                    # Try parsing the cleaned content first
-                    try:
-                        result = json.loads(cleaned_content)
-                        print("✅ Successfully parsed after removing markdown")
-                    except json.JSONDecodeError as inner_error:
-                        print(
-                            f"Still failed after markdown removal: {str(inner_error)}"
-                        )
-                        # If that fails, try to extract JSON object using a more robust method
-                        import re
-
-                        # Find the first { and try to match balanced braces
-                        start_idx = cleaned_content.find("{")
-                        if start_idx != -1:
-                            # Count braces to find the matching closing brace
-                            brace_count = 0
-                            end_idx = start_idx
-                            for i in range(start_idx, len(cleaned_content)):
-                                if cleaned_content[i] == "{":
-                                    brace_count += 1
-                                elif cleaned_content[i] == "}":
-                                    brace_count -= 1
-                                    if brace_count == 0:
-                                        end_idx = i + 1
-                                        break
-
-                            if brace_count == 0:
-                                json_str = cleaned_content[start_idx:end_idx]
-                                # Try to fix common issues in the extracted JSON
-                                # Fix trailing commas before closing braces/brackets
-                                json_str = re.sub(r",\s*}", "}", json_str)
-                                json_str = re.sub(r",\s*]", "]", json_str)
-                                # Try parsing
-                                try:
-                                    result = json.loads(json_str)
-                                    print(
-                                        "✅ Successfully extracted and parsed JSON using balanced brace matching"
-                                    )
-                                except json.JSONDecodeError as parse_error:
-                                    print(
-                                        f"Failed to parse extracted JSON: {str(parse_error)}"
-                                    )
-                                    print(
-                                        f"Extracted JSON (first 500 chars): {json_str[:500]}"
-                                    )
-                                    return self._build_fallback_itinerary_options(
-                                        member_preferences,
-                                        flight_results,
-                                        hotel_results,
-                                        activity_results,
-                                        selected_dates,
-                                        str(json_error),
-                                    )
-                            else:
-                                print("Could not find balanced braces in response")
-                                return self._build_fallback_itinerary_options(
-                                    member_preferences,
-                                    flight_results,
-                                    hotel_results,
-                                    activity_results,
-                                    selected_dates,
-                                    str(json_error),
-                                )
-                        else:
-                            print("Could not find opening brace in response")
-                            return self._build_fallback_itinerary_options(
-                                member_preferences,
-                                flight_results,
-                                hotel_results,
-                                activity_results,
-                                selected_dates,
-                                str(json_error),
-                            )
-                except Exception as fix_error:
-                    print(f"Failed to fix JSON: {str(fix_error)}")
-                    import traceback
-
-                    print(traceback.format_exc())
-                    return self._build_fallback_itinerary_options(
-                        member_preferences,
-                        flight_results,
-                        hotel_results,
-                        activity_results,
-                        selected_dates,
-                        str(json_error),
-                    )
+                result = self._parse_json_content(
+                    content, max_tokens=2000, truncated=finish_reason == "length"
+                )
+            except Exception as json_error:
+                logger.warning(
+                    "JSON parse error: %s (response length %d, starts %r)",
+                    json_error,
+                    len(content),
+                    content[:1000],
+                )
+                return self._build_fallback_itinerary_options(
+                    member_preferences,
+                    flight_results,
+                    hotel_results,
+                    activity_results,
+                    selected_dates,
+                    str(json_error),
+                )
 
             return result
 
         except Exception as e:
-            print(f"Error generating itinerary options: {str(e)}")
-            import traceback
-
-            print(traceback.format_exc())
+            logger.exception("Error generating itinerary options: %s", e)
             raise
 
     def _build_fallback_itinerary_options(
@@ -705,77 +1117,87 @@ CRITICAL: Generate 5-8 options (use letters A-H). Use ONLY exact IDs from provid
             Dictionary containing consensus preferences and recommendations
         """
 
-        prompt = f"""
-Analyze the following travel preferences from {len(member_preferences)} group members and find the best consensus.
+        # A group of one has nothing to reconcile
+        if len(member_preferences) <= 1:
+            return self._passthrough_consensus(member_preferences)
 
-GROUP MEMBER PREFERENCES:
-{json.dumps(member_preferences, indent=2)}
-
-Please provide a JSON response with:
-{{
-    "consensus_preferences": {{
-        "destination": "Most agreed upon or best compromise destination",
-        "date_range": "Optimal date range considering all preferences",
-        "budget_range": "Budget range that works for everyone",
-        "accommodation_type": "Best accommodation type for the group",
-        "activities": ["Activities that most members would enjoy"],
-        "dietary_accommodations": ["Dietary restrictions to consider"],
-        "accessibility_needs": ["Accessibility requirements to consider"]
-    }},
-    "compromise_areas": [
-        {{
-            "aspect": "What aspect requires compromise",
-            "options": ["Possible compromise solutions"],
-            "recommendation": "Best compromise solution"
-        }}
-    ],
-    "unanimous_preferences": ["Things everyone agrees on"],
-    "conflicting_preferences": [
-        {{
-            "aspect": "What's in conflict",
-            "members_affected": ["Members with this preference"],
-            "suggestion": "How to resolve"
-        }}
-    ],
-    "group_dynamics_notes": "Notes about group compatibility and suggestions"
-}}
+        prompt = _GROUP_CONSENSUS_INSTRUCTIONS + f"""
+GROUP MEMBER PREFERENCES ({len(member_preferences)} members):
+{_compact_json(member_preferences)}
 """
 
         try:
             messages = [
-                {
-                    "role": "system",
-                    "content": (
-                        "You are an expert group travel coordinator. Your job is to analyze "
-                        "multiple people's travel preferences and find the best consensus that "
-                        "satisfies the group while being fair and practical."
-                    ),
-                },
+                {"role": "system", "content": _SYSTEM_GROUP_COORDINATOR},
                 {"role": "user", "content": prompt},
             ]
 
             # Log request size
             self._log_request_size(messages, "generate_group_consensus")
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
+            content, finish_reason = self._complete(
+                messages,
                 temperature=0.7,
                 max_tokens=1500,
                 response_format={"type": "json_object"},
             )
 
-            result = json.loads(response.choices[0].message.content)
+            result = self._parse_json_content(
+                content, max_tokens=1500, truncated=finish_reason == "length"
+            )
             return result
 
         except Exception as e:
-            print(f"Error generating group consensus: {str(e)}")
+            logger.warning("Error generating group consensus: %s", e)
             return {
                 "error": str(e),
                 "consensus_preferences": {},
                 "note": "Unable to generate consensus due to error",
             }
 
+    def _passthrough_consensus(
+        self, member_preferences: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Return a single member's preferences in the consensus response shape."""
+
+        if not member_preferences:
+            return {
+                "consensus_preferences": {},
+                "compromise_areas": [],
+                "unanimous_preferences": [],
+                "conflicting_preferences": [],
+                "group_dynamics_notes": "No member preferences were submitted.",
+            }
+
+        pref = member_preferences[0]
+        activities = pref.get("activity_preferences") or []
+        if isinstance(activities, str):
+            activities = [a.strip() for a in activities.split(",") if a.strip()]
+
+        date_range = ""
+        if pref.get("start_date") and pref.get("end_date"):
+            date_range = f"{pref['start_date']} to {pref['end_date']}"
+
+        return {
+            "consensus_preferences": {
+                "destination": pref.get("destination", ""),
+                "date_range": date_range,
+                "budget_range": str(pref.get("budget", "")),
+                "accommodation_type": pref.get("accommodation_preference", ""),
+                "activities": activities,
+                "dietary_accommodations": [
+                    v for v in [pref.get("dietary_restrictions")] if v
+                ],
+                "accessibility_needs": [
+                    v for v in [pref.get("accessibility_needs")] if v
+                ],
+            },
+            "compromise_areas": [],
+            "unanimous_preferences": [],
+            "conflicting_preferences": [],
+            "group_dynamics_notes": "Only one member has submitted preferences.",
+        }
+
     def create_itinerary_description(
         self,
         destination: str,
@@ -797,52 +1219,50 @@ Please provide a JSON response with:
         """
 
         prefs_text = (
-            json.dumps(preferences, indent=2)
-            if preferences
-            else "No specific preferences"
+            _compact_json(preferences) if preferences else "No specific preferences"
         )
 
-        prompt = f"""
-Create an engaging, detailed itinerary description for a {duration_days}-day trip to {destination}.
-
+        prompt = _ITINERARY_DESCRIPTION_INSTRUCTIONS + f"""
+Trip: {duration_days} days in {destination}
 Activities to include: {', '.join(activities)}
 User preferences: {prefs_text}
-
-Generate a compelling description that:
-1. Provides a day-by-day overview
-2. Highlights unique experiences
-3. Includes practical tips
-4. Mentions dining and accommodation suggestions
-5. Is enthusiastic but realistic
-
-Keep it under 300 words and make it inspiring!
 """
 
         try:
             messages = [
-                {
-                    "role": "system",
-                    "content": "You are a creative travel writer who creates inspiring itinerary descriptions.",
-                },
+                {"role": "system", "content": _SYSTEM_TRAVEL_WRITER},
                 {"role": "user", "content": prompt},
             ]
 
             # Log request size
             self._log_request_size(messages, "generate_itinerary_description")
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.8,
-                max_tokens=500,
+            content = self._create_completion(
+                messages, temperature=0.8, max_tokens=500, model=self.light_model
             )
 
-            return response.choices[0].message.content.strip()
+            return content.strip()
 
         except Exception as e:
-            print(f"Error generating itinerary description: {str(e)}")
+            logger.warning("Error generating itinerary description: %s", e)
             return f"Explore {destination} over {duration_days} days with exciting activities including {', '.join(activities)}."
 
+    def _travel_question_messages(
+        self, question: str, context: Optional[Dict] = None
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages shared by the plain and streaming answers"""
+        context_text = _compact_json(context) if context else "No specific context"
+
+        prompt = _TRAVEL_QUESTION_INSTRUCTIONS + f"""
+Context: {context_text}
+
+Question: {question}
+"""
+        return [
+            {"role": "system", "content": _SYSTEM_TRAVEL_ADVISOR},
+            {"role": "user", "content": prompt},
+        ]
+
     def answer_travel_question(
         self, question: str, context: Optional[Dict] = None
     ) -> str:
@@ -857,42 +1277,55 @@ Keep it under 300 words and make it inspiring!
             AI-generated answer
         """
 
-        context_text = (
-            json.dumps(context, indent=2) if context else "No specific context"
-        )
+        try:
+            messages = self._travel_question_messages(question, context)
 
-        prompt = f"""
-Context: {context_text}
+            # Log request size
+            self._log_request_size(messages, "answer_travel_question")
 
-Question: {question}
+            content = self._create_completion(
+                messages, temperature=0.7, max_tokens=500, model=self.light_model
+            )
 
-Please provide a helpful, accurate answer to this travel question.
-"""
+            return content.strip()
 
-        try:
-            messages = [
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a knowledgeable travel advisor. Provide accurate, helpful "
-                        "information about travel destinations, planning, and logistics."
-                    ),
-                },
-                {"role": "user", "content": prompt},
-            ]
+        except Exception as e:
+            logger.warning("Error answering question: %s", e)
+            return TRAVEL_QUESTION_ERROR_MESSAGE
 
-            # Log request size
-            self._log_request_size(messages, "answer_travel_question")
+    def answer_travel_question_stream(
+        self, question: str, context: Optional[Dict] = None
+    ) -> Iterator[str]:
+        """
+        Answer a travel question, yielding text as the model produces it.
+
+        Suitable for a StreamingHttpResponse, so the first words reach the
+        user without waiting for the whole answer. Streamed answers are not
+        cached.
 
-            response = self.client.chat.completions.create(
-                model=self.model,
+        Args:
+            question: User's question
+            context: Optional context about the trip/search
+
+        Yields:
+            Fragments of the AI-generated answer
+        """
+
+        messages = self._travel_question_messages(question, context)
+        self._log_request_size(messages, "answer_travel_question_stream")
+
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.light_model,
                 messages=messages,
                 temperature=0.7,
                 max_tokens=500,
+                stream=True,
             )
-
-            return response.choices[0].message.content.strip()
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
 
         except Exception as e:
-            print(f"Error answering question: {str(e)}")
-            return "I apologize, but I'm unable to answer that question at the moment. Please try again later."
+            logger.warning("Error streaming answer: %s", e)
+            yield TRAVEL_QUESTION_ERROR_MESSAGE
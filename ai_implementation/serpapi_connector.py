@@ -5,22 +5,219 @@ Documentation: https://serpapi.com/google-flights-api
 """
 
 import os
-import requests
+import re
 import json
+import random
+import logging
+import requests
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Default for settings.SERPAPI_FLIGHT_CACHE_TIMEOUT (seconds)
+FLIGHT_CACHE_TIMEOUT = 600
+
+# Google Flights accepts between 1 and 9 adult passengers per search
+MAX_ADULTS = 9
+
+# Shared read-only fallback for optional nested objects in API payloads
+_EMPTY: Dict[str, Any] = {}
+
+# Normalized (title-cased) cabin names mapped to the classes we display
+_BOOKING_CLASS_MAP = {
+    "Economy": "Economy",
+    "Premium Economy": "Premium Economy",
+    "Business": "Business",
+    "First": "First",
+    "First Class": "First",
+    "Business Class": "Business",
+    "Premium": "Premium Economy",
+    "Coach": "Economy",
+}
+
+# Three-letter IATA airport code, e.g. "JFK"
+_IATA_CODE_RE = re.compile(r"[A-Z]{3}")
+
+# Expanded airport code mapping
+# Includes major cities and regions
+_CITY_TO_IATA = {
+    # US Cities
+    "new york": "JFK",
+    "los angeles": "LAX",
+    "chicago": "ORD",
+    "miami": "MIA",
+    "san francisco": "SFO",
+    "las vegas": "LAS",
+    "boston": "BOS",
+    "seattle": "SEA",
+    "atlanta": "ATL",
+    "dallas": "DFW",
+    "denver": "DEN",
+    "houston": "IAH",
+    "phoenix": "PHX",
+    "philadelphia": "PHL",
+    "san diego": "SAN",
+    "minneapolis": "MSP",
+    "detroit": "DTW",
+    "portland": "PDX",
+    # European Cities
+    "london": "LHR",
+    "paris": "CDG",
+    "rome": "FCO",
+    "madrid": "MAD",
+    "barcelona": "BCN",
+    "amsterdam": "AMS",
+    "berlin": "BER",
+    "munich": "MUC",
+    "frankfurt": "FRA",
+    "vienna": "VIE",
+    "zurich": "ZRH",
+    "milan": "MXP",
+    "istanbul": "IST",
+    "dublin": "DUB",
+    "lisbon": "LIS",
+    "athens": "ATH",
+    "prague": "PRG",
+    # Italian regions/cities - map regions to major airports
+    "sicily": "PMO",  # Palermo - main airport in Sicily
+    "sicilia": "PMO",
+    "tuscany": "FLR",  # Florence
+    "toscana": "FLR",
+    "venice": "VCE",
+    "venezia": "VCE",
+    "naples": "NAP",
+    "napoli": "NAP",
+    "bologna": "BLQ",
+    # Canadian provinces/cities
+    "alberta": "YYC",  # Calgary - major airport in Alberta
+    "calgary": "YYC",
+    "edmonton": "YEG",
+    "toronto": "YYZ",
+    "vancouver": "YVR",
+    "montreal": "YUL",
+    "ottawa": "YOW",
+    "quebec": "YQB",
+    "winnipeg": "YWG",
+    # Asian Cities
+    "tokyo": "NRT",
+    "beijing": "PEK",
+    "shanghai": "PVG",
+    "hong kong": "HKG",
+    "singapore": "SIN",
+    "bangkok": "BKK",
+    "seoul": "ICN",
+    "delhi": "DEL",
+    "mumbai": "BOM",
+    "dubai": "DXB",
+    "doha": "DOH",
+    "abu dhabi": "AUH",
+    # Other Major Cities
+    "sydney": "SYD",
+    "melbourne": "MEL",
+    "auckland": "AKL",
+    "cairo": "CAI",
+    "johannesburg": "JNB",
+    "cape town": "CPT",
+    "mexico city": "MEX",
+    "sao paulo": "GRU",
+    "rio de janeiro": "GIG",
+    "buenos aires": "EZE",
+    "lima": "LIM",
+}
+
+# Phrases in SerpApi error messages that mean the API key was rejected
+_AUTH_ERROR_KEYWORDS = (
+    "invalid api key",
+    "invalid authentication",
+    "authorization",
+    "inactive account",
+    "missing api key",
+)
+
+# Static tables for mock data, built once instead of on every call
+_MOCK_AIRLINES = (
+    {"code": "AA", "name": "American Airlines"},
+    {"code": "UA", "name": "United Airlines"},
+    {"code": "DL", "name": "Delta Air Lines"},
+    {"code": "SW", "name": "Southwest Airlines"},
+    {"code": "B6", "name": "JetBlue Airways"},
+    {"code": "AS", "name": "Alaska Airlines"},
+    {"code": "WN", "name": "Southwest Airlines"},
+    {"code": "NK", "name": "Spirit Airlines"},
+)
+_MOCK_BOOKING_CLASSES = ("Economy", "Premium Economy", "Business")
+
+_MOCK_ACTIVITY_TYPES = {
+    "museums": ("Museum Tour", "Art Gallery Visit", "Historical Site Tour"),
+    "outdoor": ("Hiking Tour", "Bike Rental", "Beach Activities", "Nature Walk"),
+    "food": ("Food Tour", "Cooking Class", "Wine Tasting", "Restaurant Tour"),
+    "adventure": ("Zip Lining", "Rock Climbing", "Kayaking", "Parasailing"),
+    "culture": (
+        "City Walking Tour",
+        "Theater Show",
+        "Music Concert",
+        "Local Market Visit",
+    ),
+    "default": ("City Tour", "Sightseeing", "Local Experience"),
+}
+_MOCK_ACTIVITY_CATEGORIES = tuple(_MOCK_ACTIVITY_TYPES)
+_MOCK_ACTIVITY_INCLUDED = (
+    "Guide, Equipment",
+    "Tickets, Transportation",
+    "Meals, Guide",
+    "Equipment only",
+)
+_MOCK_ACTIVITY_CANCELLATION = (
+    "Free cancellation up to 24h",
+    "Non-refundable",
+    "50% refund",
+)
+_MOCK_ACTIVITY_LANGUAGES = ("English", "Spanish", "French", "German")
 
 
 class SerpApiConnectorError(Exception):
     """Raised when SerpApi Google Flights searches fail."""
 
 
+def _create_session() -> requests.Session:
+    """
+    Create a pooled HTTP session for serpapi.com that keeps TLS connections
+    alive between searches and retries rate-limited and transient server
+    errors with exponential backoff.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods={"GET"},
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry),
+    )
+    return session
+
+
+# All SerpApi connectors talk to the same host, so they share one
+# connection pool instead of opening a new connection per call
+_SESSION = _create_session()
+
+
 class SerpApiFlightsConnector:
     """
     Connector for SerpApi Google Flights search.
     """
 
+    __slots__ = ("api_key", "base_url", "timeout", "session", "headers")
+
     def __init__(self):
         """Initialize SerpApi client"""
         # Get API key from environment variable first
@@ -36,10 +233,11 @@ class SerpApiFlightsConnector:
 
         self.base_url = "https://serpapi.com/search.json"
         self.timeout = 30
+        self.session = _SESSION
 
         # Note: API key is now set, but if it becomes empty somehow, warn
         if not self.api_key:
-            print("WARNING: SerpApi API key not configured. Using mock data.")
+            logger.warning("SerpApi API key not configured. Using mock data.")
 
         self.headers = {
             "Accept": "application/json",
@@ -71,12 +269,27 @@ class SerpApiFlightsConnector:
         """
 
         if not self.api_key:
-            print("[WARNING] SerpApi API key not configured - using mock flight data")
-            print("[WARNING] To get real flight data, set SERP_API_KEY environment variable")
+            logger.warning("SerpApi API key not configured - using mock flight data")
+            logger.warning(
+                "To get real flight data, set SERP_API_KEY environment variable"
+            )
             return self._get_mock_flight_data(
                 origin, destination, departure_date, return_date, adults, max_results
             )
 
+        # Serve repeated searches for the same route from the cache
+        adults = min(max(int(adults), 1), MAX_ADULTS)
+        cache_timeout = getattr(
+            settings, "SERPAPI_FLIGHT_CACHE_TIMEOUT", FLIGHT_CACHE_TIMEOUT
+        )
+        cache_key = self._get_cache_key(
+            origin, destination, departure_date, return_date, adults
+        )
+        if cache_timeout:
+            cached_flights = cache.get(cache_key)
+            if cached_flights is not None:
+                return cached_flights[:max_results]
+
         try:
             # Format dates for SerpApi (YYYY-MM-DD format)
             # SerpApi Google Flights uses departure_id and arrival_id for airport codes or city names
@@ -101,22 +314,27 @@ class SerpApiFlightsConnector:
 
             # Note: Do not log params or API key for security compliance (CodeQL security requirement)
             # Only log non-sensitive search information
-            print(
-                f"Searching SerpApi Google Flights: {origin} -> {destination} on {departure_date}"
+            logger.info(
+                "Searching SerpApi Google Flights: %s -> %s on %s",
+                origin,
+                destination,
+                departure_date,
             )
 
-            response = requests.get(
+            response = self.session.get(
                 self.base_url, params=params, headers=self.headers, timeout=self.timeout
             )
 
             # Check for API errors in response
             if response.status_code != 200:
                 error_body = response.text[:500] if hasattr(response, 'text') else "N/A"
-                print(f"  [ERROR] SerpApi returned status code {response.status_code}")
-                print(f"  [ERROR] Response body: {error_body}")
+                logger.warning("SerpApi returned status code %s", response.status_code)
+                logger.warning("Response body: %s", error_body)
 
                 if response.status_code in {401, 403}:
-                    print(f"  [ERROR] Authentication failed - check SERP_API_KEY is valid")
+                    logger.warning(
+                        "Authentication failed - check SERP_API_KEY is valid"
+                    )
                     return self._use_mock_flight_data_with_reason(
                         "Unauthorized SerpApi response (401/403)",
                         origin,
@@ -134,20 +352,22 @@ class SerpApiFlightsConnector:
             data = response.json()
 
             # Log response structure for debugging
-            print(f"  [DEBUG] SerpApi response keys: {list(data.keys())[:10]}")
+            logger.debug("SerpApi response keys: %s", list(data.keys())[:10])
 
             # Check for errors in the JSON response
             if "error" in data:
                 error_msg = data.get("error", "Unknown error")
-                print(f"  [ERROR] SerpApi API error: {error_msg}")
+                logger.warning("SerpApi API error: %s", error_msg)
                 
                 # Log additional error details if available
                 if isinstance(data.get("error"), dict):
                     error_details = data.get("error", {})
-                    print(f"  [ERROR] Error details: {json.dumps(error_details, indent=2)}")
+                    logger.warning(
+                        "Error details: %s", json.dumps(error_details, indent=2)
+                    )
 
                 if self._is_authentication_error_message(error_msg):
-                    print(f"  [ERROR] Authentication error detected - check SERP_API_KEY")
+                    logger.warning("Authentication error detected - check SERP_API_KEY")
                     return self._use_mock_flight_data_with_reason(
                         "SerpApi authentication error",
                         origin,
@@ -165,34 +385,50 @@ class SerpApiFlightsConnector:
             )
 
             if not flights:
-                print(f"  [ERROR] No flights found in SerpApi response")
-                print(
-                    f"  [DEBUG] Response structure: {json.dumps({k: str(type(v).__name__) for k, v in list(data.items())[:10]}, indent=2)}"
+                logger.warning("No flights found in SerpApi response")
+                logger.debug(
+                    "Response structure: %s",
+                    json.dumps(
+                        {k: str(type(v).__name__) for k, v in list(data.items())[:10]},
+                        indent=2,
+                    ),
                 )
                 raise SerpApiConnectorError("No flights found in SerpApi response")
 
-            print(f"  [SUCCESS] Found {len(flights)} flights from SerpApi")
+            logger.info("Found %s flights from SerpApi", len(flights))
+            # Only real results are cached so a transient failure is retried
+            if cache_timeout and not flights[0].get("is_mock"):
+                cache.set(cache_key, flights, cache_timeout)
             return flights[:max_results]
 
         except requests.exceptions.RequestException as e:
-            from django.conf import settings
-
-            print(f"  [ERROR] SerpApi request error: Request failed")
-            if settings.DEBUG:
-                import traceback
-
-                print(traceback.format_exc())
+            # Only include the traceback in DEBUG mode to avoid exposing internals
+            logger.warning(
+                "SerpApi request error: Request failed", exc_info=settings.DEBUG
+            )
             raise SerpApiConnectorError("SerpApi request failed") from e
         except Exception as e:
-            from django.conf import settings
-
-            print(f"  [ERROR] SerpApi Google Flights search error: Search failed")
-            if settings.DEBUG:
-                import traceback
-
-                print(traceback.format_exc())
+            logger.warning(
+                "SerpApi Google Flights search error: Search failed",
+                exc_info=settings.DEBUG,
+            )
             raise SerpApiConnectorError("SerpApi Google Flights search error") from e
 
+    def _get_cache_key(
+        self,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        return_date: Optional[str],
+        adults: int,
+    ) -> str:
+        """Build a cache key that treats case and whitespace variants as equal"""
+        route = "|".join(
+            "-".join(str(part).upper().split())
+            for part in (origin, destination, departure_date, return_date or "", adults)
+        )
+        return f"flights:serpapi:{route}"
+
     def _parse_serpapi_response(
         self,
         data: Dict[str, Any],
@@ -247,7 +483,7 @@ class SerpApiFlightsConnector:
                     )
 
                     # Get price (per person or total)
-                    price_info = flight_option.get("price", {})
+                    price_info = flight_option.get("price", _EMPTY)
                     if isinstance(price_info, dict):
                         total_price = price_info.get("total", 0)
                         if total_price == 0:
@@ -261,7 +497,9 @@ class SerpApiFlightsConnector:
                     # If price is per person, multiply by adults
                     if total_price > 0 and adults > 1:
                         # Check if price is per person (common in SerpApi)
-                        price_per_person = flight_option.get("price_per_person", {})
+                        price_per_person = flight_option.get(
+                            "price_per_person", _EMPTY
+                        )
                         if price_per_person and isinstance(price_per_person, dict):
                             per_person = price_per_person.get(
                                 "total", 0
@@ -275,12 +513,12 @@ class SerpApiFlightsConnector:
                         continue
 
                     # Get first flight leg
-                    first_flight = flights_data[0] if flights_data else {}
-                    last_flight = flights_data[-1] if flights_data else {}
+                    first_flight = flights_data[0]
+                    last_flight = flights_data[-1]
 
                     # Extract times - SerpApi returns time in various formats
-                    dep_airport = first_flight.get("departure_airport", {})
-                    arr_airport = last_flight.get("arrival_airport", {})
+                    dep_airport = first_flight.get("departure_airport", _EMPTY)
+                    arr_airport = last_flight.get("arrival_airport", _EMPTY)
 
                     departure_time_str = dep_airport.get("time", "") or dep_airport.get(
                         "datetime", ""
@@ -289,8 +527,8 @@ class SerpApiFlightsConnector:
                         "datetime", ""
                     )
 
-                    print(f"  [DEBUG] Raw departure_time_str: {departure_time_str}")
-                    print(f"  [DEBUG] Raw arrival_time_str: {arrival_time_str}")
+                    logger.debug("Raw departure_time_str: %s", departure_time_str)
+                    logger.debug("Raw arrival_time_str: %s", arrival_time_str)
 
                     # Extract airline
                     airline_info = first_flight.get("airline", "")
@@ -328,17 +566,7 @@ class SerpApiFlightsConnector:
                             booking_class.title()
                         )  # Capitalize first letter of each word
                         # Map common variations
-                        booking_class_map = {
-                            "Economy": "Economy",
-                            "Premium Economy": "Premium Economy",
-                            "Business": "Business",
-                            "First": "First",
-                            "First Class": "First",
-                            "Business Class": "Business",
-                            "Premium": "Premium Economy",
-                            "Coach": "Economy",
-                        }
-                        booking_class = booking_class_map.get(
+                        booking_class = _BOOKING_CLASS_MAP.get(
                             booking_class, booking_class
                         )
 
@@ -357,8 +585,6 @@ class SerpApiFlightsConnector:
 
                             if dep_time_str and arr_time_str:
                                 # Parse times using _parse_time which handles all formats
-                                from datetime import datetime as dt
-
                                 try:
                                     # Use _parse_time to get properly formatted datetime strings
                                     dep_parsed = self._parse_time(
@@ -379,42 +605,40 @@ class SerpApiFlightsConnector:
 
                                     # Try parsing ISO format
                                     try:
-                                        dep_dt = dt.fromisoformat(dep_clean)
+                                        dep_dt = datetime.fromisoformat(dep_clean)
                                     except ValueError:
                                         # Fallback to strptime
                                         if "T" in dep_clean:
-                                            dep_dt = dt.strptime(
+                                            dep_dt = datetime.strptime(
                                                 dep_clean.split("T")[0]
                                                 + " "
                                                 + dep_clean.split("T")[1],
                                                 "%Y-%m-%d %H:%M:%S",
                                             )
                                         else:
-                                            dep_dt = dt.strptime(
+                                            dep_dt = datetime.strptime(
                                                 dep_clean, "%Y-%m-%d %H:%M:%S"
                                             )
 
                                     try:
-                                        arr_dt = dt.fromisoformat(arr_clean)
+                                        arr_dt = datetime.fromisoformat(arr_clean)
                                     except ValueError:
                                         # Fallback to strptime
                                         if "T" in arr_clean:
-                                            arr_dt = dt.strptime(
+                                            arr_dt = datetime.strptime(
                                                 arr_clean.split("T")[0]
                                                 + " "
                                                 + arr_clean.split("T")[1],
                                                 "%Y-%m-%d %H:%M:%S",
                                             )
                                         else:
-                                            arr_dt = dt.strptime(
+                                            arr_dt = datetime.strptime(
                                                 arr_clean, "%Y-%m-%d %H:%M:%S"
                                             )
 
                                     # Check if arrival is before departure (next day arrival)
                                     if arr_dt <= dep_dt:
                                         # Arrival is likely next day - add 1 day
-                                        from datetime import timedelta
-
                                         arr_dt += timedelta(days=1)
 
                                     # Calculate duration in seconds
@@ -425,23 +649,35 @@ class SerpApiFlightsConnector:
 
                                     # Validate duration is reasonable (at least 30 minutes, at most 30 hours)
                                     if duration_seconds < 1800:
-                                        print(
-                                            f"  [WARNING] Calculated duration ({duration_seconds}s) too short, using minimum 30 minutes"
+                                        logger.warning(
+                                            "Calculated duration (%ss) too short, using minimum 30 minutes",
+                                            duration_seconds,
                                         )
                                         duration_seconds = 1800
                                     elif duration_seconds > 108000:  # 30 hours
-                                        print(
-                                            f"  [WARNING] Calculated duration ({duration_seconds}s) too long, capping at 30 hours"
+                                        logger.warning(
+                                            "Calculated duration (%ss) too long, capping at 30 hours",
+                                            duration_seconds,
                                         )
                                         duration_seconds = 108000
 
-                                    print(
-                                        f"  [DEBUG] Parsed times - Dep: {dep_dt}, Arr: {arr_dt}, Duration: {duration_seconds}s ({duration_seconds//3600}h {(duration_seconds%3600)//60}m)"
+                                    logger.debug(
+                                        "Parsed times - Dep: %s, Arr: %s, Duration: %ss (%sh %sm)",
+                                        dep_dt,
+                                        arr_dt,
+                                        duration_seconds,
+                                        duration_seconds // 3600,
+                                        (duration_seconds % 3600) // 60,
                                     )
 
                                 except (ValueError, AttributeError) as e:
-                                    print(
-                                        f"  [WARNING] Could not parse flight times: '{dep_time_str}' -> '{dep_parsed}', '{arr_time_str}' -> '{arr_parsed}', error: {str(e)}"
+                                    logger.warning(
+                                        "Could not parse flight times: '%s' -> '%s', '%s' -> '%s', error: %s",
+                                        dep_time_str,
+                                        dep_parsed,
+                                        arr_time_str,
+                                        arr_parsed,
+                                        e,
                                     )
                                     # Fallback: estimate based on typical flight times
                                     if stops == 0:
@@ -453,8 +689,8 @@ class SerpApiFlightsConnector:
                                             14400  # 4 hours for flights with stops
                                         )
                         except Exception as e:
-                            print(
-                                f"  [WARNING] Error calculating duration from times: {str(e)}"
+                            logger.warning(
+                                "Error calculating duration from times: %s", e
                             )
                             # Fallback: estimate based on typical flight times
                             if stops == 0:
@@ -485,20 +721,16 @@ class SerpApiFlightsConnector:
                     parsed_arr_time = self._parse_time(arrival_time_str, departure_date)
 
                     # If arrival appears to be before departure (next day), fix it
-                    from datetime import datetime as dt
-
                     try:
-                        dep_dt_check = dt.fromisoformat(
+                        dep_dt_check = datetime.fromisoformat(
                             parsed_dep_time.replace("+00:00", "").replace("Z", "")
                         )
-                        arr_dt_check = dt.fromisoformat(
+                        arr_dt_check = datetime.fromisoformat(
                             parsed_arr_time.replace("+00:00", "").replace("Z", "")
                         )
 
                         # If arrival is earlier or same as departure, it's next day
                         if arr_dt_check <= dep_dt_check:
-                            from datetime import timedelta
-
                             arr_dt_check += timedelta(days=1)
                             parsed_arr_time = arr_dt_check.strftime("%Y-%m-%dT%H:%M:%S")
                     except:
@@ -529,35 +761,37 @@ class SerpApiFlightsConnector:
 
                 except Exception as e:
                     # Log error without exposing sensitive data
-                    from django.conf import settings
-
-                    print(f"  [WARNING] Error parsing flight option {len(flights) + 1}")
                     # Only log full traceback in DEBUG mode to avoid exposing sensitive information
-                    if settings.DEBUG:
-                        import traceback
-
-                        print(traceback.format_exc())
+                    logger.warning(
+                        "Error parsing flight option %s",
+                        len(flights) + 1,
+                        exc_info=settings.DEBUG,
+                    )
                     continue
 
-            print(
-                f"  [DEBUG] Successfully parsed {len(flights)} flights from {len(flight_options)} flight options"
+            logger.debug(
+                "Successfully parsed %s flights from %s flight options",
+                len(flights),
+                len(flight_options),
             )
             return flights
 
         except Exception as e:
             # Log error without exposing sensitive data
-            from django.conf import settings
-
-            print(f"  [ERROR] Error parsing SerpApi response")
             # Only log full traceback in DEBUG mode to avoid exposing sensitive information
-            if settings.DEBUG:
-                import traceback
-
-                print(traceback.format_exc())
-                if "data" in locals():
-                    print(
-                        f"  [DEBUG] Response data structure: {json.dumps({k: str(type(v).__name__) + (' (len=' + str(len(v)) + ')' if hasattr(v, '__len__') else '') for k, v in list(data.items())[:15]}, indent=2)}"
-                    )
+            logger.warning("Error parsing SerpApi response", exc_info=settings.DEBUG)
+            if settings.DEBUG and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Response data structure: %s",
+                    json.dumps(
+                        {
+                            k: str(type(v).__name__)
+                            + (f" (len={len(v)})" if hasattr(v, "__len__") else "")
+                            for k, v in list(data.items())[:15]
+                        },
+                        indent=2,
+                    ),
+                )
             raise
 
     def _parse_time(self, time_str: str, date_str: str) -> str:
@@ -572,8 +806,6 @@ class SerpApiFlightsConnector:
         if not time_str:
             return f"{date_str}T12:00:00"
 
-        from datetime import datetime as dt
-
         try:
             # If already in ISO format with 'T', return as-is (might need timezone fix)
             if "T" in time_str:
@@ -593,10 +825,10 @@ class SerpApiFlightsConnector:
                 try:
                     # Try with seconds first
                     if len(time_str.split()[-1].split(":")) == 3:
-                        parsed_dt = dt.strptime(time_str, "%Y-%m-%d %H:%M:%S")
+                        parsed_dt = datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
                     else:
                         # No seconds
-                        parsed_dt = dt.strptime(time_str, "%Y-%m-%d %H:%M")
+                        parsed_dt = datetime.strptime(time_str, "%Y-%m-%d %H:%M")
                     return parsed_dt.strftime("%Y-%m-%dT%H:%M:%S")
                 except ValueError:
                     pass
@@ -612,23 +844,21 @@ class SerpApiFlightsConnector:
 
             # Try parsing as full datetime
             try:
-                parsed_dt = dt.strptime(time_str, "%Y-%m-%d %H:%M:%S")
+                parsed_dt = datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
                 return parsed_dt.strftime("%Y-%m-%dT%H:%M:%S")
             except ValueError:
                 try:
-                    parsed_dt = dt.strptime(time_str, "%Y-%m-%d %H:%M")
+                    parsed_dt = datetime.strptime(time_str, "%Y-%m-%d %H:%M")
                     return parsed_dt.strftime("%Y-%m-%dT%H:%M:%S")
                 except ValueError:
                     pass
 
             # If all else fails, return default
-            print(
-                f"  [WARNING] Could not parse time format: '{time_str}', using default"
-            )
+            logger.warning("Could not parse time format: '%s', using default", time_str)
             return f"{date_str}T12:00:00"
 
         except Exception as e:
-            print(f"  [WARNING] Error parsing time '{time_str}': {str(e)}")
+            logger.warning("Error parsing time '%s': %s", time_str, e)
             return f"{date_str}T12:00:00"
 
     def _get_airport_code(self, location: str) -> str:
@@ -638,7 +868,7 @@ class SerpApiFlightsConnector:
         Handles formats like "City, Country" and extracts just the city.
         """
         # If it's already a 3-letter uppercase code, return as-is
-        if len(location) == 3 and location.isupper():
+        if _IATA_CODE_RE.fullmatch(location):
             return location
 
         # Extract city name if it's in "City, Country" format
@@ -647,97 +877,8 @@ class SerpApiFlightsConnector:
             # Take the part before the comma (the city/region)
             location_clean = location_clean.split(",")[0].strip()
 
-        location_lower = location_clean.lower().strip()
-
-        # Expanded airport code mapping
-        # Includes major cities and regions
-        common_codes = {
-            # US Cities
-            "new york": "JFK",
-            "los angeles": "LAX",
-            "chicago": "ORD",
-            "miami": "MIA",
-            "san francisco": "SFO",
-            "las vegas": "LAS",
-            "boston": "BOS",
-            "seattle": "SEA",
-            "atlanta": "ATL",
-            "dallas": "DFW",
-            "denver": "DEN",
-            "houston": "IAH",
-            "phoenix": "PHX",
-            "philadelphia": "PHL",
-            "san diego": "SAN",
-            "minneapolis": "MSP",
-            "detroit": "DTW",
-            "portland": "PDX",
-            # European Cities
-            "london": "LHR",
-            "paris": "CDG",
-            "rome": "FCO",
-            "madrid": "MAD",
-            "barcelona": "BCN",
-            "amsterdam": "AMS",
-            "berlin": "BER",
-            "munich": "MUC",
-            "frankfurt": "FRA",
-            "vienna": "VIE",
-            "zurich": "ZRH",
-            "milan": "MXP",
-            "istanbul": "IST",
-            "dublin": "DUB",
-            "lisbon": "LIS",
-            "athens": "ATH",
-            "prague": "PRG",
-            # Italian regions/cities - map regions to major airports
-            "sicily": "PMO",  # Palermo - main airport in Sicily
-            "sicilia": "PMO",
-            "tuscany": "FLR",  # Florence
-            "toscana": "FLR",
-            "venice": "VCE",
-            "venezia": "VCE",
-            "naples": "NAP",
-            "napoli": "NAP",
-            "bologna": "BLQ",
-            # Canadian provinces/cities
-            "alberta": "YYC",  # Calgary - major airport in Alberta
-            "calgary": "YYC",
-            "edmonton": "YEG",
-            "toronto": "YYZ",
-            "vancouver": "YVR",
-            "montreal": "YUL",
-            "ottawa": "YOW",
-            "quebec": "YQB",
-            "winnipeg": "YWG",
-            # Asian Cities
-            "tokyo": "NRT",
-            "beijing": "PEK",
-            "shanghai": "PVG",
-            "hong kong": "HKG",
-            "singapore": "SIN",
-            "bangkok": "BKK",
-            "seoul": "ICN",
-            "delhi": "DEL",
-            "mumbai": "BOM",
-            "dubai": "DXB",
-            "doha": "DOH",
-            "abu dhabi": "AUH",
-            # Other Major Cities
-            "sydney": "SYD",
-            "melbourne": "MEL",
-            "auckland": "AKL",
-            "cairo": "CAI",
-            "johannesburg": "JNB",
-            "cape town": "CPT",
-            "mexico city": "MEX",
-            "sao paulo": "GRU",
-            "rio de janeiro": "GIG",
-            "buenos aires": "EZE",
-            "lima": "LIM",
-        }
-
         # Check if we have a mapping
-        airport_code = common_codes.get(location_lower)
+        airport_code = _CITY_TO_IATA.get(location_clean.lower())
 
         if airport_code:
             return airport_code
@@ -751,16 +892,8 @@ class SerpApiFlightsConnector:
         if not error_message:
             return False
 
-        auth_keywords = [
-            "invalid api key",
-            "invalid authentication",
-            "authorization",
-            "inactive account",
-            "missing api key",
-        ]
-
         error_lower = error_message.lower()
-        return any(keyword in error_lower for keyword in auth_keywords)
+        return any(keyword in error_lower for keyword in _AUTH_ERROR_KEYWORDS)
 
     def _use_mock_flight_data_with_reason(
         self,
@@ -773,7 +906,7 @@ class SerpApiFlightsConnector:
         max_results: int,
     ) -> List[Dict[str, Any]]:
         """Log why we're returning mock data and delegate to generator."""
-        print(f"  [INFO] {reason}. Falling back to mock SerpApi flight data.")
+        logger.info("%s. Falling back to mock SerpApi flight data.", reason)
         return self._get_mock_flight_data(
             origin,
             destination,
@@ -793,41 +926,40 @@ class SerpApiFlightsConnector:
         max_results: int = 10,
     ) -> List[Dict[str, Any]]:
         """Generate mock flight data when SerpApi is unavailable"""
-        import random
-
-        airlines = [
-            {"code": "AA", "name": "American Airlines"},
-            {"code": "UA", "name": "United Airlines"},
-            {"code": "DL", "name": "Delta Air Lines"},
-            {"code": "SW", "name": "Southwest Airlines"},
-            {"code": "B6", "name": "JetBlue Airways"},
-            {"code": "AS", "name": "Alaska Airlines"},
-            {"code": "WN", "name": "Southwest Airlines"},
-            {"code": "NK", "name": "Spirit Airlines"},
-        ]
-
         base_price = 250
 
+        # Duration: 1-3 hours for short domestic flights, 2-8 hours for longer flights
+        # For Denver to Alberta: ~2-3 hours, for Denver to Sicily: ~10-12 hours
+        destination_lower = destination.lower()
+        if "alberta" in destination_lower or "canada" in destination_lower:
+            flight_hour_range = range(2, 5)  # 2-4 hours
+        elif "italy" in destination_lower or "europe" in destination_lower:
+            flight_hour_range = range(10, 15)  # 10-14 hours for transatlantic
+        else:
+            flight_hour_range = range(2, 9)  # Default 2-8 hours
+
+        # Draw each field for all flights at once rather than per iteration
+        count = min(max_results, 8)
+        airlines = random.choices(_MOCK_AIRLINES, k=count)
+        price_offsets = random.choices(range(-100, 301), k=count)
+        stops_list = random.choices([0, 1, 2], k=count)
+        # Departures between 6 AM and 4 PM
+        dep_hours = random.choices(range(6, 17), k=count)
+        dep_minutes = random.choices([0, 15, 30, 45], k=count)
+        flight_hours_list = random.choices(flight_hour_range, k=count)
+        flight_minutes_list = random.choices(range(0, 60), k=count)
+        booking_classes = random.choices(_MOCK_BOOKING_CLASSES, k=count)
+
+        next_day_str = None
+        route = f"{origin} → {destination}"
         flights = []
-        for i in range(min(max_results, 8)):
-            airline = random.choice(airlines)
-            price = (base_price + random.randint(-100, 300)) * adults
-            stops = random.choice([0, 1, 2])
-
-            # Generate reasonable departure and arrival times
-            dep_hour = random.randint(6, 16)  # Departures between 6 AM and 4 PM
-            dep_minute = random.choice([0, 15, 30, 45])
-
-            # Duration: 1-3 hours for short domestic flights, 2-8 hours for longer flights
-            # For Denver to Alberta: ~2-3 hours, for Denver to Sicily: ~10-12 hours
-            if "alberta" in destination.lower() or "canada" in destination.lower():
-                flight_hours = random.randint(2, 4)  # 2-4 hours
-            elif "italy" in destination.lower() or "europe" in destination.lower():
-                flight_hours = random.randint(10, 14)  # 10-14 hours for transatlantic
-            else:
-                flight_hours = random.randint(2, 8)  # Default 2-8 hours
-
-            flight_minutes = random.randint(0, 59)
+        for i in range(count):
+            airline = airlines[i]
+            price = (base_price + price_offsets[i]) * adults
+            dep_hour = dep_hours[i]
+            dep_minute = dep_minutes[i]
+            flight_hours = flight_hours_list[i]
+            flight_minutes = flight_minutes_list[i]
 
             # Calculate arrival time
             arr_hour = dep_hour + flight_hours
@@ -838,11 +970,10 @@ class SerpApiFlightsConnector:
             if arr_hour >= 24:
                 arr_hour -= 24
                 # Next day arrival - format accordingly
-                from datetime import datetime, timedelta
-
-                dep_date = datetime.strptime(departure_date, "%Y-%m-%d")
-                arr_date = dep_date + timedelta(days=1)
-                arrival_date_str = arr_date.strftime("%Y-%m-%d")
+                if next_day_str is None:
+                    dep_date = datetime.strptime(departure_date, "%Y-%m-%d")
+                    next_day_str = (dep_date + timedelta(days=1)).strftime("%Y-%m-%d")
+                arrival_date_str = next_day_str
             else:
                 arrival_date_str = departure_date
 
@@ -856,12 +987,10 @@ class SerpApiFlightsConnector:
                     "departure_time": f"{departure_date}T{dep_hour:02d}:{dep_minute:02d}:00",
                     "arrival_time": f"{arrival_date_str}T{arr_hour:02d}:{arr_minute:02d}:00",
                     "duration": f"{flight_hours}h {flight_minutes}m",
-                    "stops": stops,
-                    "booking_class": random.choice(
-                        ["Economy", "Premium Economy", "Business"]
-                    ),
+                    "stops": stops_list[i],
+                    "booking_class": booking_classes[i],
                     "seats_available": str(adults),
-                    "route": f"{origin} → {destination}",
+                    "route": route,
                     "is_mock": True,
                     "total_amount": price,
                     "owner": {},
@@ -877,6 +1006,8 @@ class SerpApiActivitiesConnector:
     Uses Google search to find activities, tours, and attractions.
     """
 
+    __slots__ = ("api_key", "base_url", "timeout", "session", "headers")
+
     def __init__(self):
         """Initialize SerpApi client"""
         # Get API key from environment variable first
@@ -892,9 +1023,10 @@ class SerpApiActivitiesConnector:
 
         self.base_url = "https://serpapi.com/search.json"
         self.timeout = 30
+        self.session = _SESSION
 
         if not self.api_key:
-            print("WARNING: SerpApi API key not configured. Using mock data.")
+            logger.warning("SerpApi API key not configured. Using mock data.")
 
         self.headers = {
             "Accept": "application/json",
@@ -926,8 +1058,10 @@ class SerpApiActivitiesConnector:
         """
 
         if not self.api_key:
-            print("[WARNING] SerpApi API key not configured - using mock activity data")
-            print("[WARNING] To get real activity data, set SERP_API_KEY environment variable")
+            logger.warning("SerpApi API key not configured - using mock activity data")
+            logger.warning(
+                "To get real activity data, set SERP_API_KEY environment variable"
+            )
             return self._get_mock_activity_data(destination, categories or [])
 
         try:
@@ -947,41 +1081,43 @@ class SerpApiActivitiesConnector:
                 "num": max_results,
             }
 
-            print(f"Searching SerpAPI for activities: {search_query}")
+            logger.info("Searching SerpAPI for activities: %s", search_query)
 
-            response = requests.get(
+            response = self.session.get(
                 self.base_url, params=params, headers=self.headers, timeout=self.timeout
             )
 
             if response.status_code != 200:
-                print(f"  [ERROR] SerpApi returned status code {response.status_code}")
+                logger.warning("SerpApi returned status code %s", response.status_code)
                 return self._get_mock_activity_data(destination, categories or [])
 
             data = response.json()
 
             # DEBUG: Log response structure to understand what we're getting
             # Always log this for now to help debug the image issue
-            print(f"[DEBUG] SerpAPI response keys: {list(data.keys())}")
+            logger.debug("SerpAPI response keys: %s", list(data.keys()))
             if "organic_results" in data and len(data["organic_results"]) > 0:
                 first_result = data["organic_results"][0]
-                print(f"[DEBUG] First organic_result keys: {list(first_result.keys())}")
+                logger.debug("First organic_result keys: %s", list(first_result.keys()))
                 # Check specifically for image-related fields
                 image_fields = [k for k in first_result.keys() if any(term in k.lower() for term in ['image', 'photo', 'thumbnail', 'img', 'pic'])]
                 if image_fields:
-                    print(f"[DEBUG] Found image-related fields: {image_fields}")
+                    logger.debug("Found image-related fields: %s", image_fields)
                     for field in image_fields:
-                        print(f"[DEBUG]   {field}: {first_result.get(field)}")
+                        logger.debug("%s: %s", field, first_result.get(field))
                 else:
-                    print(f"[DEBUG] No image-related fields found in first result")
+                    logger.debug("No image-related fields found in first result")
             if "places_results" in data:
-                print(f"[DEBUG] places_results type: {type(data['places_results'])}")
+                logger.debug("places_results type: %s", type(data['places_results']))
                 if isinstance(data["places_results"], dict):
-                    print(f"[DEBUG] places_results keys: {list(data['places_results'].keys())}")
+                    logger.debug(
+                        "places_results keys: %s", list(data['places_results'].keys())
+                    )
 
             # Check for errors
             if "error" in data:
                 error_msg = data.get("error", "Unknown error")
-                print(f"  [ERROR] SerpApi API error: {error_msg}")
+                logger.warning("SerpApi API error: %s", error_msg)
                 return self._get_mock_activity_data(destination, categories or [])
 
             activities = self._parse_serpapi_activities_response(
@@ -989,17 +1125,17 @@ class SerpApiActivitiesConnector:
             )
 
             if not activities:
-                print(f"  [WARNING] No activities found, using mock data")
+                logger.warning("No activities found, using mock data")
                 return self._get_mock_activity_data(destination, categories or [])
 
-            print(f"  [SUCCESS] Found {len(activities)} activities from SerpAPI")
+            logger.info("Found %s activities from SerpAPI", len(activities))
             return activities[:max_results]
 
         except requests.exceptions.RequestException as e:
-            print(f"  [ERROR] SerpApi request error: {str(e)}")
+            logger.warning("SerpApi request error: %s", e)
             return self._get_mock_activity_data(destination, categories or [])
         except Exception as e:
-            print(f"  [ERROR] SerpApi activities search error: {str(e)}")
+            logger.warning("SerpApi activities search error: %s", e)
             return self._get_mock_activity_data(destination, categories or [])
 
     def _parse_serpapi_activities_response(
@@ -1049,14 +1185,21 @@ class SerpApiActivitiesConnector:
                 try:
                     # DEBUG: Log first result structure
                     if idx == 0:
-                        print(f"[DEBUG] Processing first result - keys: {list(result.keys())}")
+                        logger.debug(
+                            "Processing first result - keys: %s", list(result.keys())
+                        )
                         # Check for any image-related keys
                         image_keys = [k for k in result.keys() if any(term in k.lower() for term in ['image', 'photo', 'thumbnail', 'img', 'pic'])]
                         if image_keys:
-                            print(f"[DEBUG] First result has image keys: {image_keys}")
+                            logger.debug("First result has image keys: %s", image_keys)
                             for key in image_keys:
                                 val = result.get(key)
-                                print(f"[DEBUG]   {key}: {type(val).__name__} = {str(val)[:150]}")
+                                logger.debug(
+                                    "%s: %s = %s",
+                                    key,
+                                    type(val).__name__,
+                                    str(val)[:150],
+                                )
                     
                     # Extract activity information
                     name = (
@@ -1114,15 +1257,18 @@ class SerpApiActivitiesConnector:
                     image_url = None
                     
                     # DEBUG: Print result structure to see what fields are available (only in DEBUG mode)
-                    import os
                     if os.environ.get('DEBUG', '').lower() == 'true' or os.environ.get('DJANGO_DEBUG', '').lower() == 'true':
-                        print(f"[DEBUG] Activity result keys: {list(result.keys())}")
+                        logger.debug("Activity result keys: %s", list(result.keys()))
                         if "thumbnail" in result:
-                            print(f"[DEBUG] thumbnail value type: {type(result.get('thumbnail'))}, value: {result.get('thumbnail')}")
+                            logger.debug(
+                                "thumbnail value type: %s, value: %s",
+                                type(result.get('thumbnail')),
+                                result.get('thumbnail'),
+                            )
                         if "place" in result:
                             place_data = result.get("place", {})
                             if isinstance(place_data, dict):
-                                print(f"[DEBUG] place keys: {list(place_data.keys())}")
+                                logger.debug("place keys: %s", list(place_data.keys()))
                     
                     # Try multiple possible image fields from SerpAPI
                     # Check thumbnail - could be string URL or dict
@@ -1130,7 +1276,9 @@ class SerpApiActivitiesConnector:
                         thumbnail_val = result.get("thumbnail")
                         if isinstance(thumbnail_val, str) and thumbnail_val.startswith(("http://", "https://")):
                             image_url = thumbnail_val
-                            print(f"[DEBUG] Set image_url from thumbnail: {image_url[:80]}...")
+                            logger.debug(
+                                "Set image_url from thumbnail: %s...", image_url[:80]
+                            )
                         elif isinstance(thumbnail_val, dict):
                             # Nested thumbnail structure
                             if "thumbnail" in thumbnail_val:
@@ -1171,7 +1319,10 @@ class SerpApiActivitiesConnector:
                             if not image_url and "photos_link" in place:
                                 # photos_link is a link to another API call, log it for debugging
                                 if os.environ.get('DEBUG', '').lower() == 'true':
-                                    print(f"[DEBUG] Found photos_link in place: {place.get('photos_link')} (not a direct image URL)")
+                                    logger.debug(
+                                        "Found photos_link in place: %s (not a direct image URL)",
+                                        place.get('photos_link'),
+                                    )
                     
                     # Try thumbnail_src which is common in Google search results
                     if not image_url and "thumbnail_src" in result:
@@ -1183,7 +1334,10 @@ class SerpApiActivitiesConnector:
                     if not image_url and "photos_link" in result:
                         photos_link = result.get("photos_link")
                         if os.environ.get('DEBUG', '').lower() == 'true':
-                            print(f"[DEBUG] Found photos_link: {photos_link} (not a direct image URL)")
+                            logger.debug(
+                                "Found photos_link: %s (not a direct image URL)",
+                                photos_link,
+                            )
                     
                     # If no image found, try to get one from Google Images API
                     # Note: This makes an additional API call per activity, which uses more credits
@@ -1193,13 +1347,20 @@ class SerpApiActivitiesConnector:
                             image_url = self._get_image_from_google_images(name, destination)
                             if image_url:
                                 if os.environ.get('DEBUG', '').lower() == 'true':
-                                    print(f"[DEBUG] Found image via Google Images API for '{name}'")
+                                    logger.debug(
+                                        "Found image via Google Images API for '%s'",
+                                        name,
+                                    )
                         except Exception as e:
                             if os.environ.get('DEBUG', '').lower() == 'true':
-                                print(f"[DEBUG] Could not fetch image from Google Images: {str(e)}")
+                                logger.debug(
+                                    "Could not fetch image from Google Images: %s", e
+                                )
                     
                     # Always log final image_url to help debug
-                    print(f"[DEBUG] Final image_url for '{name[:50]}': {image_url or '(None)'}")
+                    logger.debug(
+                        "Final image_url for '%s': %s", name[:50], image_url or '(None)'
+                    )
 
                     # Determine category
                     category = "general"
@@ -1234,8 +1395,6 @@ class SerpApiActivitiesConnector:
                             category = "culture"
 
                     # Estimate price (Google search doesn't provide prices, so we estimate)
-                    import random
-
                     price = random.randint(20, 150)  # Reasonable estimate
 
                     # Estimate duration
@@ -1266,18 +1425,22 @@ class SerpApiActivitiesConnector:
                     }
                     
                     # Debug: Log what we're about to return
-                    print(f"[DEBUG] Activity '{name[:50]}' - image_url in dict: {activity.get('image_url') or '(None)'}")
+                    logger.debug(
+                        "Activity '%s' - image_url in dict: %s",
+                        name[:50],
+                        activity.get('image_url') or '(None)',
+                    )
 
                     activities.append(activity)
 
                 except Exception as e:
-                    print(f"  [WARNING] Error parsing activity result: {str(e)}")
+                    logger.warning("Error parsing activity result: %s", e)
                     continue
 
             return activities
 
         except Exception as e:
-            print(f"  [ERROR] Error parsing SerpAPI activities response: {str(e)}")
+            logger.warning("Error parsing SerpAPI activities response: %s", e)
             return []
     
     def _get_image_from_google_images(self, activity_name: str, destination: str) -> Optional[str]:
@@ -1300,7 +1463,7 @@ class SerpApiActivitiesConnector:
                 "num": 1,  # Just get the first image
             }
             
-            response = requests.get(
+            response = self.session.get(
                 self.base_url, params=params, headers=self.headers, timeout=10
             )
             
@@ -1323,74 +1486,52 @@ class SerpApiActivitiesConnector:
         except Exception as e:
             # Silently fail - this is just a fallback
             if os.environ.get('DEBUG', '').lower() == 'true':
-                print(f"[DEBUG] Error fetching image from Google Images: {str(e)}")
+                logger.debug("Error fetching image from Google Images: %s", e)
             return None
 
     def _get_mock_activity_data(
         self, destination: str, categories: List[str]
     ) -> List[Dict[str, Any]]:
         """Generate mock activity data when SerpAPI is unavailable"""
-        import random
-
-        activity_types = {
-            "museums": ["Museum Tour", "Art Gallery Visit", "Historical Site Tour"],
-            "outdoor": [
-                "Hiking Tour",
-                "Bike Rental",
-                "Beach Activities",
-                "Nature Walk",
-            ],
-            "food": ["Food Tour", "Cooking Class", "Wine Tasting", "Restaurant Tour"],
-            "adventure": ["Zip Lining", "Rock Climbing", "Kayaking", "Parasailing"],
-            "culture": [
-                "City Walking Tour",
-                "Theater Show",
-                "Music Concert",
-                "Local Market Visit",
-            ],
-            "default": ["City Tour", "Sightseeing", "Local Experience"],
-        }
+        # Draw each field for all activities at once rather than per iteration
+        count = 10
+        chosen_categories = random.choices(
+            categories or _MOCK_ACTIVITY_CATEGORIES, k=count
+        )
+        prices = random.choices(range(20, 201), k=count)
+        durations = random.choices([2, 3, 4, 6, 8], k=count)
+        review_counts = random.choices(range(10, 301), k=count)
+        included = random.choices(_MOCK_ACTIVITY_INCLUDED, k=count)
+        cancellation_policies = random.choices(_MOCK_ACTIVITY_CANCELLATION, k=count)
+        group_sizes = random.choices(range(6, 21), k=count)
+        language_counts = random.choices(range(1, 4), k=count)
 
         activities = []
-        for i in range(10):
-            # Pick a category
-            if categories:
-                category = random.choice(categories)
-                activity_list = activity_types.get(category, activity_types["default"])
-            else:
-                category = random.choice(list(activity_types.keys()))
-                activity_list = activity_types[category]
-
+        for i in range(count):
+            # Pick an activity from the category, or the defaults if unknown
+            category = chosen_categories[i]
+            activity_list = _MOCK_ACTIVITY_TYPES.get(
+                category, _MOCK_ACTIVITY_TYPES["default"]
+            )
             activity_name = random.choice(activity_list)
-            price = random.randint(20, 200)
-            duration_hours = random.choice([2, 3, 4, 6, 8])
 
             activities.append(
                 {
                     "id": f"MOCK-SERP-ACT-{i+1}",
                     "name": f"{activity_name} in {destination}",
                     "category": category,
-                    "price": price,
+                    "price": prices[i],
                     "currency": "USD",
-                    "duration_hours": duration_hours,
+                    "duration_hours": durations[i],
                     "rating": round(random.uniform(4.0, 5.0), 1),
-                    "review_count": random.randint(10, 300),
+                    "review_count": review_counts[i],
                     "description": f"Experience an amazing {activity_name.lower()} in {destination}. Perfect for all ages!",
-                    "included": random.choice(
-                        [
-                            "Guide, Equipment",
-                            "Tickets, Transportation",
-                            "Meals, Guide",
-                            "Equipment only",
-                        ]
-                    ),
+                    "included": included[i],
                     "meeting_point": f"{destination} Central Location",
-                    "cancellation_policy": random.choice(
-                        ["Free cancellation up to 24h", "Non-refundable", "50% refund"]
-                    ),
-                    "max_group_size": random.randint(6, 20),
+                    "cancellation_policy": cancellation_policies[i],
+                    "max_group_size": group_sizes[i],
                     "languages": random.sample(
-                        ["English", "Spanish", "French", "German"], random.randint(1, 3)
+                        _MOCK_ACTIVITY_LANGUAGES, language_counts[i]
                     ),
                     "is_mock": True,
                 }
@@ -0,0 +1,17 @@
+"""
+Signal handlers for AI Implementation
+"""
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import GroupItineraryOption, ItineraryVote
+
+
+@receiver(post_delete, sender=ItineraryVote)
+def decrement_option_vote_count(sender, instance, **kwargs):
+    """
+    Take a deleted vote off its option's vote_count. Django sends post_delete
+    for every row of a queryset delete too, unlike ItineraryVote.delete().
+    """
+    GroupItineraryOption.adjust_vote_count(instance.option_id, -1)
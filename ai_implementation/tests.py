@@ -1382,8 +1382,8 @@ class APIConnectorExtendedTest(TestCase):
             self.assertIn("price", flight)
             self.assertTrue(flight.get("is_mock", False))
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
-    @patch("ai_implementation.makcorps_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
     def test_aggregator_with_preferences(self, mock_makcorps_get, mock_serpapi_get):
         """Test aggregator with detailed preferences"""
         # Note: DuffelAggregator removed - using SerpAPI and Makcorps instead
@@ -1845,6 +1845,45 @@ class FormValidationTest(TestCase):
         self.assertFalse(form.is_valid())
         self.assertIn("Start date cannot be in the past", str(form.errors))
 
+    def test_travel_search_form_past_date_is_field_error(self):
+        """Test a past start date is reported on the start_date field"""
+        form_data = {
+            "destination": "Paris",
+            "start_date": (date.today() - timedelta(days=1)).isoformat(),
+            "end_date": (date.today() + timedelta(days=5)).isoformat(),
+            "adults": 2,
+        }
+        form = TravelSearchForm(data=form_data)
+        self.assertFalse(form.is_valid())
+        self.assertEqual(
+            form.errors["start_date"], ["Start date cannot be in the past."]
+        )
+        self.assertFalse(form.non_field_errors())
+
+    def test_travel_search_form_joins_activity_preferences(self):
+        """Test cleaned activity preferences become activity_categories"""
+        form_data = {
+            "destination": "Paris",
+            "start_date": (date.today() + timedelta(days=10)).isoformat(),
+            "end_date": (date.today() + timedelta(days=15)).isoformat(),
+            "adults": 2,
+            "activity_preferences": ["museums", "food"],
+        }
+        form = TravelSearchForm(data=form_data)
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["activity_categories"], "museums,food")
+
+    def test_travel_search_form_thirty_day_trip_allowed(self):
+        """Test a trip of exactly 30 days is accepted"""
+        form_data = {
+            "destination": "Australia",
+            "start_date": (date.today() + timedelta(days=10)).isoformat(),
+            "end_date": (date.today() + timedelta(days=40)).isoformat(),
+            "adults": 2,
+        }
+        form = TravelSearchForm(data=form_data)
+        self.assertTrue(form.is_valid())
+
     def test_travel_search_form_long_duration(self):
         """Test form rejects trips over 30 days"""
         form_data = {
@@ -1881,6 +1920,32 @@ class FormValidationTest(TestCase):
         form = QuickSearchForm(data=form_data)
         self.assertFalse(form.is_valid())
 
+    def test_quick_search_form_past_dates(self):
+        """Test QuickSearchForm rejects a past start date on the field"""
+        form_data = {
+            "destination": "London",
+            "start_date": (date.today() - timedelta(days=2)).isoformat(),
+            "end_date": (date.today() + timedelta(days=5)).isoformat(),
+            "adults": 2,
+        }
+        form = QuickSearchForm(data=form_data)
+        self.assertFalse(form.is_valid())
+        self.assertIn("Start date cannot be in the past", str(form.errors["start_date"]))
+
+    def test_validate_trip_dates(self):
+        """Test the shared cross-field date rules"""
+        from django.core.exceptions import ValidationError
+        from ai_implementation.forms import validate_trip_dates, MAX_TRIP_LENGTH
+
+        start = date(2026, 6, 1)
+        validate_trip_dates(start, start + timedelta(days=45))
+        validate_trip_dates(start, start + timedelta(days=30), MAX_TRIP_LENGTH)
+
+        with self.assertRaises(ValidationError):
+            validate_trip_dates(start, start)
+        with self.assertRaises(ValidationError):
+            validate_trip_dates(start, start + timedelta(days=31), MAX_TRIP_LENGTH)
+
 
 # ============================================================================
 # REFINE SEARCH FORM TESTS
@@ -2181,7 +2246,7 @@ class ErrorHandlingTest(TestCase):
         with self.assertRaises(Exception) as exc:
             service.generate_three_itinerary_options(
                 member_preferences=[],
-                flight_results=[],
+                flight_results=[{"id": "flight_1", "price": 500}],
                 hotel_results=[],
                 activity_results=[],
             )
@@ -3127,7 +3192,7 @@ class OpenAIErrorHandlingTest(TestCase):
         service = OpenAIService()
 
         result = service.consolidate_travel_results(
-            flight_results=[],
+            flight_results=[{"id": "f1", "price": 500}],
             hotel_results=[],
             activity_results=[],
             user_preferences={},
@@ -6304,7 +6369,7 @@ class HelperFunctionTest(TestCase):
 class SerpApiConnectorErrorTest(TestCase):
     """Tests for SerpApi connector error handling"""
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_api_error(self, mock_get):
         """Test search_flights handles API errors"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -6321,7 +6386,7 @@ class SerpApiConnectorErrorTest(TestCase):
 
         self.assertIn("SerpApi request failed", str(context.exception))
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_invalid_response(self, mock_get):
         """Test search_flights handles invalid JSON response"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -6341,7 +6406,7 @@ class SerpApiConnectorErrorTest(TestCase):
 
         self.assertIn("SerpApi Google Flights search error", str(context.exception))
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_fallback_on_unauthorized(self, mock_get):
         """Unauthorized responses should fall back to mock data"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -6364,7 +6429,7 @@ class SerpApiConnectorErrorTest(TestCase):
         self.assertGreater(len(results), 0)
         self.assertTrue(all(flight.get("is_mock") for flight in results))
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_no_api_key(self, mock_get):
         """Test search_flights without API key returns mock data"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -6381,7 +6446,7 @@ class SerpApiConnectorErrorTest(TestCase):
         self.assertGreater(len(results), 0)
         mock_get.assert_not_called()
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_activities_api_error(self, mock_get):
         """Test search_activities handles API errors"""
         from ai_implementation.serpapi_connector import SerpApiActivitiesConnector
@@ -6396,7 +6461,7 @@ class SerpApiConnectorErrorTest(TestCase):
         # Should return mock data on error
         self.assertIsInstance(results, list)
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_http_error(self, mock_get):
         """Test search_flights handles HTTP errors"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -6420,7 +6485,7 @@ class SerpApiConnectorErrorTest(TestCase):
             # Or may raise exception
             pass
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_empty_response(self, mock_get):
         """Test search_flights handles empty response"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -6440,7 +6505,7 @@ class SerpApiConnectorErrorTest(TestCase):
 
         self.assertIn("SerpApi Google Flights search error", str(context.exception))
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_activities_invalid_response(self, mock_get):
         """Test search_activities handles invalid JSON response"""
         from ai_implementation.serpapi_connector import SerpApiActivitiesConnector
@@ -6458,7 +6523,7 @@ class SerpApiConnectorErrorTest(TestCase):
         # Should return mock data on error
         self.assertIsInstance(results, list)
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_activities_no_api_key(self, mock_get):
         """Test search_activities without API key returns mock data"""
         from ai_implementation.serpapi_connector import SerpApiActivitiesConnector
@@ -6476,7 +6541,7 @@ class SerpApiConnectorErrorTest(TestCase):
 class MakcorpsConnectorErrorTest(TestCase):
     """Tests for Makcorps connector error handling"""
 
-    @patch("ai_implementation.makcorps_connector.requests.get")
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
     def test_search_hotels_api_error(self, mock_get):
         """Test search_hotels handles API errors"""
         from ai_implementation.makcorps_connector import MakcorpsHotelConnector
@@ -6493,7 +6558,7 @@ class MakcorpsConnectorErrorTest(TestCase):
         # Should return mock data on error
         self.assertIsInstance(results, list)
 
-    @patch("ai_implementation.makcorps_connector.requests.get")
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
     def test_search_hotels_invalid_response(self, mock_get):
         """Test search_hotels handles invalid JSON response"""
         from ai_implementation.makcorps_connector import MakcorpsHotelConnector
@@ -6513,7 +6578,7 @@ class MakcorpsConnectorErrorTest(TestCase):
         # Should return mock data on error
         self.assertIsInstance(results, list)
 
-    @patch("ai_implementation.makcorps_connector.requests.get")
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
     def test_search_hotels_no_api_key(self, mock_get):
         """Test search_hotels without API key returns mock data"""
         from ai_implementation.makcorps_connector import MakcorpsHotelConnector
@@ -6529,7 +6594,7 @@ class MakcorpsConnectorErrorTest(TestCase):
         self.assertIsInstance(results, list)
         mock_get.assert_not_called()
 
-    @patch("ai_implementation.makcorps_connector.requests.get")
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
     def test_search_hotels_http_error(self, mock_get):
         """Test search_hotels handles HTTP errors"""
         from ai_implementation.makcorps_connector import MakcorpsHotelConnector
@@ -6560,7 +6625,7 @@ class MakcorpsConnectorErrorTest(TestCase):
         self.assertEqual(connector._extract_city_name("Alberta, Canada"), "Alberta")
         self.assertEqual(connector._extract_city_name("Sicily, Italy"), "Sicily")
 
-    @patch("ai_implementation.makcorps_connector.requests.get")
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
     def test_search_hotels_401_error(self, mock_get):
         """Test search_hotels handles 401 unauthorized error"""
         from ai_implementation.makcorps_connector import MakcorpsHotelConnector
@@ -6580,7 +6645,7 @@ class MakcorpsConnectorErrorTest(TestCase):
         # Should return mock data on 401
         self.assertIsInstance(results, list)
 
-    @patch("ai_implementation.makcorps_connector.requests.get")
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
     def test_search_hotels_404_error(self, mock_get):
         """Test search_hotels handles 404 not found error"""
         from ai_implementation.makcorps_connector import MakcorpsHotelConnector
@@ -6619,7 +6684,7 @@ class OpenAIServiceErrorTest(TestCase):
         with self.assertRaises(Exception):
             service.generate_three_itinerary_options(
                 member_preferences=[],
-                flight_results=[],
+                flight_results=[{"id": "f1", "price": 500}],
                 hotel_results=[],
                 activity_results=[],
                 selected_dates={},
@@ -6728,7 +6793,7 @@ class OpenAIServiceErrorTest(TestCase):
 
         result = service.generate_three_itinerary_options(
             member_preferences=[],
-            flight_results=[],
+            flight_results=[{"id": "f1", "price": 500}],
             hotel_results=[],
             activity_results=[],
             selected_dates={},
@@ -6761,7 +6826,7 @@ class OpenAIServiceErrorTest(TestCase):
         try:
             result = service.generate_three_itinerary_options(
                 member_preferences=[],
-                flight_results=[],
+                flight_results=[{"id": "f1", "price": 500}],
                 hotel_results=[],
                 activity_results=[],
                 selected_dates={},
@@ -7783,7 +7848,7 @@ class GenerateVotingOptionsDestinationFallbackTest(TestCase):
 class SerpApiDateParsingTest(TestCase):
     """Tests for SerpAPI date parsing edge cases"""
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_parse_serpapi_response_date_formats(self, mock_get):
         """Test parsing various date formats from SerpAPI"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -7824,7 +7889,7 @@ class SerpApiDateParsingTest(TestCase):
         # Should parse dates correctly
         self.assertIsInstance(results, list)
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_parse_serpapi_response_next_day_arrival(self, mock_get):
         """Test parsing flight with next-day arrival"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -7861,7 +7926,7 @@ class SerpApiDateParsingTest(TestCase):
         # Should handle next-day arrival
         self.assertIsInstance(results, list)
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_parse_serpapi_response_invalid_date_format(self, mock_get):
         """Test parsing with invalid date format falls back gracefully"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -8917,7 +8982,7 @@ class GenerateVotingOptionsActivityPreferencesTest(TestCase):
 class SerpApiConnectorParsingTest(TestCase):
     """Tests for SerpAPI connector response parsing variations"""
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_parse_serpapi_flights_dict_structure(self, mock_get):
         """Test parsing SerpAPI response with flights dict structure"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -8952,7 +9017,7 @@ class SerpApiConnectorParsingTest(TestCase):
 
         self.assertIsInstance(results, list)
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_parse_serpapi_flights_price_variations(self, mock_get):
         """Test parsing various price formats from SerpAPI"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -10173,7 +10238,7 @@ class GenerateSingleNewOptionTest(TestCase):
 class SerpApiConnectorResponseVariationsTest(TestCase):
     """Tests for various SerpAPI response format variations"""
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_parse_serpapi_flights_list_structure(self, mock_get):
         """Test parsing SerpAPI response with flights as list"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -10206,7 +10271,7 @@ class SerpApiConnectorResponseVariationsTest(TestCase):
 
         self.assertIsInstance(results, list)
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_parse_serpapi_flights_price_per_person(self, mock_get):
         """Test parsing SerpAPI response with price_per_person"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -10240,7 +10305,7 @@ class SerpApiConnectorResponseVariationsTest(TestCase):
 
         self.assertIsInstance(results, list)
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_parse_serpapi_flights_airline_dict(self, mock_get):
         """Test parsing SerpAPI response with airline as dict"""
         from ai_implementation.serpapi_connector import SerpApiFlightsConnector
@@ -14619,7 +14684,7 @@ class SerpApiConnectorTest(TestCase):
         result = connector._parse_time("invalid-time", "2026-04-17")
         self.assertEqual(result, "2026-04-17T12:00:00")
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_success(self, mock_get):
         """Test successful flight search with mocked API response"""
         # Mock successful API response
@@ -14663,7 +14728,7 @@ class SerpApiConnectorTest(TestCase):
         self.assertIn("duration", results[0])
         self.assertFalse(results[0].get("is_mock", True))
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_other_flights_format(self, mock_get):
         """Test flight search with 'other_flights' format"""
         mock_response = Mock()
@@ -14700,7 +14765,7 @@ class SerpApiConnectorTest(TestCase):
         self.assertGreater(len(results), 0)
         self.assertEqual(results[0]["airline"], "Delta Airlines")
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_nested_flights_format(self, mock_get):
         """Test flight search with nested 'flights' dict format"""
         mock_response = Mock()
@@ -14735,7 +14800,7 @@ class SerpApiConnectorTest(TestCase):
         self.assertIsInstance(results, list)
         self.assertGreater(len(results), 0)
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_multiple_stops(self, mock_get):
         """Test flight search with multiple stops"""
         mock_response = Mock()
@@ -14774,7 +14839,7 @@ class SerpApiConnectorTest(TestCase):
         self.assertGreater(len(results), 0)
         self.assertEqual(results[0]["stops"], 1)
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_price_per_person(self, mock_get):
         """Test flight search with price per person"""
         mock_response = Mock()
@@ -14813,7 +14878,7 @@ class SerpApiConnectorTest(TestCase):
         # Price should be multiplied by adults
         self.assertGreaterEqual(results[0]["price"], 400.0)
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_http_error(self, mock_get):
         """Test flight search handles HTTP errors"""
         mock_response = Mock()
@@ -14832,7 +14897,7 @@ class SerpApiConnectorTest(TestCase):
 
         self.assertIn("SerpApi Google Flights search error", str(context.exception))
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_no_flights_found(self, mock_get):
         """Test flight search handles no flights in response"""
         mock_response = Mock()
@@ -14850,7 +14915,7 @@ class SerpApiConnectorTest(TestCase):
 
         self.assertIn("SerpApi Google Flights search error", str(context.exception))
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_request_exception(self, mock_get):
         """Test flight search handles request exceptions"""
         mock_get.side_effect = requests.exceptions.RequestException("Connection error")
@@ -14865,7 +14930,7 @@ class SerpApiConnectorTest(TestCase):
 
         self.assertIn("SerpApi request failed", str(context.exception))
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_return_date(self, mock_get):
         """Test flight search with return date (round trip)"""
         mock_response = Mock()
@@ -14904,7 +14969,7 @@ class SerpApiConnectorTest(TestCase):
         self.assertIn("return_date", call_args[1]["params"])
         self.assertEqual(call_args[1]["params"]["return_date"], "2026-04-25")
 
-    @patch("ai_implementation.serpapi_connector.requests.get")
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
     def test_search_flights_max_results_limit(self, mock_get):
         """Test flight search respects max_results limit"""
         # Create response with many flights
@@ -16626,6 +16691,2291 @@ class TestAcceptedTripPreventsNewGeneration(TestCase):
                 self.assertNotIn("already been accepted", data.get("error", ""))
 
 
+class FlightOfferParsingTest(TestCase):
+    """Tests for FlightAPIConnector._parse_flight_offer"""
+
+    def setUp(self):
+        from ai_implementation.api_connectors import FlightAPIConnector
+
+        self.connector = FlightAPIConnector()
+
+    def test_parse_complete_offer(self):
+        """Test parsing an offer with all nested fields present"""
+        offer = {
+            "id": "1",
+            "price": {"total": "412.50", "currency": "EUR"},
+            "numberOfBookableSeats": 4,
+            "itineraries": [
+                {
+                    "duration": "PT7H30M",
+                    "segments": [
+                        {
+                            "carrierCode": "AF",
+                            "cabin": "BUSINESS",
+                            "departure": {"at": "2026-06-01T08:00:00"},
+                            "arrival": {"at": "2026-06-01T15:30:00"},
+                        },
+                        {"carrierCode": "AF"},
+                    ],
+                }
+            ],
+        }
+
+        flight = self.connector._parse_flight_offer(offer)
+
+        self.assertEqual(flight["price"], 412.5)
+        self.assertEqual(flight["currency"], "EUR")
+        self.assertEqual(flight["airline"], "AF")
+        self.assertEqual(flight["departure_time"], "2026-06-01T08:00:00")
+        self.assertEqual(flight["arrival_time"], "2026-06-01T15:30:00")
+        self.assertEqual(flight["duration"], "PT7H30M")
+        self.assertEqual(flight["stops"], 1)
+        self.assertEqual(flight["booking_class"], "BUSINESS")
+        self.assertEqual(flight["seats_available"], 4)
+
+    def test_parse_sparse_offer_uses_defaults(self):
+        """Test missing or null nested objects fall back to defaults"""
+        offer = {"id": "2", "price": None, "itineraries": [{"segments": [{}]}]}
+
+        flight = self.connector._parse_flight_offer(offer)
+
+        self.assertEqual(flight["price"], 0.0)
+        self.assertEqual(flight["currency"], "USD")
+        self.assertEqual(flight["airline"], "Unknown")
+        self.assertEqual(flight["departure_time"], "N/A")
+        self.assertEqual(flight["arrival_time"], "N/A")
+        self.assertEqual(flight["stops"], 0)
+
+    def test_parse_offer_without_itineraries(self):
+        """Test an offer with no itineraries still parses"""
+        flight = self.connector._parse_flight_offer({"id": "3"})
+
+        self.assertEqual(flight["id"], "3")
+        self.assertEqual(flight["duration"], "N/A")
+
+
+class FlightOfferResponseTest(TestCase):
+    """Tests for reading flight offers out of the Amadeus response"""
+
+    RESPONSE_BODY = json.dumps(
+        {
+            "meta": {"count": 2},
+            "data": [
+                {"id": "1", "price": {"total": "199.99", "currency": "USD"}},
+                {"id": "2", "price": {"total": "250.00", "currency": "USD"}},
+            ],
+        }
+    ).encode()
+
+    def setUp(self):
+        from ai_implementation.api_connectors import FlightAPIConnector
+
+        from django.core.cache import cache
+
+        cache.clear()
+        self.connector = FlightAPIConnector()
+        self.connector.api_key = "key"
+        self.connector.api_secret = "secret"
+        self.connector.access_token = "token"
+
+    def _mock_response(self):
+        response = Mock()
+        response.content = self.RESPONSE_BODY
+        response.json.return_value = json.loads(self.RESPONSE_BODY)
+        return response
+
+    @patch("ai_implementation.api_connectors.requests.Session.get")
+    def test_search_flights_without_msgspec(self, mock_get):
+        """Test the full response body is parsed when msgspec is unavailable"""
+        mock_get.return_value = self._mock_response()
+
+        with patch("ai_implementation.api_connectors.USE_MSGSPEC", False):
+            flights = self.connector.search_flights("LAX", "JFK", "2026-06-01")
+
+        self.assertEqual([f["id"] for f in flights], ["1", "2"])
+        self.assertEqual(flights[0]["price"], 199.99)
+
+
+class AmadeusSchemaTest(TestCase):
+    """Tests for the typed msgspec decoder of Amadeus flight offers"""
+
+    def test_decode_matches_dict_parser(self):
+        """Test typed decoding produces the same output as _parse_flight_offer"""
+        from ai_implementation.amadeus_schema import (
+            FLIGHT_OFFERS_DECODER,
+            flight_offer_to_dict,
+        )
+        from ai_implementation.api_connectors import FlightAPIConnector
+
+        body = {
+            "data": [
+                {
+                    "id": "1",
+                    "price": {"total": "412.50", "currency": "EUR"},
+                    "numberOfBookableSeats": 4,
+                    "itineraries": [
+                        {
+                            "duration": "PT7H30M",
+                            "segments": [
+                                {
+                                    "carrierCode": "AF",
+                                    "departure": {"at": "2026-06-01T08:00:00"},
+                                    "arrival": {"at": "2026-06-01T15:30:00"},
+                                    "number": "1234",
+                                }
+                            ],
+                        }
+                    ],
+                },
+                {"id": "2"},
+            ]
+        }
+
+        offers = FLIGHT_OFFERS_DECODER.decode(json.dumps(body)).data
+        connector = FlightAPIConnector()
+
+        for offer, raw in zip(offers, body["data"]):
+            self.assertEqual(
+                flight_offer_to_dict(offer), connector._parse_flight_offer(raw)
+            )
+
+    @patch("ai_implementation.api_connectors.requests.Session.get")
+    def test_search_flights_uses_typed_decoder(self, mock_get):
+        """Test search_flights decodes the raw body when msgspec is available"""
+        from ai_implementation.api_connectors import FlightAPIConnector
+
+        from django.core.cache import cache
+
+        cache.clear()
+        connector = FlightAPIConnector()
+        connector.api_key = "key"
+        connector.api_secret = "secret"
+        connector.access_token = "token"
+        mock_get.return_value.content = json.dumps(
+            {"data": [{"id": "9", "price": {"total": "99.00"}}]}
+        ).encode()
+
+        with patch("ai_implementation.api_connectors.USE_MSGSPEC", True):
+            flights = connector.search_flights("LAX", "JFK", "2026-06-01")
+
+        self.assertEqual(flights[0]["id"], "9")
+        self.assertEqual(flights[0]["price"], 99.0)
+        mock_get.return_value.json.assert_not_called()
+
+    @patch("ai_implementation.api_connectors.requests.Session.get")
+    def test_bad_offer_does_not_fail_response(self, mock_get):
+        """Test an offer that fails to decode is reported on its own"""
+        from ai_implementation.api_connectors import FlightAPIConnector
+
+        from django.core.cache import cache
+
+        cache.clear()
+        connector = FlightAPIConnector()
+        connector.api_key = "key"
+        connector.api_secret = "secret"
+        connector.access_token = "token"
+        mock_get.return_value.content = json.dumps(
+            {
+                "data": [
+                    {"id": 1},
+                    {"id": "2", "price": {"total": "N/A"}},
+                    {"id": "3", "price": {"total": "99.00"}},
+                ]
+            }
+        ).encode()
+
+        with patch("ai_implementation.api_connectors.USE_MSGSPEC", True):
+            flights = connector.search_flights("LAX", "JFK", "2026-06-01")
+
+        self.assertEqual(flights[0], {"error": "Failed to parse flight data"})
+        self.assertEqual(flights[1], {"error": "Failed to parse flight data"})
+        self.assertEqual(flights[2]["id"], "3")
+
+
+class HotelMockDataNightsTest(TestCase):
+    """Tests for night calculation in HotelAPIConnector mock data"""
+
+    def test_nights_calculated_once_per_search(self):
+        """Test the stay length is computed once, not once per hotel"""
+        from ai_implementation.api_connectors import HotelAPIConnector
+
+        connector = HotelAPIConnector()
+        with patch.object(
+            connector, "_calculate_nights", return_value=3
+        ) as mock_nights:
+            hotels = connector.search_hotels(
+                "Paris", "2026-06-01", "2026-06-04", adults=2, rooms=2
+            )
+
+        mock_nights.assert_called_once_with("2026-06-01", "2026-06-04")
+        for hotel in hotels:
+            self.assertEqual(hotel["total_price"], hotel["price_per_night"] * 3 * 2)
+
+
+class HotelCalculateNightsTest(TestCase):
+    """Tests for HotelAPIConnector._calculate_nights"""
+
+    def setUp(self):
+        from ai_implementation.api_connectors import HotelAPIConnector
+
+        self.connector = HotelAPIConnector()
+
+    def test_calculate_nights_iso_dates(self):
+        """Test nights between ISO dates, including across a month boundary"""
+        self.assertEqual(self.connector._calculate_nights("2026-06-01", "2026-06-05"), 4)
+        self.assertEqual(self.connector._calculate_nights("2026-01-30", "2026-02-02"), 3)
+
+    def test_calculate_nights_invalid_input(self):
+        """Test malformed or missing dates fall back to one night"""
+        self.assertEqual(self.connector._calculate_nights("06/01/2026", "2026-06-05"), 1)
+        self.assertEqual(self.connector._calculate_nights(None, "2026-06-05"), 1)
+
+
+class AggregatorConcurrencyTest(TestCase):
+    """Tests for concurrent fan-out in TravelAPIAggregator.search_all"""
+
+    def setUp(self):
+        from ai_implementation.api_connectors import TravelAPIAggregator
+
+        self.aggregator = TravelAPIAggregator()
+
+    def test_search_all_runs_searches_concurrently(self):
+        """Test the three searches overlap instead of running back to back"""
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait_for_others(*args, **kwargs):
+            barrier.wait()
+            return [{"id": threading.current_thread().name}]
+
+        self.aggregator.flight_api.search_flights = wait_for_others
+        self.aggregator.hotel_api.search_hotels = wait_for_others
+        self.aggregator.activity_api.search_activities = wait_for_others
+
+        results = self.aggregator.search_all(
+            destination="Paris",
+            origin="JFK",
+            start_date="2026-06-01",
+            end_date="2026-06-05",
+        )
+
+        self.assertEqual(results["errors"], [])
+        self.assertEqual(len(results["flights"]), 1)
+        self.assertEqual(len(results["hotels"]), 1)
+        self.assertEqual(len(results["activities"]), 1)
+
+    def test_search_all_collects_errors_per_service(self):
+        """Test a failing service is reported without losing the others"""
+        self.aggregator.hotel_api.search_hotels = Mock(side_effect=Exception("boom"))
+
+        results = self.aggregator.search_all(
+            destination="Paris",
+            origin="JFK",
+            start_date="2026-06-01",
+            end_date="2026-06-05",
+            preferences={"activity_preferences": ["food"]},
+        )
+
+        self.assertEqual(results["errors"], ["Hotel search error: Request failed"])
+        self.assertEqual(results["hotels"], [])
+        self.assertTrue(results["flights"])
+        self.assertTrue(
+            all(a["category"] == "food" for a in results["activities"])
+        )
+
+
+@override_settings(AMADEUS_FLIGHT_CACHE_TIMEOUT=600)
+class FlightSearchCacheTest(TestCase):
+    """Tests for caching FlightAPIConnector search results"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from ai_implementation.api_connectors import FlightAPIConnector
+
+        cache.clear()
+        self.connector = FlightAPIConnector()
+        self.connector.api_key = "key"
+        self.connector.api_secret = "secret"
+        self.connector.access_token = "token"
+
+    def _mock_response(self):
+        response = Mock()
+        response.content = json.dumps(
+            {"data": [{"id": "1", "price": {"total": "120.00"}}]}
+        ).encode()
+        return response
+
+    @patch("ai_implementation.api_connectors.requests.Session.get")
+    def test_equivalent_searches_hit_cache(self, mock_get):
+        """Test case and whitespace variants of a route share one API call"""
+        mock_get.return_value = self._mock_response()
+
+        first = self.connector.search_flights("lax", "JFK ", "2026-06-01")
+        second = self.connector.search_flights(" LAX", "jfk", "2026-06-01")
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("ai_implementation.api_connectors.requests.Session.get")
+    def test_different_dates_miss_cache(self, mock_get):
+        """Test a different travel date triggers a new API call"""
+        mock_get.return_value = self._mock_response()
+
+        self.connector.search_flights("LAX", "JFK", "2026-06-01")
+        self.connector.search_flights("LAX", "JFK", "2026-06-02")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("ai_implementation.api_connectors.requests.Session.get")
+    def test_no_cache_bypasses_cache(self, mock_get):
+        """Test no_cache=True always queries the API"""
+        mock_get.return_value = self._mock_response()
+
+        self.connector.search_flights("LAX", "JFK", "2026-06-01")
+        self.connector.search_flights("LAX", "JFK", "2026-06-01", no_cache=True)
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("ai_implementation.api_connectors.requests.Session.get")
+    def test_failed_search_not_cached(self, mock_get):
+        """Test mock fallback data from a failed request is not cached"""
+        mock_get.side_effect = requests.exceptions.ConnectionError()
+
+        self.connector.search_flights("LAX", "JFK", "2026-06-01")
+        mock_get.side_effect = None
+        mock_get.return_value = self._mock_response()
+        flights = self.connector.search_flights("LAX", "JFK", "2026-06-01")
+
+        self.assertEqual(flights[0]["id"], "1")
+        self.assertEqual(mock_get.call_count, 2)
+
+    @override_settings(AMADEUS_FLIGHT_CACHE_TIMEOUT=0)
+    @patch("ai_implementation.api_connectors.requests.Session.get")
+    def test_zero_timeout_disables_cache(self, mock_get):
+        """Test AMADEUS_FLIGHT_CACHE_TIMEOUT=0 queries the API every time"""
+        mock_get.return_value = self._mock_response()
+
+        self.connector.search_flights("LAX", "JFK", "2026-06-01")
+        self.connector.search_flights("LAX", "JFK", "2026-06-01")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+
+class APIConnectorLoggingTest(TestCase):
+    """Tests that API connector failures are reported through logging"""
+
+    @patch("ai_implementation.api_connectors.requests.Session.get")
+    def test_make_request_failure_logs_warning(self, mock_get):
+        """Test a failed request logs a warning and returns None"""
+        from ai_implementation.api_connectors import BaseAPIConnector
+
+        mock_get.side_effect = requests.exceptions.ConnectionError()
+
+        with self.assertLogs("ai_implementation.api_connectors", "WARNING") as logs:
+            result = BaseAPIConnector()._make_request("https://example.com")
+
+        self.assertIsNone(result)
+        self.assertIn("API request failed", logs.output[0])
+
+    @patch("ai_implementation.api_connectors.requests.Session.get")
+    def test_geocode_failure_logs_location(self, mock_get):
+        """Test geocoding errors log the location without exception details"""
+        from ai_implementation.api_connectors import WeatherAPIConnector
+
+        mock_get.side_effect = requests.exceptions.Timeout("secret detail")
+
+        with self.assertLogs("ai_implementation.api_connectors", "WARNING") as logs:
+            result = WeatherAPIConnector().geocode_location("Paris, France")
+
+        self.assertIsNone(result)
+        self.assertIn("Paris, France", logs.output[0])
+        self.assertNotIn("secret detail", logs.output[0])
+
+
+class MockDataBatchedRandomTest(TestCase):
+    """Tests for the batched random draws in API connector mock data"""
+
+    def test_mock_values_within_ranges(self):
+        """Test batched draws keep every field inside its original range"""
+        from ai_implementation.api_connectors import (
+            FlightAPIConnector,
+            HotelAPIConnector,
+            ActivityAPIConnector,
+        )
+
+        flights = FlightAPIConnector()._get_mock_flight_data(
+            "LAX", "JFK", "2026-06-01", None, 2
+        )
+        hotels = HotelAPIConnector()._get_mock_hotel_data(
+            "Paris", "2026-06-01", "2026-06-03", 2, 1
+        )
+        activities = ActivityAPIConnector()._get_mock_activity_data(
+            "Rome", ["food", "unknown"]
+        )
+
+        self.assertEqual(len(flights), 5)
+        for flight in flights:
+            self.assertTrue(300 <= flight["price"] <= 1100)
+            self.assertIn(flight["stops"], [0, 1, 2])
+            self.assertTrue(1 <= flight["seats_available"] <= 9)
+
+        self.assertEqual(len(hotels), 8)
+        self.assertEqual(len({h["id"] for h in hotels}), 8)
+        for hotel in hotels:
+            self.assertTrue(80 <= hotel["price_per_night"] <= 400)
+            self.assertTrue(3 <= len(hotel["amenities"]) <= 6)
+            self.assertEqual(len(set(hotel["amenities"])), len(hotel["amenities"]))
+
+        self.assertEqual(len(activities), 10)
+        for activity in activities:
+            self.assertIn(activity["category"], ["food", "unknown"])
+            self.assertTrue(20 <= activity["price"] <= 200)
+            self.assertTrue(1 <= len(activity["languages"]) <= 3)
+
+
+class AmadeusRecordTest(TestCase):
+    """Tests for the memory layout of decoded Amadeus records"""
+
+    def test_decoded_records_are_compact(self):
+        """Test decoded offers are slotted, immutable and untracked by the GC"""
+        import gc
+        from ai_implementation.amadeus_schema import FLIGHT_OFFERS_DECODER
+
+        offer = FLIGHT_OFFERS_DECODER.decode(
+            b'{"data": [{"id": "1", "itineraries": [{"segments": [{}]}]}]}'
+        ).data[0]
+
+        self.assertFalse(hasattr(offer, "__dict__"))
+        self.assertFalse(gc.is_tracked(offer))
+        with self.assertRaises(AttributeError):
+            offer.id = "2"
+
+
+class APIConnectorRetryTest(TestCase):
+    """Tests for retry/backoff configuration on API connector sessions"""
+
+    def test_session_retries_rate_limits_and_server_errors(self):
+        """Test the mounted adapter retries 429/5xx with backoff"""
+        from ai_implementation.api_connectors import FlightAPIConnector
+
+        connector = FlightAPIConnector()
+        retry = connector.session.get_adapter("https://test.api.amadeus.com").max_retries
+
+        self.assertEqual(retry.total, 3)
+        self.assertEqual(retry.backoff_factor, 0.5)
+        self.assertTrue(retry.respect_retry_after_header)
+        for status in [429, 500, 502, 503, 504]:
+            self.assertIn(status, retry.status_forcelist)
+        self.assertIn("POST", retry.allowed_methods)
+
+    def test_each_connector_has_own_session(self):
+        """Test connectors do not share a session across instances"""
+        from ai_implementation.api_connectors import BaseAPIConnector
+
+        self.assertIsNot(BaseAPIConnector().session, BaseAPIConnector().session)
+
+
+class SerpApiSessionTest(TestCase):
+    """Tests for the pooled HTTP session shared by SerpApi connectors"""
+
+    def test_connectors_share_pooled_session(self):
+        """Test flight and activity connectors reuse one keep-alive pool"""
+        flights = SerpApiFlightsConnector()
+        activities = SerpApiActivitiesConnector()
+
+        self.assertIs(flights.session, activities.session)
+        self.assertIs(flights.session, SerpApiFlightsConnector().session)
+
+    def test_session_retries_rate_limits_and_server_errors(self):
+        """Test the mounted adapter retries 429/5xx with backoff"""
+        from ai_implementation.serpapi_connector import SerpApiFlightsConnector
+
+        adapter = SerpApiFlightsConnector().session.get_adapter("https://serpapi.com")
+
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertFalse(adapter.max_retries.raise_on_status)
+        for status in [429, 500, 502, 503, 504]:
+            self.assertIn(status, adapter.max_retries.status_forcelist)
+
+
+class PerformSearchConcurrencyTest(TestCase):
+    """Tests for running perform_search's API searches concurrently"""
+
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user("testuser", "test@test.com", "pass123")
+        self.search = TravelSearch.objects.create(
+            user=self.user,
+            destination="Paris",
+            start_date=date.today() + timedelta(days=30),
+            end_date=date.today() + timedelta(days=35),
+            adults=1,
+        )
+
+    @patch("ai_implementation.views.SerpApiFlightsConnector")
+    @patch("ai_implementation.views.SerpApiActivitiesConnector")
+    @patch("ai_implementation.views.MakcorpsHotelConnector")
+    def test_searches_run_off_the_request_thread(
+        self, mock_makcorps, mock_activities, mock_flights
+    ):
+        """Test each search runs on a worker thread and a failure is isolated"""
+        import threading
+
+        threads = {}
+
+        def record(name, result):
+            def side_effect(**kwargs):
+                threads[name] = threading.current_thread()
+                if isinstance(result, Exception):
+                    raise result
+                return result
+
+            return side_effect
+
+        mock_flights.return_value.search_flights.side_effect = record(
+            "flights", Exception("API Error")
+        )
+        mock_makcorps.return_value.search_hotels.side_effect = record("hotels", [])
+        mock_activities.return_value.search_activities.side_effect = record(
+            "activities", []
+        )
+
+        self.client.login(username="testuser", password="pass123")
+        url = reverse("ai_implementation:perform_search", args=[self.search.id])
+        response = self.client.post(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(threads), {"flights", "hotels", "activities"})
+        for thread in threads.values():
+            self.assertIsNot(thread, threading.main_thread())
+
+
+@override_settings(GEOCODE_CACHE_TIMEOUT=1800)
+class GeocodeCacheTest(TestCase):
+    """Tests for caching WeatherAPIConnector geocoding lookups"""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+
+    def _mock_response(self):
+        response = Mock()
+        response.json.return_value = {
+            "results": [
+                {
+                    "name": "Paris",
+                    "country": "France",
+                    "latitude": 48.85,
+                    "longitude": 2.35,
+                    "population": 2000000,
+                }
+            ]
+        }
+        return response
+
+    @patch("ai_implementation.api_connectors.requests.Session.get")
+    def test_equivalent_locations_hit_cache(self, mock_get):
+        """Test case and whitespace variants of a place share one API call"""
+        from ai_implementation.api_connectors import WeatherAPIConnector
+
+        mock_get.return_value = self._mock_response()
+        connector = WeatherAPIConnector()
+
+        first = connector.geocode_location("Paris, France")
+        second = connector.geocode_location("  paris,   FRANCE")
+
+        self.assertEqual(first, second)
+        self.assertEqual(first["name"], "Paris")
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("ai_implementation.api_connectors.requests.Session.get")
+    def test_failed_lookup_not_cached(self, mock_get):
+        """Test a failed geocoding lookup is retried on the next call"""
+        from ai_implementation.api_connectors import WeatherAPIConnector
+
+        mock_get.side_effect = requests.exceptions.ConnectionError()
+        connector = WeatherAPIConnector()
+
+        self.assertIsNone(connector.geocode_location("Paris, France"))
+        mock_get.side_effect = None
+        mock_get.return_value = self._mock_response()
+        location = connector.geocode_location("Paris, France")
+
+        self.assertEqual(location["name"], "Paris")
+        self.assertEqual(mock_get.call_count, 2)
+
+
+@override_settings(SERPAPI_FLIGHT_CACHE_TIMEOUT=600)
+class SerpApiFlightCacheTest(TestCase):
+    """Tests for caching SerpApiFlightsConnector search results"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from ai_implementation.serpapi_connector import SerpApiFlightsConnector
+
+        cache.clear()
+        self.connector = SerpApiFlightsConnector()
+        self.connector.api_key = "test-key"
+
+    def _mock_response(self):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            "best_flights": [
+                {
+                    "price": 500,
+                    "flights": [
+                        {
+                            "departure_airport": {"time": "2026-06-01 10:00"},
+                            "arrival_airport": {"time": "2026-06-01 14:00"},
+                            "airline": "Test Air",
+                        }
+                    ],
+                }
+            ]
+        }
+        return response
+
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
+    def test_equivalent_searches_hit_cache(self, mock_get):
+        """Test case, whitespace and out-of-range adults share one API call"""
+        mock_get.return_value = self._mock_response()
+
+        first = self.connector.search_flights(
+            "new  york", "Paris", "2026-06-01", adults=12
+        )
+        second = self.connector.search_flights(
+            "New York", "PARIS ", "2026-06-01", adults=9
+        )
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
+    def test_different_dates_miss_cache(self, mock_get):
+        """Test a different travel date triggers a new API call"""
+        mock_get.return_value = self._mock_response()
+
+        self.connector.search_flights("JFK", "CDG", "2026-06-01")
+        self.connector.search_flights("JFK", "CDG", "2026-06-02")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
+    def test_mock_fallback_not_cached(self, mock_get):
+        """Test mock data from an unauthorized response is not cached"""
+        unauthorized = Mock()
+        unauthorized.status_code = 401
+        unauthorized.text = "Unauthorized"
+        mock_get.return_value = unauthorized
+
+        flights = self.connector.search_flights("JFK", "CDG", "2026-06-01")
+        self.assertTrue(flights[0]["is_mock"])
+
+        mock_get.return_value = self._mock_response()
+        flights = self.connector.search_flights("JFK", "CDG", "2026-06-01")
+
+        self.assertFalse(flights[0]["is_mock"])
+        self.assertEqual(mock_get.call_count, 2)
+
+
+class AirportSearchRowsTest(TestCase):
+    """Tests for the precomputed airport search rows"""
+
+    def test_results_are_independent_copies(self):
+        """Test mutating a result does not leak into later searches"""
+        from ai_implementation.airport_data import search_airports
+
+        first = search_airports("JFK", limit=1)[0]
+        first["code"] = "XXX"
+        first["display"] = "changed"
+
+        second = search_airports("JFK", limit=1)[0]
+        self.assertEqual(second["code"], "JFK")
+        self.assertEqual(second["display"], "JFK - New York, USA")
+        self.assertEqual(second["score"], 100)
+
+
+class SerpApiMockDataBatchedRandomTest(TestCase):
+    """Tests for the batched random draws in SerpApi mock data"""
+
+    def test_mock_values_within_ranges(self):
+        """Test batched draws keep every field inside its original range"""
+        flights = SerpApiFlightsConnector()._get_mock_flight_data(
+            "Denver", "Sicily, Italy", "2026-04-17", None, 2, max_results=10
+        )
+        activities = SerpApiActivitiesConnector()._get_mock_activity_data(
+            "Rome", ["food", "unknown"]
+        )
+
+        self.assertEqual(len(flights), 8)
+        for flight in flights:
+            self.assertTrue(300 <= flight["price"] <= 1100)
+            self.assertIn(flight["stops"], [0, 1, 2])
+            hours = int(flight["duration"].split("h")[0])
+            self.assertTrue(10 <= hours <= 14)
+            self.assertTrue(flight["departure_time"].startswith("2026-04-17T"))
+            self.assertRegex(flight["arrival_time"], r"^2026-04-1[78]T")
+
+        self.assertEqual(len(activities), 10)
+        for activity in activities:
+            self.assertIn(activity["category"], ["food", "unknown"])
+            self.assertTrue(20 <= activity["price"] <= 200)
+            self.assertTrue(1 <= len(activity["languages"]) <= 3)
+
+
+class SerpApiConnectorSlotsTest(TestCase):
+    """Tests for the slotted SerpApi connector instances"""
+
+    def test_connectors_have_no_instance_dict(self):
+        """Test connectors store their attributes in slots"""
+        for connector in (SerpApiFlightsConnector(), SerpApiActivitiesConnector()):
+            self.assertFalse(hasattr(connector, "__dict__"))
+            connector.api_key = "test-key"
+            self.assertEqual(connector.api_key, "test-key")
+
+
+class SerpApiLoggingTest(TestCase):
+    """Tests that SerpApi connectors report through the logging module"""
+
+    @patch("ai_implementation.serpapi_connector.requests.Session.get")
+    def test_request_failure_logs_warning(self, mock_get):
+        """Test a failed flight request logs a warning and raises"""
+        from ai_implementation.serpapi_connector import (
+            SerpApiFlightsConnector,
+            SerpApiConnectorError,
+        )
+
+        mock_get.side_effect = requests.exceptions.ConnectionError("secret detail")
+        connector = SerpApiFlightsConnector()
+        connector.api_key = "test-key"
+
+        with self.assertLogs("ai_implementation.serpapi_connector", "WARNING") as logs:
+            with self.assertRaises(SerpApiConnectorError):
+                connector.search_flights("JFK", "LAX", "2026-06-01")
+
+        self.assertIn("Request failed", logs.output[-1])
+        self.assertNotIn("secret detail", logs.output[-1])
+
+
+@override_settings(MAKCORPS_HOTEL_CACHE_TIMEOUT=3600)
+class MakcorpsHotelCacheTest(TestCase):
+    """Tests for caching Makcorps hotel search responses"""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.connector = MakcorpsHotelConnector()
+        self.connector.api_key = "test-key"
+
+    def _mock_response(self):
+        body = {"hotels": [{"id": "H1", "name": "Cached Hotel", "price": 150}]}
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = body
+        response.content = json.dumps(body).encode()
+        return response
+
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
+    def test_repeated_search_hits_cache(self, mock_get):
+        """Test an identical search is served from the cache"""
+        mock_get.return_value = self._mock_response()
+
+        first = self.connector.search_hotels("Paris", "2026-06-01", "2026-06-05")
+        with patch.object(
+            self.connector, "_parse_makcorps_response"
+        ) as parse_response:
+            second = self.connector.search_hotels(" paris ", "2026-06-01", "2026-06-05")
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[0]["name"], "Cached Hotel")
+        self.assertEqual(mock_get.call_count, 1)
+        parse_response.assert_not_called()
+
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
+    def test_different_search_misses_cache(self, mock_get):
+        """Test changing dates or room count triggers a new API call"""
+        mock_get.return_value = self._mock_response()
+
+        self.connector.search_hotels("Paris", "2026-06-01", "2026-06-05")
+        self.connector.search_hotels("Paris", "2026-06-01", "2026-06-06")
+        self.connector.search_hotels("Paris", "2026-06-01", "2026-06-05", rooms=2)
+
+        self.assertEqual(mock_get.call_count, 3)
+
+    def test_cache_key_normalizes_case_and_whitespace(self):
+        """Test equivalent searches build the same cache key"""
+        key = MakcorpsHotelConnector._get_cache_key(
+            "New  York", "2026-06-01", "2026-06-05", 2, 1, "usd", 1, 20
+        )
+
+        self.assertEqual(
+            key,
+            MakcorpsHotelConnector._get_cache_key(
+                "new york ", "2026-06-01", "2026-06-05", 2, 1, "USD", 1, 20
+            ),
+        )
+        self.assertNotIn(" ", key)
+
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
+    def test_error_response_not_cached(self, mock_get):
+        """Test a failed request is retried on the next search"""
+        failed = Mock()
+        failed.status_code = 500
+        failed.text = "Server error"
+        mock_get.return_value = failed
+
+        hotels = self.connector.search_hotels("Paris", "2026-06-01", "2026-06-05")
+        self.assertTrue(hotels[0]["is_mock"])
+
+        mock_get.return_value = self._mock_response()
+        hotels = self.connector.search_hotels("Paris", "2026-06-01", "2026-06-05")
+
+        self.assertFalse(hotels[0]["is_mock"])
+        self.assertEqual(mock_get.call_count, 2)
+
+
+class MakcorpsSessionTest(TestCase):
+    """Tests for the pooled HTTP session used by MakcorpsHotelConnector"""
+
+    def test_connectors_share_pooled_session(self):
+        """Test connector instances reuse one keep-alive pool"""
+        self.assertIs(
+            MakcorpsHotelConnector().session, MakcorpsHotelConnector().session
+        )
+
+    def test_session_retries_gateway_errors(self):
+        """Test the mounted adapter retries 502/503/504 responses"""
+        adapter = MakcorpsHotelConnector().session.get_adapter(
+            "https://api.makcorps.com"
+        )
+
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertFalse(adapter.max_retries.raise_on_status)
+        for status in [502, 503, 504]:
+            self.assertIn(status, adapter.max_retries.status_forcelist)
+
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
+    def test_requests_use_split_timeout(self, mock_get):
+        """Test searches pass a short connect and bounded read timeout"""
+        mock_get.side_effect = requests.RequestException("offline")
+        connector = MakcorpsHotelConnector()
+        connector.api_key = "test-key"
+
+        connector.search_hotels("Paris", "2026-06-01", "2026-06-05")
+
+        self.assertEqual(mock_get.call_args.kwargs["timeout"], (3.05, 10))
+
+
+class MakcorpsResponseDecodingTest(TestCase):
+    """Tests for decoding Makcorps response bodies"""
+
+    def setUp(self):
+        self.connector = MakcorpsHotelConnector()
+        self.connector.api_key = "test-key"
+        body = {"hotels": [{"id": "H1", "name": "Decoded Hotel", "price": 99.5}]}
+        self.response = Mock()
+        self.response.status_code = 200
+        self.response.json.return_value = body
+        self.response.content = json.dumps(body).encode()
+
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
+    def test_msgspec_decodes_raw_body(self, mock_get):
+        """Test the raw body is decoded without response.json()"""
+        mock_get.return_value = self.response
+
+        with patch("ai_implementation.makcorps_connector.USE_MSGSPEC", True):
+            hotels = self.connector.search_hotels("Paris", "2026-06-01", "2026-06-03")
+
+        self.assertEqual(hotels[0]["name"], "Decoded Hotel")
+        self.assertEqual(hotels[0]["total_price"], 199.0)
+        self.response.json.assert_not_called()
+
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
+    def test_falls_back_to_response_json(self, mock_get):
+        """Test response.json() is used when msgspec is unavailable"""
+        mock_get.return_value = self.response
+
+        with patch("ai_implementation.makcorps_connector.USE_MSGSPEC", False):
+            hotels = self.connector.search_hotels("Paris", "2026-06-01", "2026-06-03")
+
+        self.assertEqual(hotels[0]["name"], "Decoded Hotel")
+        self.response.json.assert_called_once()
+
+
+class MakcorpsFieldLookupTest(TestCase):
+    """Tests for the candidate-key tables used to parse Makcorps hotels"""
+
+    def test_alternate_field_names(self):
+        """Test fallback field names are read in priority order"""
+        connector = MakcorpsHotelConnector()
+        data = {
+            "results": [
+                {
+                    "hotel_id": 7,
+                    "hotel_name": "Alt Hotel",
+                    "nightly_rate": "120",
+                    "star_rating": "4",
+                    "location": "1 Alt St",
+                    "facilities": ["Pool"],
+                    "room": "Suite",
+                    "num_reviews": "12",
+                    "distance_from_center": "2 km",
+                    "breakfast": True,
+                    "photo": {"src": "https://example.com/alt.jpg"},
+                }
+            ]
+        }
+
+        hotel = connector._parse_makcorps_response(
+            data, "Paris", "2026-06-01", "2026-06-03", 1
+        )[0]
+
+        self.assertEqual(hotel["id"], "7")
+        self.assertEqual(hotel["name"], "Alt Hotel")
+        self.assertEqual(hotel["price_per_night"], 120.0)
+        self.assertEqual(hotel["total_price"], 240.0)
+        self.assertEqual(hotel["rating"], 4.0)
+        self.assertEqual(hotel["address"], "1 Alt St")
+        self.assertEqual(hotel["amenities"], ["Pool"])
+        self.assertEqual(hotel["room_type"], "Suite")
+        self.assertEqual(hotel["review_count"], 12)
+        self.assertEqual(hotel["distance_from_center"], "2 km")
+        self.assertTrue(hotel["breakfast_included"])
+        self.assertEqual(hotel["image_url"], "https://example.com/alt.jpg")
+
+    def test_missing_fields_use_defaults(self):
+        """Test a bare record falls back to default values"""
+        connector = MakcorpsHotelConnector()
+
+        hotel = connector._parse_makcorps_response(
+            [{}], "Paris", "2026-06-01", "2026-06-03", 1
+        )[0]
+
+        self.assertEqual(hotel["id"], "MAKCORPS-1")
+        self.assertEqual(hotel["name"], "Unknown Hotel")
+        self.assertEqual(hotel["price_per_night"], 0)
+        self.assertIsNone(hotel["rating"])
+        self.assertEqual(hotel["room_type"], "Standard Room")
+        self.assertIsNone(hotel["image_url"])
+
+    def test_invalid_values_do_not_drop_record(self):
+        """Test unparseable ratings and review counts fall back to defaults"""
+        connector = MakcorpsHotelConnector()
+        data = {
+            "hotels": [
+                "not-a-hotel",
+                {"name": "Odd Hotel", "price": "80", "rating": "", "reviews": "x"},
+            ]
+        }
+
+        hotels = connector._parse_makcorps_response(
+            data, "Paris", "2026-06-01", "2026-06-03", 1
+        )
+
+        self.assertEqual(len(hotels), 1)
+        self.assertEqual(hotels[0]["name"], "Odd Hotel")
+        self.assertEqual(hotels[0]["price_per_night"], 80.0)
+        self.assertIsNone(hotels[0]["rating"])
+        self.assertEqual(hotels[0]["review_count"], 0)
+
+    def test_unparseable_price_skips_record(self):
+        """Test a hotel whose price can't be read is not returned as free"""
+        connector = MakcorpsHotelConnector()
+        data = {
+            "hotels": [
+                {"name": "A", "price": "$129"},
+                {"name": "B", "price": "N/A"},
+                {"name": "C", "total_price": "call us"},
+                {"name": "D", "price": "129"},
+            ]
+        }
+
+        hotels = connector._parse_makcorps_response(
+            data, "Paris", "2026-06-01", "2026-06-03", 1
+        )
+
+        self.assertEqual([h["name"] for h in hotels], ["D"])
+
+    def test_unexpected_error_skips_only_that_record(self):
+        """Test one failing record does not discard the hotels around it"""
+        connector = MakcorpsHotelConnector()
+        data = [{"name": "A"}, {"name": "B"}, {"name": "C"}]
+
+        with patch.object(
+            MakcorpsHotelConnector,
+            "_parse_hotel",
+            side_effect=[{"id": "1"}, RuntimeError("boom"), {"id": "3"}],
+        ):
+            hotels = connector._parse_makcorps_response(
+                data, "Paris", "2026-06-01", "2026-06-03", 1
+            )
+
+        self.assertEqual(hotels, [{"id": "1"}, {"id": "3"}])
+
+
+class MakcorpsMockDataBatchedRandomTest(TestCase):
+    """Tests for the batched random draws in Makcorps mock hotels"""
+
+    def test_mock_hotels_stay_in_range(self):
+        """Test every generated field stays within its original bounds"""
+        connector = MakcorpsHotelConnector()
+
+        hotels = connector._get_mock_hotel_data(
+            "Paris", "2026-06-01", "2026-06-04", 2, 2
+        )
+
+        self.assertEqual(len(hotels), 8)
+        for hotel in hotels:
+            self.assertTrue(80 <= hotel["price_per_night"] <= 400)
+            self.assertEqual(hotel["total_price"], hotel["price_per_night"] * 3 * 2)
+            self.assertTrue(3.5 <= hotel["rating"] <= 5.0)
+            self.assertTrue(50 <= hotel["review_count"] <= 500)
+            self.assertTrue(4 <= len(hotel["amenities"]) <= 7)
+            self.assertEqual(len(set(hotel["amenities"])), len(hotel["amenities"]))
+            distance = float(hotel["distance_from_center"].split()[0])
+            self.assertTrue(0.5 <= distance <= 10.0)
+            self.assertTrue(hotel["is_mock"])
+
+
+class MakcorpsLazyParseTest(TestCase):
+    """Tests for lazily parsing Makcorps hotels up to max_results"""
+
+    def test_parsing_stops_at_max_results(self):
+        """Test records past max_results are never parsed"""
+        from ai_implementation import makcorps_connector
+
+        connector = MakcorpsHotelConnector()
+        data = {"hotels": [{"id": i, "name": f"Hotel {i}"} for i in range(1, 51)]}
+
+        with patch.object(
+            makcorps_connector,
+            "_first_present",
+            wraps=makcorps_connector._first_present,
+        ) as first_present:
+            hotels = connector._parse_makcorps_response(
+                data, "Paris", "2026-06-01", "2026-06-03", 1, max_results=3
+            )
+
+        self.assertEqual([h["id"] for h in hotels], ["1", "2", "3"])
+        # One lookup for the hotel list plus price and rating per parsed hotel
+        self.assertEqual(first_present.call_count, 1 + 3 * 2)
+
+    def test_default_parses_all_hotels(self):
+        """Test all hotels are returned when max_results is not given"""
+        connector = MakcorpsHotelConnector()
+        data = [{"name": f"Hotel {i}"} for i in range(25)]
+
+        hotels = connector._parse_makcorps_response(
+            data, "Paris", "2026-06-01", "2026-06-03", 1
+        )
+
+        self.assertEqual(len(hotels), 25)
+        self.assertEqual(hotels[-1]["id"], "MAKCORPS-25")
+
+
+class MakcorpsHelperCacheTest(TestCase):
+    """Tests for the memoized Makcorps date and city helpers"""
+
+    def test_calculate_nights_is_memoized(self):
+        """Test repeated date pairs are served from the lru_cache"""
+        from ai_implementation.makcorps_connector import _calculate_nights
+
+        _calculate_nights.cache_clear()
+        connector = MakcorpsHotelConnector()
+
+        self.assertEqual(connector._calculate_nights("2026-06-01", "2026-06-05"), 4)
+        self.assertEqual(_calculate_nights("2026-06-01", "2026-06-05"), 4)
+
+        info = _calculate_nights.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_extract_city_name_is_memoized(self):
+        """Test repeated locations are served from the lru_cache"""
+        from ai_implementation.makcorps_connector import _extract_city_name
+
+        _extract_city_name.cache_clear()
+
+        self.assertEqual(_extract_city_name("New York, USA"), "New%20York")
+        self.assertEqual(_extract_city_name("New York, USA"), "New%20York")
+        self.assertEqual(_extract_city_name.cache_info().hits, 1)
+
+    def test_calculate_nights_invalid_input(self):
+        """Test malformed or missing dates count as zero nights"""
+        from ai_implementation.makcorps_connector import _calculate_nights
+
+        self.assertEqual(_calculate_nights("06/01/2026", "2026-06-05"), 0)
+        self.assertEqual(_calculate_nights(None, "2026-06-05"), 0)
+        self.assertEqual(_calculate_nights("2026-06-05", "2026-06-01"), 0)
+
+    def test_extract_city_name_encodes_path_characters(self):
+        """Test reserved and non-ASCII characters are percent-encoded"""
+        from ai_implementation.makcorps_connector import _extract_city_name
+
+        self.assertEqual(_extract_city_name("São Paulo, Brazil"), "S%C3%A3o%20Paulo")
+        self.assertEqual(_extract_city_name("Rock & Roll/Town"), "Rock%20%26%20Roll%2FTown")
+
+
+class FormSharedWidgetAttrsTest(TestCase):
+    """Tests that shared widget attr dicts are never mutated through a form"""
+
+    def test_widget_attrs_are_copies(self):
+        """Test changing one form's widget attrs leaves other forms untouched"""
+        from ai_implementation.forms import _DATE_ATTRS
+
+        form = QuickSearchForm()
+        form.fields["start_date"].widget.attrs["min"] = "2026-01-01"
+
+        self.assertNotIn("min", _DATE_ATTRS)
+        self.assertNotIn("min", QuickSearchForm().fields["end_date"].widget.attrs)
+        self.assertEqual(
+            TravelSearchForm().fields["start_date"].widget.input_type, "date"
+        )
+
+
+class MakcorpsApiKeyCacheTest(TestCase):
+    """Tests for reading the Makcorps API key once per process"""
+
+    def setUp(self):
+        from ai_implementation.makcorps_connector import _get_api_key
+
+        _get_api_key.cache_clear()
+        self.addCleanup(_get_api_key.cache_clear)
+
+    def test_key_read_once(self):
+        """Test later connectors reuse the key read by the first one"""
+        with patch.dict("os.environ", {"HOTEL_API_KEY": "first-key"}):
+            first = MakcorpsHotelConnector()
+        with patch.dict("os.environ", {"HOTEL_API_KEY": "second-key"}):
+            second = MakcorpsHotelConnector()
+
+        self.assertEqual(first.api_key, "first-key")
+        self.assertEqual(second.api_key, "first-key")
+        self.assertEqual(second.headers["Authorization"], "Bearer first-key")
+
+
+class MakcorpsRequestUrlTest(TestCase):
+    """Tests for the Makcorps citysearch request URL"""
+
+    @patch("ai_implementation.makcorps_connector.requests.Session.get")
+    def test_citysearch_url(self, mock_get):
+        """Test every search parameter lands in its path segment"""
+        mock_get.side_effect = requests.RequestException("offline")
+        connector = MakcorpsHotelConnector()
+        connector.api_key = "test-key"
+
+        connector.search_hotels(
+            "San José, Costa Rica",
+            "2026-06-01",
+            "2026-06-05",
+            adults=3,
+            rooms=2,
+            currency="EUR",
+            page=2,
+        )
+
+        self.assertEqual(
+            mock_get.call_args.args[0],
+            "https://api.makcorps.com/citysearch/San%20Jos%C3%A9/2/EUR/2/3/"
+            "2026-06-01/2026-06-05",
+        )
+
+
+class ItineraryVoteCountTest(TestCase):
+    """Tests for the incremental vote_count maintained by ItineraryVote"""
+
+    def setUp(self):
+        self.user = User.objects.create_user("voter1", "v1@test.com", "pass123")
+        self.user2 = User.objects.create_user("voter2", "v2@test.com", "pass123")
+        self.group = TravelGroup.objects.create(
+            name="Vote Group", created_by=self.user, password="group123"
+        )
+        self.consensus = GroupConsensus.objects.create(
+            group=self.group, generated_by=self.user, consensus_preferences="{}"
+        )
+        self.option_a = self._create_option("A")
+        self.option_b = self._create_option("B")
+
+    def _create_option(self, letter):
+        return GroupItineraryOption.objects.create(
+            group=self.group,
+            consensus=self.consensus,
+            option_letter=letter,
+            title=f"Option {letter}",
+            description="Test",
+            estimated_total_cost=2000.00,
+            ai_reasoning="Test",
+        )
+
+    def _counts(self):
+        self.option_a.refresh_from_db()
+        self.option_b.refresh_from_db()
+        return self.option_a.vote_count, self.option_b.vote_count
+
+    def test_new_votes_increment(self):
+        """Test each new vote adds one to its option"""
+        ItineraryVote.objects.create(
+            option=self.option_a, user=self.user, group=self.group
+        )
+        ItineraryVote.objects.create(
+            option=self.option_a, user=self.user2, group=self.group
+        )
+        self.assertEqual(self._counts(), (2, 0))
+
+    def test_resave_same_option_keeps_count(self):
+        """Test editing a vote without moving it leaves the count alone"""
+        vote = ItineraryVote.objects.create(
+            option=self.option_a, user=self.user, group=self.group
+        )
+        vote.comment = "Still A"
+        vote.save()
+        self.assertEqual(self._counts(), (1, 0))
+
+    def test_moving_vote_transfers_count(self):
+        """Test moving a vote decrements the old option and increments the new"""
+        vote = ItineraryVote.objects.create(
+            option=self.option_a, user=self.user, group=self.group
+        )
+        vote.option = self.option_b
+        vote.save()
+        self.assertEqual(self._counts(), (0, 1))
+
+    def test_delete_decrements(self):
+        """Test deleting a vote removes it from the count"""
+        vote = ItineraryVote.objects.create(
+            option=self.option_a, user=self.user, group=self.group
+        )
+        vote.delete()
+        self.assertEqual(self._counts(), (0, 0))
+
+    def test_count_never_negative(self):
+        """Test a drifted zero count is not decremented below zero"""
+        vote = ItineraryVote.objects.create(
+            option=self.option_a, user=self.user, group=self.group
+        )
+        GroupItineraryOption.objects.filter(pk=self.option_a.pk).update(vote_count=0)
+        vote.delete()
+        self.assertEqual(self._counts(), (0, 0))
+
+    def test_update_vote_count_repairs(self):
+        """Test update_vote_count recounts a drifted option"""
+        ItineraryVote.objects.create(
+            option=self.option_a, user=self.user, group=self.group
+        )
+        GroupItineraryOption.objects.filter(pk=self.option_a.pk).update(vote_count=5)
+        self.option_a.update_vote_count()
+        self.assertEqual(self._counts(), (1, 0))
+
+    def test_queryset_delete_decrements(self):
+        """Test a queryset delete takes every removed vote off the count"""
+        ItineraryVote.objects.create(
+            option=self.option_a, user=self.user, group=self.group
+        )
+        ItineraryVote.objects.create(
+            option=self.option_a, user=self.user2, group=self.group
+        )
+        ItineraryVote.objects.filter(group=self.group, option=self.option_a).delete()
+        self.assertEqual(self._counts(), (0, 0))
+
+    def test_roll_again_clears_rejected_option_count(self):
+        """Test roll_again leaves the rejected option with no counted votes"""
+        GroupMember.objects.create(group=self.group, user=self.user, role="admin")
+        GroupMember.objects.create(group=self.group, user=self.user2, role="member")
+        ItineraryVote.objects.create(
+            option=self.option_a, user=self.user2, group=self.group
+        )
+
+        client = Client()
+        client.login(username="voter1", password="pass123")
+        response = client.post(
+            reverse(
+                "ai_implementation:roll_again", args=[self.group.id, self.option_a.id]
+            )
+        )
+
+        self.assertTrue(response.json()["success"])
+        self.assertFalse(ItineraryVote.objects.filter(option=self.option_a).exists())
+        self.assertEqual(self._counts(), (0, 0))
+
+
+class ResultBulkIngestTest(TestCase):
+    """Tests for the batched bulk_ingest on the result models"""
+
+    def setUp(self):
+        self.user = User.objects.create_user("testuser", "test@test.com", "pass123")
+        self.search = TravelSearch.objects.create(
+            user=self.user,
+            destination="Paris",
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=4),
+            adults=2,
+        )
+
+    def test_rows_attached_to_search(self):
+        """Test every row is created for the given search"""
+        now = timezone.now()
+        rows = [
+            dict(
+                external_id=f"flight_{i}",
+                airline="Air Test",
+                price=100 + i,
+                departure_time=now,
+                arrival_time=now + timedelta(hours=3),
+                duration="3h",
+            )
+            for i in range(3)
+        ]
+
+        FlightResult.bulk_ingest(self.search, rows)
+
+        flights = FlightResult.objects.filter(search=self.search)
+        self.assertEqual(flights.count(), 3)
+        self.assertEqual(
+            set(flights.values_list("external_id", flat=True)),
+            {"flight_0", "flight_1", "flight_2"},
+        )
+
+    def test_batches_inserts(self):
+        """Test rows are inserted in INGEST_BATCH_SIZE batches, not one by one"""
+        rows = [
+            dict(external_id=f"act_{i}", name=f"Tour {i}", price=20) for i in range(5)
+        ]
+
+        with patch.object(ActivityResult, "INGEST_BATCH_SIZE", 2):
+            with self.assertNumQueries(3):
+                ActivityResult.bulk_ingest(self.search, rows)
+
+        self.assertEqual(ActivityResult.objects.filter(search=self.search).count(), 5)
+
+    def test_hotel_total_price_filled(self):
+        """Test hotels without a total get nightly rate times nights, as save() does"""
+        HotelResult.bulk_ingest(
+            self.search,
+            [
+                dict(external_id="h1", name="No Total", price_per_night=150),
+                dict(
+                    external_id="h2",
+                    name="Has Total",
+                    price_per_night=150,
+                    total_price=500,
+                ),
+            ],
+        )
+
+        hotels = {h.external_id: h for h in HotelResult.objects.all()}
+        self.assertEqual(hotels["h1"].total_price, Decimal("600.00"))
+        self.assertEqual(hotels["h2"].total_price, Decimal("500.00"))
+
+
+class DefaultManagerSelectRelatedTest(TestCase):
+    """Tests that default managers load the relations __str__ renders"""
+
+    def setUp(self):
+        self.user = User.objects.create_user("testuser", "test@test.com", "pass123")
+        self.group = TravelGroup.objects.create(
+            name="Test Group", created_by=self.user, password="group123"
+        )
+        self.search = TravelSearch.objects.create(
+            user=self.user,
+            destination="Lisbon",
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=3),
+        )
+        consensus = GroupConsensus.objects.create(
+            group=self.group, generated_by=self.user, consensus_preferences="{}"
+        )
+        for letter in "ABC":
+            GroupItineraryOption.objects.create(
+                group=self.group,
+                consensus=consensus,
+                option_letter=letter,
+                title=f"Option {letter}",
+                description="Test",
+                search=self.search,
+                estimated_total_cost=1000.00,
+                ai_reasoning="Test",
+            )
+
+    def test_option_list_single_query(self):
+        """Test rendering every option's __str__ and search costs one query"""
+        with self.assertNumQueries(1):
+            for option in GroupItineraryOption.objects.filter(group=self.group):
+                self.assertIn(option.group.name, str(option))
+                self.assertEqual(option.search.destination, "Lisbon")
+
+    def test_consolidated_result_str_single_query(self):
+        """Test ConsolidatedResult.__str__ does not refetch its search"""
+        ConsolidatedResult.objects.create(search=self.search, summary="Summary")
+        with self.assertNumQueries(1):
+            result = ConsolidatedResult.objects.get(search=self.search)
+            self.assertEqual(str(result), "Results for Lisbon")
+
+    def test_plain_manager_available(self):
+        """Test all_objects skips the joins"""
+        qs = GroupItineraryOption.all_objects.filter(group=self.group)
+        self.assertFalse(qs.query.select_related)
+        self.assertEqual(qs.count(), 3)
+
+
+class CompressedTextFieldTest(TestCase):
+    """Tests for the zlib-compressed raw_openai_response columns"""
+
+    def setUp(self):
+        self.user = User.objects.create_user("testuser", "test@test.com", "pass123")
+        self.search = TravelSearch.objects.create(
+            user=self.user,
+            destination="Oslo",
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=3),
+        )
+        self.payload = json.dumps(
+            {"recommended_hotels": [{"hotel_id": i, "score": 90} for i in range(50)]}
+        )
+
+    def test_round_trip(self):
+        """Test the stored text reads back unchanged"""
+        result = ConsolidatedResult.objects.create(
+            search=self.search, summary="Summary", raw_openai_response=self.payload
+        )
+        result.refresh_from_db()
+        self.assertEqual(result.raw_openai_response, self.payload)
+
+    def test_stored_compressed(self):
+        """Test the column holds fewer bytes than the JSON text"""
+        from django.db.models.functions import Length
+
+        ConsolidatedResult.objects.create(
+            search=self.search, summary="Summary", raw_openai_response=self.payload
+        )
+        stored = ConsolidatedResult.objects.annotate(
+            stored_length=Length("raw_openai_response")
+        ).get(search=self.search)
+        self.assertLess(stored.stored_length, len(self.payload) // 4)
+
+    def test_legacy_plain_text_rows(self):
+        """Test rows written before compression still read as text"""
+        from .fields import CompressedTextField
+
+        field = CompressedTextField()
+        self.assertEqual(field.to_python(b'{"a": 1}'), '{"a": 1}')
+        self.assertEqual(field.to_python('{"a": 1}'), '{"a": 1}')
+        self.assertIsNone(field.to_python(None))
+
+
+class RawResponseDeferTest(TestCase):
+    """Tests that list and detail reads skip the raw OpenAI payloads"""
+
+    def setUp(self):
+        self.user = User.objects.create_user("testuser", "test@test.com", "pass123")
+        self.group = TravelGroup.objects.create(
+            name="Test Group", created_by=self.user, password="group123"
+        )
+        self.consensus = GroupConsensus.objects.create(
+            group=self.group,
+            generated_by=self.user,
+            consensus_preferences="{}",
+            raw_openai_response='{"raw": true}',
+        )
+
+    def test_consensus_defers_raw_response(self):
+        """Test the default manager leaves raw_openai_response unloaded"""
+        consensus = GroupConsensus.objects.get(pk=self.consensus.pk)
+        self.assertIn("raw_openai_response", consensus.get_deferred_fields())
+        self.assertEqual(consensus.raw_openai_response, '{"raw": true}')
+
+    def test_option_consensus_defers_raw_response(self):
+        """Test options load their consensus without the raw payload"""
+        GroupItineraryOption.objects.create(
+            group=self.group,
+            consensus=self.consensus,
+            option_letter="A",
+            title="Option A",
+            description="Test",
+            estimated_total_cost=1000.00,
+            ai_reasoning="Test",
+        )
+        option = GroupItineraryOption.objects.get(group=self.group)
+        self.assertIn("raw_openai_response", option.consensus.get_deferred_fields())
+
+
+class ResultCreatedAtDbDefaultTest(TestCase):
+    """Tests that result created_at timestamps come from the database"""
+
+    def setUp(self):
+        self.user = User.objects.create_user("testuser", "test@test.com", "pass123")
+        self.search = TravelSearch.objects.create(
+            user=self.user,
+            destination="Rome",
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=2),
+        )
+
+    def test_bulk_ingest_stamps_created_at(self):
+        """Test bulk-ingested rows get a timestamp without one being passed"""
+        before = timezone.now() - timedelta(seconds=1)
+        ActivityResult.bulk_ingest(
+            self.search, [dict(external_id="act_1", name="Tour", price=20)]
+        )
+
+        activity = ActivityResult.objects.get(search=self.search)
+        self.assertIsInstance(activity.created_at, datetime)
+        self.assertGreaterEqual(activity.created_at, before)
+
+
+class ConsolidatedResultCacheTest(TestCase):
+    """Tests for caching parsed ConsolidatedResult sections"""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.user = User.objects.create_user("testuser", "test@test.com", "pass123")
+        self.search = TravelSearch.objects.create(
+            user=self.user,
+            destination="Vienna",
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=3),
+        )
+        self.result = ConsolidatedResult.objects.create(
+            search=self.search,
+            summary="Summary",
+            warnings=json.dumps(["Pack an umbrella"]),
+        )
+
+    def test_parsed_once_per_save(self):
+        """Test repeat views reuse the parsed sections"""
+        from .views import _parse_consolidated
+
+        first = _parse_consolidated(self.result)
+        with patch("ai_implementation.views.json.loads") as mock_loads:
+            second = _parse_consolidated(self.result)
+        mock_loads.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(second["warnings"], ["Pack an umbrella"])
+        self.assertEqual(second["budget_analysis"], {})
+
+    def test_save_changes_cache_key(self):
+        """Test saving new content is never served from the old cache entry"""
+        from .views import _parse_consolidated
+
+        _parse_consolidated(self.result)
+        self.result.warnings = json.dumps(["Bring a jacket"])
+        self.result.save()
+
+        self.assertEqual(
+            _parse_consolidated(self.result)["warnings"], ["Bring a jacket"]
+        )
+
+
+class ResultThinQuerySetTest(TestCase):
+    """Tests for the thin() summary querysets on the result models"""
+
+    def setUp(self):
+        self.user = User.objects.create_user("testuser", "test@test.com", "pass123")
+        self.search = TravelSearch.objects.create(
+            user=self.user,
+            destination="Madrid",
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=3),
+        )
+        HotelResult.objects.create(
+            search=self.search,
+            external_id="hotel_1",
+            name="Hotel Uno",
+            price_per_night=120,
+            amenities="WiFi,Pool",
+            ai_reason="Central and quiet",
+        )
+
+    def test_thin_defers_detail_columns(self):
+        """Test thin() skips long detail columns but keeps summary ones"""
+        hotel = HotelResult.objects.thin().get(search=self.search)
+        deferred = hotel.get_deferred_fields()
+
+        self.assertIn("amenities", deferred)
+        self.assertIn("ai_reason", deferred)
+        for field in HotelResult.THIN_FIELDS:
+            self.assertNotIn(field, deferred)
+        with self.assertNumQueries(0):
+            self.assertEqual(hotel.name, "Hotel Uno")
+            self.assertEqual(hotel.total_price, Decimal("360.00"))
+
+
+class UUID4BatchTest(TestCase):
+    """Tests for batched UUID generation used by bulk_ingest"""
+
+    def test_valid_distinct_uuid4s(self):
+        """Test every UUID is a distinct RFC 4122 version 4 UUID"""
+        import uuid
+
+        from .models import uuid4_batch
+
+        ids = uuid4_batch(50)
+        self.assertEqual(len(ids), 50)
+        self.assertEqual(len(set(ids)), 50)
+        for value in ids:
+            self.assertEqual(value.version, 4)
+            self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_single_urandom_call(self):
+        """Test the batch reads randomness once, not once per UUID"""
+        import os
+
+        from .models import uuid4_batch
+
+        with patch("ai_implementation.models.os.urandom", wraps=os.urandom) as mock:
+            uuid4_batch(10)
+        mock.assert_called_once_with(160)
+
+    def test_empty_batch(self):
+        """Test zero UUIDs needs no randomness"""
+        from .models import uuid4_batch
+
+        self.assertEqual(uuid4_batch(0), [])
+
+
+class CompactPromptJsonTest(TestCase):
+    """Tests that prompt payloads are serialized without whitespace"""
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_consolidation_prompt_is_minified(self, mock_openai_client):
+        """Test data blocks in the consolidation prompt carry no indentation"""
+        service = OpenAIService()
+        prompt = service._create_consolidation_prompt(
+            [{"id": "f1", "price": 500}],
+            [{"id": "h1", "price": 100}],
+            [],
+            {"destination": "Paris"},
+        )
+
+        self.assertIn('{"destination":"Paris"}', prompt)
+        self.assertIn('[{"id":"f1","price":500}]', prompt)
+
+    def test_compact_json_handles_non_json_types(self):
+        """Test dates and decimals are stringified rather than rejected"""
+        from .openai_service import _compact_json
+
+        self.assertEqual(
+            _compact_json({"d": date(2026, 1, 2), "p": Decimal("9.50")}),
+            '{"d":"2026-01-02","p":"9.50"}',
+        )
+
+
+@override_settings(OPENAI_RESPONSE_CACHE_TIMEOUT=3600)
+class OpenAIResponseCacheTest(TestCase):
+    """Tests for caching of identical OpenAI completions"""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+
+    def _mock_client(self, mock_openai_client, content):
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = content
+        mock_response.choices[0].finish_reason = "stop"
+        mock_client_instance = Mock()
+        mock_client_instance.chat.completions.create.return_value = mock_response
+        mock_openai_client.return_value = mock_client_instance
+        return mock_client_instance
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_identical_requests_hit_cache(self, mock_openai_client):
+        """Test a repeated question is answered without a second API call"""
+        client = self._mock_client(mock_openai_client, "Take the train.")
+        service = OpenAIService()
+
+        first = service.answer_travel_question("How do I get there?")
+        second = service.answer_travel_question("How do I get there?")
+
+        self.assertEqual(first, "Take the train.")
+        self.assertEqual(second, "Take the train.")
+        client.chat.completions.create.assert_called_once()
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_different_requests_miss_cache(self, mock_openai_client):
+        """Test a different prompt triggers a new API call"""
+        client = self._mock_client(mock_openai_client, "Answer")
+        service = OpenAIService()
+
+        service.answer_travel_question("Question one?")
+        service.answer_travel_question("Question two?")
+
+        self.assertEqual(client.chat.completions.create.call_count, 2)
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_high_temperature_requests_not_cached(self, mock_openai_client):
+        """Test creative descriptions are always generated fresh"""
+        client = self._mock_client(mock_openai_client, "A lovely trip.")
+        service = OpenAIService()
+
+        service.create_itinerary_description("Paris", ["Louvre"], 3)
+        service.create_itinerary_description("Paris", ["Louvre"], 3)
+
+        self.assertEqual(client.chat.completions.create.call_count, 2)
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_truncated_responses_not_cached(self, mock_openai_client):
+        """Test completions cut off by max_tokens are not reused"""
+        client = self._mock_client(mock_openai_client, '{"consensus_preferences":')
+        client.chat.completions.create.return_value.choices[0].finish_reason = (
+            "length"
+        )
+        service = OpenAIService()
+
+        group = [{"user": "alice"}, {"user": "bob"}]
+        service.generate_group_consensus(group)
+        service.generate_group_consensus(group)
+
+        self.assertEqual(client.chat.completions.create.call_count, 2)
+
+
+class OpenAIModelLadderTest(TestCase):
+    """Tests for light-model routing and the rate limit fallback"""
+
+    def _mock_response(self, content):
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = content
+        return mock_response
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @override_settings(OPENAI_MODEL="main-model", OPENAI_LIGHT_MODEL="light-model")
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_short_answers_use_light_model(self, mock_openai_client):
+        """Test free-text questions are routed to the light model"""
+        client = mock_openai_client.return_value
+        client.chat.completions.create.return_value = self._mock_response("Yes")
+
+        OpenAIService().answer_travel_question("Is it safe?")
+
+        call_kwargs = client.chat.completions.create.call_args[1]
+        self.assertEqual(call_kwargs["model"], "light-model")
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @override_settings(OPENAI_MODEL="main-model", OPENAI_LIGHT_MODEL="light-model")
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_rate_limited_call_falls_back_to_light_model(self, mock_openai_client):
+        """Test a 429 on the main model is retried on the light model"""
+        import httpx
+        from openai import RateLimitError
+
+        rate_limited = RateLimitError(
+            "Rate limit reached",
+            response=httpx.Response(
+                429, request=httpx.Request("POST", "https://api.openai.com")
+            ),
+            body=None,
+        )
+        client = mock_openai_client.return_value
+        client.chat.completions.create.side_effect = [
+            rate_limited,
+            self._mock_response('{"consensus_preferences": {}}'),
+        ]
+
+        result = OpenAIService().generate_group_consensus(
+            [{"user": "alice"}, {"user": "bob"}]
+        )
+
+        self.assertEqual(result, {"consensus_preferences": {}})
+        models = [
+            call[1]["model"] for call in client.chat.completions.create.call_args_list
+        ]
+        self.assertEqual(models, ["main-model", "light-model"])
+
+
+class StaticPromptPrefixTest(TestCase):
+    """Tests that static prompt text leads every request"""
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_consensus_prompt_starts_with_static_instructions(
+        self, mock_openai_client
+    ):
+        """Test different groups share the same prompt prefix and system message"""
+        from .openai_service import _GROUP_CONSENSUS_INSTRUCTIONS
+
+        client = mock_openai_client.return_value
+        client.chat.completions.create.return_value.choices = [Mock()]
+        client.chat.completions.create.return_value.choices[0].message.content = "{}"
+        service = OpenAIService()
+
+        service.generate_group_consensus(
+            [{"user": "alice", "destination": "Rome"}, {"user": "carol"}]
+        )
+        service.generate_group_consensus(
+            [{"user": "bob", "destination": "Oslo"}, {"user": "carol"}]
+        )
+
+        first, second = [
+            call[1]["messages"]
+            for call in client.chat.completions.create.call_args_list
+        ]
+        self.assertEqual(first[0], second[0])
+        self.assertTrue(first[1]["content"].startswith(_GROUP_CONSENSUS_INSTRUCTIONS))
+        self.assertTrue(second[1]["content"].startswith(_GROUP_CONSENSUS_INSTRUCTIONS))
+        self.assertIn("alice", first[1]["content"])
+
+
+class PromptTokenBudgetTest(TestCase):
+    """Tests for token-budgeted result lists in prompts"""
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def setUp(self, mock_openai_client):
+        self.service = OpenAIService()
+        self.items = [
+            {"id": f"f{i}", "price": i, "segments": "x" * 200} for i in range(30)
+        ]
+
+    def test_fields_are_projected(self):
+        """Test fields outside the whitelist are dropped"""
+        result = json.loads(self.service._fit_to_budget(self.items, 10000, ("id",)))
+
+        self.assertEqual(len(result), 30)
+        self.assertEqual(result[0], {"id": "f0"})
+
+    def test_list_stops_at_budget(self):
+        """Test items past the token budget are left out, keeping order"""
+        result = json.loads(self.service._fit_to_budget(self.items, 300))
+
+        self.assertGreater(len(result), 1)
+        self.assertLess(len(result), 30)
+        self.assertEqual(result[0]["id"], "f0")
+
+    def test_first_item_always_kept(self):
+        """Test one oversized item still makes it into the prompt"""
+        result = json.loads(self.service._fit_to_budget(self.items, 1))
+
+        self.assertEqual([item["id"] for item in result], ["f0"])
+
+
+class StreamingAnswerTest(TestCase):
+    """Tests for streamed travel question answers"""
+
+    def _chunk(self, text):
+        chunk = Mock()
+        chunk.choices = [Mock()]
+        chunk.choices[0].delta.content = text
+        return chunk
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_stream_yields_deltas(self, mock_openai_client):
+        """Test content deltas are yielded in order and empty ones skipped"""
+        client = mock_openai_client.return_value
+        client.chat.completions.create.return_value = iter(
+            [self._chunk("Take "), self._chunk(None), self._chunk("the train.")]
+        )
+
+        parts = list(OpenAIService().answer_travel_question_stream("How?"))
+
+        self.assertEqual(parts, ["Take ", "the train."])
+        self.assertTrue(client.chat.completions.create.call_args[1]["stream"])
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_stream_error_yields_apology(self, mock_openai_client):
+        """Test an API failure yields the standard error message"""
+        from .openai_service import TRAVEL_QUESTION_ERROR_MESSAGE
+
+        client = mock_openai_client.return_value
+        client.chat.completions.create.side_effect = Exception("API Error")
+
+        parts = list(OpenAIService().answer_travel_question_stream("How?"))
+
+        self.assertEqual(parts, [TRAVEL_QUESTION_ERROR_MESSAGE])
+
+
+class BudgetStatsTest(TestCase):
+    """Tests for the memoized member budget statistics"""
+
+    def test_budget_stats(self):
+        """Test currency formatting is stripped and the upper median is used"""
+        from ai_implementation.openai_service import _calculate_budget_stats
+
+        budgets, low, median, high = _calculate_budget_stats(
+            ("$3,000", "1000", "abc", "0", "2000.50", "4000")
+        )
+
+        self.assertEqual(budgets, (1000.0, 2000.5, 3000.0, 4000.0))
+        self.assertEqual((low, median, high), (1000.0, 3000.0, 4000.0))
+
+    def test_budget_stats_defaults(self):
+        """Test default tiers are used when nobody gave a budget"""
+        from ai_implementation.openai_service import _calculate_budget_stats
+
+        self.assertEqual(_calculate_budget_stats(("", "none")), ((), 1000, 3000, 5000))
+
+    def test_budget_stats_is_memoized(self):
+        """Test repeated budget tuples are served from the lru_cache"""
+        from ai_implementation.openai_service import _calculate_budget_stats
+
+        _calculate_budget_stats.cache_clear()
+        _calculate_budget_stats(("1000", "2000"))
+        _calculate_budget_stats(("1000", "2000"))
+
+        self.assertEqual(_calculate_budget_stats.cache_info().hits, 1)
+
+
+class TolerantJsonParsingTest(TestCase):
+    """Tests for salvaging malformed JSON completions"""
+
+    def _mock_response(self, content):
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = content
+        return mock_response
+
+    def test_repair_json_locally(self):
+        """Test fences, surrounding prose and trailing commas are handled"""
+        from ai_implementation.openai_service import _repair_json
+
+        self.assertEqual(
+            _repair_json('```json\n{"a": [1, 2,], "b": {"c": 1,},}\n```'),
+            {"a": [1, 2], "b": {"c": 1}},
+        )
+        self.assertEqual(_repair_json('Sure! {"x": "y"} Enjoy.'), {"x": "y"})
+        self.assertIsNone(_repair_json("Invalid JSON {"))
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_local_repair_skips_second_call(self, mock_openai_client):
+        """Test a fixable reply is parsed without another API request"""
+        client = mock_openai_client.return_value
+        client.chat.completions.create.return_value = self._mock_response(
+            '```json\n{"consensus_preferences": {},}\n```'
+        )
+
+        result = OpenAIService().generate_group_consensus(
+            [{"user": "alice"}, {"user": "bob"}]
+        )
+
+        self.assertEqual(result, {"consensus_preferences": {}})
+        client.chat.completions.create.assert_called_once()
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_repair_call_for_unfixable_reply(self, mock_openai_client):
+        """Test an unfixable reply is sent back alone for a repair"""
+        client = mock_openai_client.return_value
+        client.chat.completions.create.side_effect = [
+            self._mock_response('{"consensus_preferences": {"destination": Rome}'),
+            self._mock_response('{"consensus_preferences": {"destination": "Rome"}}'),
+        ]
+
+        result = OpenAIService().generate_group_consensus(
+            [{"user": "alice"}, {"user": "bob"}]
+        )
+
+        self.assertEqual(result["consensus_preferences"]["destination"], "Rome")
+        repair_messages = client.chat.completions.create.call_args[1]["messages"]
+        self.assertEqual(
+            repair_messages[1]["content"],
+            '{"consensus_preferences": {"destination": Rome}',
+        )
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_truncated_reply_not_sent_for_repair(self, mock_openai_client):
+        """Test a reply cut off by max_tokens is not repaired by the model"""
+        client = mock_openai_client.return_value
+        response = self._mock_response('{"consensus_preferences": {"destination":')
+        response.choices[0].finish_reason = "length"
+        client.chat.completions.create.return_value = response
+
+        result = OpenAIService().generate_group_consensus(
+            [{"user": "alice"}, {"user": "bob"}]
+        )
+
+        self.assertIn("error", result)
+        client.chat.completions.create.assert_called_once()
+
+
+class OpenAIHttpClientTest(TestCase):
+    """Tests for the shared OpenAI connection pool"""
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_services_share_http_client(self, mock_openai_client):
+        """Test every service instance reuses the module-level HTTP client"""
+        from ai_implementation.openai_service import _HTTP_CLIENT
+
+        OpenAIService()
+        OpenAIService()
+
+        clients = [
+            call[1]["http_client"] for call in mock_openai_client.call_args_list
+        ]
+        self.assertEqual(clients, [_HTTP_CLIENT, _HTTP_CLIENT])
+
+
+class OpenAIRetryConfigTest(TestCase):
+    """Tests for the OpenAI retry budget"""
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @override_settings(OPENAI_MAX_RETRIES=6)
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_retry_budget_from_settings(self, mock_openai_client):
+        """Test the client is built with the configured retry budget"""
+        OpenAIService()
+
+        self.assertEqual(mock_openai_client.call_args[1]["max_retries"], 6)
+
+
+class ItineraryPromptTemplateTest(TestCase):
+    """Tests for the request-specific lines of the itinerary options prompt"""
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_multi_destination_requirement(self, mock_openai_client):
+        """Test dates and every destination are filled into the prompt"""
+        client = mock_openai_client.return_value
+        client.chat.completions.create.return_value.choices = [Mock()]
+        client.chat.completions.create.return_value.choices[0].message.content = (
+            '{"options": []}'
+        )
+
+        OpenAIService().generate_three_itinerary_options(
+            member_preferences=[{"user": "alice", "budget": "2000"}],
+            flight_results=[{"id": "f1", "price": 500}],
+            hotel_results=[],
+            activity_results=[],
+            selected_dates={
+                "start_date": "2026-06-01",
+                "end_date": "2026-06-05",
+                "duration_days": 4,
+            },
+            unique_destinations=["Paris", "Tokyo"],
+        )
+
+        prompt = client.chat.completions.create.call_args[1]["messages"][1]["content"]
+        self.assertIn("DATES: 2026-06-01 to 2026-06-05 (4 days)", prompt)
+        self.assertIn("DESTINATIONS (2, CRITICAL): Paris, Tokyo", prompt)
+        self.assertIn("at least 6 options, at most 8", prompt)
+
+
+class OpenAIRequestLoggingTest(TestCase):
+    """Tests for debug-only request size logging"""
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def setUp(self, mock_openai_client):
+        self.service = OpenAIService()
+        self.messages = [{"role": "user", "content": "Hello"}]
+
+    def test_size_logged_at_debug(self):
+        """Test the request size is logged when debug logging is on"""
+        with self.assertLogs("ai_implementation.openai_service", "DEBUG") as logs:
+            size_kb = self.service._log_request_size(self.messages, "test")
+
+        self.assertGreater(size_kb, 0)
+        self.assertIn("OpenAI request size [test]", logs.output[0])
+
+    def test_size_skipped_without_debug(self):
+        """Test the payload is not serialized when debug logging is off"""
+        import logging
+
+        logger = logging.getLogger("ai_implementation.openai_service")
+        with patch.object(logger, "isEnabledFor", return_value=False):
+            with patch("ai_implementation.openai_service.json.dumps") as dumps:
+                self.assertIsNone(
+                    self.service._log_request_size(self.messages, "test")
+                )
+
+        dumps.assert_not_called()
+
+
+class PromptPreflightTest(TestCase):
+    """Tests for trimming prompts to the model's context window"""
+
+    def setUp(self):
+        self.flights = [
+            {"id": f"f{i}", "airline": "A" * 100, "price": i} for i in range(100)
+        ]
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_prompt_within_context_is_untouched(self, mock_openai_client):
+        """Test a prompt that fits keeps the default list budget"""
+        service = OpenAIService()
+        budgets = []
+
+        service._fit_prompt(
+            "system",
+            "instructions",
+            lambda tokens: budgets.append(tokens) or "instructions data",
+            list_tokens=1200,
+            max_tokens=1000,
+        )
+
+        self.assertEqual(budgets, [1200])
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @override_settings(OPENAI_CONTEXT_TOKENS=2500)
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_oversized_prompt_is_trimmed(self, mock_openai_client):
+        """Test result lists shrink until the prompt fits with the reply"""
+        from ai_implementation.openai_service import (
+            _CONSOLIDATION_INSTRUCTIONS,
+            _SYSTEM_CONSOLIDATOR,
+        )
+
+        service = OpenAIService()
+
+        def build(tokens):
+            return service._create_consolidation_prompt(
+                self.flights, self.flights, self.flights, {}, tokens
+            )
+
+        prompt = service._fit_prompt(
+            _SYSTEM_CONSOLIDATOR,
+            _CONSOLIDATION_INSTRUCTIONS,
+            build,
+            list_tokens=1200,
+            max_tokens=1000,
+        )
+
+        self.assertLess(len(prompt), len(build(1200)))
+        self.assertLessEqual(
+            service._count_tokens(_SYSTEM_CONSOLIDATOR + prompt), 2500 - 1000
+        )
+
+
+class ConsolidationPromptCacheTest(TestCase):
+    """Tests for memoized consolidation prompt data"""
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_identical_inputs_reuse_prompt(self, mock_openai_client):
+        """Test rebuilding a prompt for unchanged results hits the lru_cache"""
+        from ai_implementation.openai_service import _consolidation_data
+
+        _consolidation_data.cache_clear()
+        service = OpenAIService()
+        args = ([{"id": "f1", "price": 500}], [], [], {"destination": "Paris"})
+
+        first = service._create_consolidation_prompt(*args)
+        second = service._create_consolidation_prompt(*args)
+        changed = service._create_consolidation_prompt(
+            [{"id": "f2", "price": 400}], [], [], {"destination": "Paris"}
+        )
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, changed)
+        info = _consolidation_data.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
+
+class ItineraryPromptProjectionTest(TestCase):
+    """Tests that itinerary option prompts only carry fields the model uses"""
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_unused_fields_dropped(self, mock_openai_client):
+        """Test vendor-only fields are stripped from the result lists"""
+        client = mock_openai_client.return_value
+        client.chat.completions.create.return_value.choices = [Mock()]
+        client.chat.completions.create.return_value.choices[0].message.content = (
+            '{"options": []}'
+        )
+
+        OpenAIService().generate_three_itinerary_options(
+            member_preferences=[{"user": "alice", "budget": "2000"}],
+            flight_results=[
+                {"id": "f1", "total_amount": 450, "owner": {"logo": "x.svg"}}
+            ],
+            hotel_results=[{"id": "h1", "name": "Inn", "image_url": "x.jpg"}],
+            activity_results=[{"id": "a1", "name": "Tour", "link": "x.html"}],
+        )
+
+        prompt = client.chat.completions.create.call_args[1]["messages"][1]["content"]
+        self.assertIn('[{"id":"f1","total_amount":450}]', prompt)
+        self.assertIn('[{"id":"h1","name":"Inn"}]', prompt)
+        self.assertIn('[{"id":"a1","name":"Tour"}]', prompt)
+
+
+class EmptyInputShortCircuitTest(TestCase):
+    """Tests that degenerate inputs are answered without an OpenAI request"""
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_consolidate_without_results(self, mock_openai_client):
+        """Test empty search results return a no-results payload"""
+        result = OpenAIService().consolidate_travel_results([], [], [], {})
+
+        self.assertEqual(result["recommended_flights"], [])
+        self.assertTrue(result["warnings"])
+        mock_openai_client.return_value.chat.completions.create.assert_not_called()
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_itinerary_options_without_results(self, mock_openai_client):
+        """Test empty search results return no options and say why"""
+        result = OpenAIService().generate_three_itinerary_options(
+            member_preferences=[{"user": "alice", "destination": "Rome"}],
+            flight_results=[],
+            hotel_results=[],
+            activity_results=[],
+        )
+
+        self.assertEqual(result["options"], [])
+        self.assertEqual(
+            result["voting_guidance"], "No travel options were found for this search."
+        )
+        self.assertEqual(
+            result["consensus_summary"],
+            "The search returned no flights, hotels or activities.",
+        )
+        self.assertNotIn("error", result)
+        self.assertNotIn("fallback_used", result)
+        mock_openai_client.return_value.chat.completions.create.assert_not_called()
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_single_member_consensus_passthrough(self, mock_openai_client):
+        """Test a lone member's preferences are returned as the consensus"""
+        result = OpenAIService().generate_group_consensus(
+            [
+                {
+                    "user": "alice",
+                    "destination": "Rome",
+                    "start_date": "2026-06-01",
+                    "end_date": "2026-06-05",
+                    "budget": "2000",
+                    "activity_preferences": "food, museums",
+                    "dietary_restrictions": "",
+                }
+            ]
+        )
+
+        consensus = result["consensus_preferences"]
+        self.assertEqual(consensus["destination"], "Rome")
+        self.assertEqual(consensus["date_range"], "2026-06-01 to 2026-06-05")
+        self.assertEqual(consensus["activities"], ["food", "museums"])
+        self.assertEqual(consensus["dietary_accommodations"], [])
+        self.assertEqual(result["conflicting_preferences"], [])
+        mock_openai_client.return_value.chat.completions.create.assert_not_called()
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": "test-key-123"})
+    @patch("ai_implementation.openai_service.OpenAI")
+    def test_empty_group_consensus(self, mock_openai_client):
+        """Test a group without preferences gets an empty consensus"""
+        result = OpenAIService().generate_group_consensus([])
+
+        self.assertEqual(result["consensus_preferences"], {})
+        mock_openai_client.return_value.chat.completions.create.assert_not_called()
+
+
 if __name__ == "__main__":
     import django
 
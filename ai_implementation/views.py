@@ -7,12 +7,15 @@ import json
 import gc  # For garbage collection to free memory
 import random
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.db import transaction, models
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import datetime
 
@@ -46,6 +49,10 @@ from .airport_data import search_airports
 
 logger = logging.getLogger(__name__)
 
+# Parsed ConsolidatedResult sections are cached under a key that embeds
+# updated_at, so re-running a search never serves stale content
+CONSOLIDATED_CACHE_TIMEOUT = 3600
+
 
 def _generate_options_manually(
     member_prefs, flight_results, hotel_results, activity_results, search, group
@@ -64,7 +71,8 @@ def _generate_options_manually(
 
     print(f"[VALIDATION] Member preference destinations: {preference_destinations}")
 
-    # Group flights and hotels by destination
+    # Group flights and hotels by destination as (price, item) pairs, parsing
+    # each price once for both the sort and the pairing loop below
     flights_by_dest = {}
     hotels_by_dest = {}
 
@@ -73,20 +81,22 @@ def _generate_options_manually(
         if dest:
             if dest not in flights_by_dest:
                 flights_by_dest[dest] = []
-            flights_by_dest[dest].append(flight)
+            flights_by_dest[dest].append((float(flight.get("price", 0) or 0), flight))
 
     for hotel in hotel_results:
         dest = hotel.get("searched_destination", "")
         if dest:
             if dest not in hotels_by_dest:
                 hotels_by_dest[dest] = []
-            hotels_by_dest[dest].append(hotel)
+            hotels_by_dest[dest].append(
+                (float(hotel.get("price_per_night", 0) or 0), hotel)
+            )
 
     # Sort flights and hotels by price within each destination
-    for dest in flights_by_dest:
-        flights_by_dest[dest].sort(key=lambda x: float(x.get("price", 0) or 0))
-    for dest in hotels_by_dest:
-        hotels_by_dest[dest].sort(key=lambda x: float(x.get("price_per_night", 0) or 0))
+    for priced_flights in flights_by_dest.values():
+        priced_flights.sort(key=itemgetter(0))
+    for priced_hotels in hotels_by_dest.values():
+        priced_hotels.sort(key=itemgetter(0))
 
     # Get unique destinations - prioritize destinations from member preferences
     all_available_destinations = list(
@@ -129,17 +139,14 @@ def _generate_options_manually(
             continue
 
         # Generate combinations, ensuring uniqueness
-        for flight in flights:
-            for hotel in hotels:
+        for flight_price, flight in flights:
+            for hotel_night_price, hotel in hotels:
                 combo_key = (flight.get("id", ""), hotel.get("id", ""))
                 if combo_key in used_combinations:
                     continue  # Skip duplicate combinations
                 used_combinations.add(combo_key)
 
-                flight_price = float(flight.get("price", 0) or 0)
-                hotel_price = (
-                    float(hotel.get("price_per_night", 0) or 0) * 7
-                )  # Approximate for trip duration
+                hotel_price = hotel_night_price * 7  # Approximate for trip duration
                 total_cost = flight_price + hotel_price
 
                 all_combinations.append(
@@ -386,6 +393,29 @@ def advanced_search(request):
     return render(request, "ai_implementation/advanced_search.html", context)
 
 
+def _parse_consolidated(consolidated):
+    """Decode a consolidated result's JSON sections, memoized until its next save"""
+    parsed = cache.get(consolidated.cache_key)
+    if parsed is None:
+        parsed = {
+            "budget_analysis": (
+                json.loads(consolidated.budget_analysis)
+                if consolidated.budget_analysis
+                else {}
+            ),
+            "itinerary_suggestions": (
+                json.loads(consolidated.itinerary_suggestions)
+                if consolidated.itinerary_suggestions
+                else []
+            ),
+            "warnings": (
+                json.loads(consolidated.warnings) if consolidated.warnings else []
+            ),
+        }
+        cache.set(consolidated.cache_key, parsed, CONSOLIDATED_CACHE_TIMEOUT)
+    return parsed
+
+
 @login_required
 def search_results(request, search_id):
     """Display consolidated search results with AI recommendations"""
@@ -414,21 +444,10 @@ def search_results(request, search_id):
 
     # Parse consolidated results
     summary = consolidated.summary if consolidated else ""
-    budget_analysis = (
-        json.loads(consolidated.budget_analysis)
-        if consolidated and consolidated.budget_analysis
-        else {}
-    )
-    itinerary_suggestions = (
-        json.loads(consolidated.itinerary_suggestions)
-        if consolidated and consolidated.itinerary_suggestions
-        else []
-    )
-    warnings = (
-        json.loads(consolidated.warnings)
-        if consolidated and consolidated.warnings
-        else []
-    )
+    parsed = _parse_consolidated(consolidated) if consolidated else {}
+    budget_analysis = parsed.get("budget_analysis", {})
+    itinerary_suggestions = parsed.get("itinerary_suggestions", [])
+    warnings = parsed.get("warnings", [])
 
     # Apply filters if provided
     refine_form = RefineSearchForm(request.GET)
@@ -509,85 +528,103 @@ def perform_search(request, search_id):
             "rooms": search.rooms,
         }
 
+        start_date = search.start_date.strftime("%Y-%m-%d")
+        end_date = search.end_date.strftime("%Y-%m-%d")
+
         # Search flights using SerpAPI
-        flight_results = []
-        try:
-            print(
-                f"Searching flights using SerpAPI: {origin_location} -> {search.destination}"
-            )
-            flight_results = serpapi_flights.search_flights(
-                origin=origin_location,
-                destination=search.destination,
-                departure_date=search.start_date.strftime("%Y-%m-%d"),
-                return_date=search.end_date.strftime("%Y-%m-%d"),
-                adults=search.adults,
-                max_results=50,
-            )
-            print(f"Found {len(flight_results)} flights from SerpAPI")
-        except Exception as e:
-            error_msg = f"Error searching flights with SerpAPI: {str(e)}"
-            print(f"[ERROR] {error_msg}")
-            import traceback
+        def search_flights():
+            try:
+                print(
+                    f"Searching flights using SerpAPI: {origin_location} -> {search.destination}"
+                )
+                flight_results = serpapi_flights.search_flights(
+                    origin=origin_location,
+                    destination=search.destination,
+                    departure_date=start_date,
+                    return_date=end_date,
+                    adults=search.adults,
+                    max_results=50,
+                )
+                print(f"Found {len(flight_results)} flights from SerpAPI")
+                return flight_results, None
+            except Exception as e:
+                error_msg = f"Error searching flights with SerpAPI: {str(e)}"
+                print(f"[ERROR] {error_msg}")
+                import traceback
 
-            traceback.print_exc()
-            api_errors.append(str(e))
-            flight_results = []
+                traceback.print_exc()
+                return [], str(e)
 
         # Search hotels using Makcorps
         makcorps_hotels = MakcorpsHotelConnector()
-        hotel_results = []
-        try:
-            print(f"Searching hotels using Makcorps: {search.destination}")
-            hotel_results = makcorps_hotels.search_hotels(
-                location=search.destination,
-                check_in=search.start_date.strftime("%Y-%m-%d"),
-                check_out=search.end_date.strftime("%Y-%m-%d"),
-                adults=search.adults,
-                rooms=search.rooms,
-                max_results=50,
-            )
-            print(f"Found {len(hotel_results)} hotels from Makcorps")
-        except Exception as e:
-            print(f"Error searching hotels with Makcorps: {str(e)}")
-            api_errors.append(str(e))
-            hotel_results = []
+
+        def search_hotels():
+            try:
+                print(f"Searching hotels using Makcorps: {search.destination}")
+                hotel_results = makcorps_hotels.search_hotels(
+                    location=search.destination,
+                    check_in=start_date,
+                    check_out=end_date,
+                    adults=search.adults,
+                    rooms=search.rooms,
+                    max_results=50,
+                )
+                print(f"Found {len(hotel_results)} hotels from Makcorps")
+                return hotel_results, None
+            except Exception as e:
+                print(f"Error searching hotels with Makcorps: {str(e)}")
+                return [], str(e)
 
         # Search activities using SerpAPI
         serpapi_activities = SerpApiActivitiesConnector()
-        activity_results = []
-        try:
-            print(f"Searching activities using SerpAPI: {search.destination}")
-            activity_categories = None
-            if preferences and "activity_preferences" in preferences:
-                activity_categories = preferences["activity_preferences"]
-                if isinstance(activity_categories, str):
-                    # Try to parse as comma-separated or JSON
-                    try:
-                        cats = json.loads(activity_categories)
-                        if isinstance(cats, list):
-                            activity_categories = cats
-                    except:
-                        # Treat as comma-separated string
-                        activity_categories = [
-                            c.strip() for c in activity_categories.split(",")
-                        ]
-
-            activity_results = serpapi_activities.search_activities(
-                destination=search.destination,
-                start_date=search.start_date.strftime("%Y-%m-%d"),
-                end_date=search.end_date.strftime("%Y-%m-%d"),
-                categories=activity_categories,
-                max_results=50,
-            )
-            print(f"Found {len(activity_results)} activities from SerpAPI")
-        except Exception as e:
-            error_msg = f"Error searching activities with SerpAPI: {str(e)}"
-            print(f"[ERROR] {error_msg}")
-            import traceback
+        activity_categories = None
+        if preferences and "activity_preferences" in preferences:
+            activity_categories = preferences["activity_preferences"]
+            if isinstance(activity_categories, str):
+                # Try to parse as comma-separated or JSON
+                try:
+                    cats = json.loads(activity_categories)
+                    if isinstance(cats, list):
+                        activity_categories = cats
+                except:
+                    # Treat as comma-separated string
+                    activity_categories = [
+                        c.strip() for c in activity_categories.split(",")
+                    ]
 
-            traceback.print_exc()
-            api_errors.append(str(e))
-            activity_results = []
+        def search_activities():
+            try:
+                print(f"Searching activities using SerpAPI: {search.destination}")
+                activity_results = serpapi_activities.search_activities(
+                    destination=search.destination,
+                    start_date=start_date,
+                    end_date=end_date,
+                    categories=activity_categories,
+                    max_results=50,
+                )
+                print(f"Found {len(activity_results)} activities from SerpAPI")
+                return activity_results, None
+            except Exception as e:
+                error_msg = f"Error searching activities with SerpAPI: {str(e)}"
+                print(f"[ERROR] {error_msg}")
+                import traceback
+
+                traceback.print_exc()
+                return [], str(e)
+
+        # The three searches are independent blocking I/O calls, so run them
+        # on threads and wait for the slowest rather than the sum of all three
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            flight_future = executor.submit(search_flights)
+            hotel_future = executor.submit(search_hotels)
+            activity_future = executor.submit(search_activities)
+
+        flight_results, flight_error = flight_future.result()
+        hotel_results, hotel_error = hotel_future.result()
+        activity_results, activity_error = activity_future.result()
+        api_errors.extend(
+            error for error in (flight_error, hotel_error, activity_error) if error
+        )
 
         # Combine results: use SerpAPI for flights and activities, Makcorps for hotels
         api_results = {
@@ -608,6 +645,7 @@ def perform_search(request, search_id):
                 ActivityResult.objects.filter(search=search).delete()
 
             # Save flight results
+            flight_rows = []
             for flight_data in api_results["flights"]:
                 # Handle departure_time - convert to timezone-aware if needed
                 dep_time = flight_data.get("departure_time", search.start_date)
@@ -655,85 +693,95 @@ def perform_search(request, search_id):
                         datetime.combine(search.start_date, datetime.min.time())
                     )
 
-                FlightResult.objects.create(
-                    search=search,
-                    external_id=flight_data.get("id", "N/A"),
-                    airline=flight_data.get("airline", "Unknown"),
-                    price=flight_data.get("price", 0),
-                    currency=flight_data.get("currency", "USD"),
-                    departure_time=dep_time,
-                    arrival_time=arr_time,
-                    duration=flight_data.get("duration", "N/A"),
-                    stops=flight_data.get("stops", 0),
-                    booking_class=flight_data.get("booking_class", "Economy"),
-                    seats_available=str(flight_data.get("seats_available", "N/A")),
-                    searched_destination=flight_data.get(
-                        "searched_destination", search.destination
-                    ),
-                    is_mock=flight_data.get("is_mock", False),
+                flight_rows.append(
+                    dict(
+                        external_id=flight_data.get("id", "N/A"),
+                        airline=flight_data.get("airline", "Unknown"),
+                        price=flight_data.get("price", 0),
+                        currency=flight_data.get("currency", "USD"),
+                        departure_time=dep_time,
+                        arrival_time=arr_time,
+                        duration=flight_data.get("duration", "N/A"),
+                        stops=flight_data.get("stops", 0),
+                        booking_class=flight_data.get("booking_class", "Economy"),
+                        seats_available=str(flight_data.get("seats_available", "N/A")),
+                        searched_destination=flight_data.get(
+                            "searched_destination", search.destination
+                        ),
+                        is_mock=flight_data.get("is_mock", False),
+                    )
                 )
+            FlightResult.bulk_ingest(search, flight_rows)
 
             # Save hotel results
+            hotel_rows = []
             for hotel_data in api_results["hotels"]:
                 image_url_value = hotel_data.get("image_url") or None
                 print(
                     f"[DEBUG] Saving hotel '{hotel_data.get('name', 'Unknown')[:50]}' - image_url: {image_url_value[:80] if image_url_value else '(None)'}..."
                 )
-                HotelResult.objects.create(
-                    search=search,
-                    external_id=hotel_data.get("id", "N/A"),
-                    name=hotel_data.get("name", "Unknown Hotel"),
-                    address=hotel_data.get("address", ""),
-                    price_per_night=hotel_data.get("price_per_night", 0),
-                    total_price=hotel_data.get("total_price", 0),
-                    currency=hotel_data.get("currency", "USD"),
-                    rating=hotel_data.get("rating"),
-                    review_count=hotel_data.get("review_count", 0),
-                    room_type=hotel_data.get("room_type", ""),
-                    amenities=",".join(hotel_data.get("amenities", [])),
-                    distance_from_center=hotel_data.get("distance_from_center", ""),
-                    breakfast_included=hotel_data.get("breakfast_included", False),
-                    cancellation_policy=hotel_data.get("cancellation_policy", ""),
-                    searched_destination=hotel_data.get(
-                        "searched_destination", search.destination
-                    ),
-                    image_url=image_url_value,  # Use None instead of empty string for URLField
-                    is_mock=hotel_data.get("is_mock", False),
+                hotel_rows.append(
+                    dict(
+                        external_id=hotel_data.get("id", "N/A"),
+                        name=hotel_data.get("name", "Unknown Hotel"),
+                        address=hotel_data.get("address", ""),
+                        price_per_night=hotel_data.get("price_per_night", 0),
+                        total_price=hotel_data.get("total_price", 0),
+                        currency=hotel_data.get("currency", "USD"),
+                        rating=hotel_data.get("rating"),
+                        review_count=hotel_data.get("review_count", 0),
+                        room_type=hotel_data.get("room_type", ""),
+                        amenities=",".join(hotel_data.get("amenities", [])),
+                        distance_from_center=hotel_data.get("distance_from_center", ""),
+                        breakfast_included=hotel_data.get("breakfast_included", False),
+                        cancellation_policy=hotel_data.get("cancellation_policy", ""),
+                        searched_destination=hotel_data.get(
+                            "searched_destination", search.destination
+                        ),
+                        image_url=image_url_value,  # Use None instead of empty string for URLField
+                        is_mock=hotel_data.get("is_mock", False),
+                    )
                 )
+            HotelResult.bulk_ingest(search, hotel_rows)
 
             # Save activity results
+            activity_rows = []
             for activity_data in api_results["activities"]:
                 image_url_value = activity_data.get("image_url") or None
                 print(
                     f"[DEBUG] Saving activity '{activity_data.get('name', 'Unknown')[:50]}' - image_url: {image_url_value[:80] if image_url_value else '(None)'}..."
                 )
-                ActivityResult.objects.create(
-                    search=search,
-                    external_id=activity_data.get("id", "N/A"),
-                    name=activity_data.get("name", "Unknown Activity"),
-                    category=activity_data.get("category", ""),
-                    description=activity_data.get("description", ""),
-                    price=activity_data.get("price", 0),
-                    currency=activity_data.get("currency", "USD"),
-                    duration_hours=activity_data.get("duration_hours", 2),
-                    rating=activity_data.get("rating"),
-                    review_count=activity_data.get("review_count", 0),
-                    included=activity_data.get("included", ""),
-                    meeting_point=activity_data.get("meeting_point", ""),
-                    max_group_size=activity_data.get("max_group_size"),
-                    languages=(
-                        ",".join(activity_data.get("languages", []))
-                        if isinstance(activity_data.get("languages"), list)
-                        else activity_data.get("languages", "")
-                    ),
-                    cancellation_policy=activity_data.get("cancellation_policy", ""),
-                    searched_destination=activity_data.get(
-                        "searched_destination", search.destination
-                    ),
-                    link=activity_data.get("link", ""),
-                    image_url=image_url_value,  # Use None instead of empty string for URLField
-                    is_mock=activity_data.get("is_mock", False),
+                activity_rows.append(
+                    dict(
+                        external_id=activity_data.get("id", "N/A"),
+                        name=activity_data.get("name", "Unknown Activity"),
+                        category=activity_data.get("category", ""),
+                        description=activity_data.get("description", ""),
+                        price=activity_data.get("price", 0),
+                        currency=activity_data.get("currency", "USD"),
+                        duration_hours=activity_data.get("duration_hours", 2),
+                        rating=activity_data.get("rating"),
+                        review_count=activity_data.get("review_count", 0),
+                        included=activity_data.get("included", ""),
+                        meeting_point=activity_data.get("meeting_point", ""),
+                        max_group_size=activity_data.get("max_group_size"),
+                        languages=(
+                            ",".join(activity_data.get("languages", []))
+                            if isinstance(activity_data.get("languages"), list)
+                            else activity_data.get("languages", "")
+                        ),
+                        cancellation_policy=activity_data.get(
+                            "cancellation_policy", ""
+                        ),
+                        searched_destination=activity_data.get(
+                            "searched_destination", search.destination
+                        ),
+                        link=activity_data.get("link", ""),
+                        image_url=image_url_value,  # Use None instead of empty string for URLField
+                        is_mock=activity_data.get("is_mock", False),
+                    )
                 )
+            ActivityResult.bulk_ingest(search, activity_rows)
 
         # Use OpenAI to consolidate results
         try:
@@ -1172,9 +1220,9 @@ def _generate_single_new_option(group, consensus, search, member_prefs):
     from decimal import Decimal
 
     # Get existing search results
-    flights = FlightResult.objects.filter(search=search)
-    hotels = HotelResult.objects.filter(search=search)
-    activities = ActivityResult.objects.filter(search=search)
+    flights = FlightResult.objects.thin().filter(search=search)
+    hotels = HotelResult.objects.thin().filter(search=search)
+    activities = ActivityResult.objects.thin().filter(search=search)
 
     if not flights.exists() or not hotels.exists():
         return None
@@ -1593,9 +1641,7 @@ def generate_voting_options(request, group_id):
     group = get_object_or_404(TravelGroup, id=group_id)
 
     # Verify user is a member
-    try:
-        membership = GroupMember.objects.get(group=group, user=request.user)
-    except GroupMember.DoesNotExist:
+    if not GroupMember.objects.filter(group=group, user=request.user).exists():
         messages.error(request, "You are not a member of this group.")
         return redirect("travel_groups:group_list")
 
@@ -1757,6 +1803,26 @@ def generate_voting_options(request, group_id):
             all_hotels = []
             all_activities = []
 
+            # Hotel searches for each destination are independent blocking
+            # calls, so run them on threads and wait for the slowest one
+            # rather than the sum; errors are re-raised per destination below
+            makcorps_hotels = MakcorpsHotelConnector()
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(4, len(destinations_list)))
+            ) as executor:
+                hotel_futures = {
+                    destination: executor.submit(
+                        makcorps_hotels.search_hotels,
+                        location=destination,
+                        check_in=search_start_date.strftime("%Y-%m-%d"),
+                        check_out=search_end_date.strftime("%Y-%m-%d"),
+                        adults=group.member_count,
+                        rooms=search.rooms,
+                        max_results=20,
+                    )
+                    for destination in destinations_list
+                }
+
             for destination in destinations_list:
                 print(f"\n[*] Searching for {destination}...")
 
@@ -1826,17 +1892,9 @@ def generate_voting_options(request, group_id):
                     # Still continue to other destinations, but log the error
 
                 # Use Makcorps for hotels
-                makcorps_hotels = MakcorpsHotelConnector()
                 try:
                     print(f"  [HOTEL] Searching hotels using Makcorps: {destination}")
-                    hotel_results = makcorps_hotels.search_hotels(
-                        location=destination,
-                        check_in=search_start_date.strftime("%Y-%m-%d"),
-                        check_out=search_end_date.strftime("%Y-%m-%d"),
-                        adults=group.member_count,
-                        rooms=search.rooms,
-                        max_results=20,
-                    )
+                    hotel_results = hotel_futures[destination].result()
 
                     # Tag hotels with destination
                     for hotel in hotel_results:
@@ -1942,6 +2000,7 @@ def generate_voting_options(request, group_id):
             # Save results to database
             with transaction.atomic():
                 # Save flight results
+                flight_rows = []
                 for flight_data in api_results["flights"]:
                     # Handle departure_time - convert to timezone-aware if needed
                     dep_time = flight_data.get("departure_time", search.start_date)
@@ -1989,133 +2048,97 @@ def generate_voting_options(request, group_id):
                             datetime.combine(search.start_date, datetime.min.time())
                         )
 
-                    FlightResult.objects.create(
-                        search=search,
-                        external_id=flight_data.get("id", "N/A"),
-                        airline=flight_data.get("airline", "Unknown"),
-                        price=flight_data.get("price", 0),
-                        currency=flight_data.get("currency", "USD"),
-                        departure_time=dep_time,
-                        arrival_time=arr_time,
-                        duration=flight_data.get("duration", "N/A"),
-                        stops=flight_data.get("stops", 0),
-                        booking_class=flight_data.get("booking_class", "Economy"),
-                        seats_available=str(flight_data.get("seats_available", "N/A")),
-                        searched_destination=flight_data.get(
-                            "searched_destination", search.destination
-                        ),
-                        is_mock=flight_data.get("is_mock", False),
+                    flight_rows.append(
+                        dict(
+                            external_id=flight_data.get("id", "N/A"),
+                            airline=flight_data.get("airline", "Unknown"),
+                            price=flight_data.get("price", 0),
+                            currency=flight_data.get("currency", "USD"),
+                            departure_time=dep_time,
+                            arrival_time=arr_time,
+                            duration=flight_data.get("duration", "N/A"),
+                            stops=flight_data.get("stops", 0),
+                            booking_class=flight_data.get("booking_class", "Economy"),
+                            seats_available=str(
+                                flight_data.get("seats_available", "N/A")
+                            ),
+                            searched_destination=flight_data.get(
+                                "searched_destination", search.destination
+                            ),
+                            is_mock=flight_data.get("is_mock", False),
+                        )
                     )
+                FlightResult.bulk_ingest(search, flight_rows)
 
                 # Save hotel results
+                hotel_rows = []
                 for hotel_data in api_results["hotels"]:
                     image_url_value = hotel_data.get("image_url") or None
-                    HotelResult.objects.create(
-                        search=search,
-                        external_id=hotel_data.get("id", "N/A"),
-                        name=hotel_data.get("name", "Unknown Hotel"),
-                        address=hotel_data.get("address", ""),
-                        price_per_night=hotel_data.get("price_per_night", 0),
-                        total_price=hotel_data.get("total_price", 0),
-                        currency=hotel_data.get("currency", "USD"),
-                        rating=hotel_data.get("rating"),
-                        review_count=hotel_data.get("review_count", 0),
-                        room_type=hotel_data.get("room_type", ""),
-                        amenities=",".join(hotel_data.get("amenities", [])),
-                        distance_from_center=hotel_data.get("distance_from_center", ""),
-                        breakfast_included=hotel_data.get("breakfast_included", False),
-                        cancellation_policy=hotel_data.get("cancellation_policy", ""),
-                        searched_destination=hotel_data.get(
-                            "searched_destination", search.destination
-                        ),
-                        image_url=image_url_value,  # Use None instead of empty string for URLField
-                        is_mock=hotel_data.get("is_mock", False),
+                    hotel_rows.append(
+                        dict(
+                            external_id=hotel_data.get("id", "N/A"),
+                            name=hotel_data.get("name", "Unknown Hotel"),
+                            address=hotel_data.get("address", ""),
+                            price_per_night=hotel_data.get("price_per_night", 0),
+                            total_price=hotel_data.get("total_price", 0),
+                            currency=hotel_data.get("currency", "USD"),
+                            rating=hotel_data.get("rating"),
+                            review_count=hotel_data.get("review_count", 0),
+                            room_type=hotel_data.get("room_type", ""),
+                            amenities=",".join(hotel_data.get("amenities", [])),
+                            distance_from_center=hotel_data.get(
+                                "distance_from_center", ""
+                            ),
+                            breakfast_included=hotel_data.get(
+                                "breakfast_included", False
+                            ),
+                            cancellation_policy=hotel_data.get(
+                                "cancellation_policy", ""
+                            ),
+                            searched_destination=hotel_data.get(
+                                "searched_destination", search.destination
+                            ),
+                            image_url=image_url_value,  # Use None instead of empty string for URLField
+                            is_mock=hotel_data.get("is_mock", False),
+                        )
                     )
+                HotelResult.bulk_ingest(search, hotel_rows)
 
                 # Save activity results
+                activity_rows = []
                 for activity_data in api_results["activities"]:
-                    ActivityResult.objects.create(
-                        search=search,
-                        external_id=activity_data.get("id", "N/A"),
-                        name=activity_data.get("name", "Unknown Activity"),
-                        category=activity_data.get("category", ""),
-                        description=activity_data.get("description", ""),
-                        price=activity_data.get("price", 0),
-                        currency=activity_data.get("currency", "USD"),
-                        duration_hours=activity_data.get("duration_hours", 2),
-                        rating=activity_data.get("rating"),
-                        review_count=activity_data.get("review_count", 0),
-                        included=activity_data.get("included", ""),
-                        meeting_point=activity_data.get("meeting_point", ""),
-                        max_group_size=activity_data.get("max_group_size"),
-                        languages=(
-                            ",".join(activity_data.get("languages", []))
-                            if isinstance(activity_data.get("languages"), list)
-                            else activity_data.get("languages", "")
-                        ),
-                        cancellation_policy=activity_data.get(
-                            "cancellation_policy", ""
-                        ),
-                        searched_destination=activity_data.get(
-                            "searched_destination", search.destination
-                        ),
-                        link=activity_data.get("link", ""),
-                        image_url=activity_data.get("image_url")
-                        or None,  # Use None instead of empty string for URLField
-                        is_mock=activity_data.get("is_mock", False),
+                    activity_rows.append(
+                        dict(
+                            external_id=activity_data.get("id", "N/A"),
+                            name=activity_data.get("name", "Unknown Activity"),
+                            category=activity_data.get("category", ""),
+                            description=activity_data.get("description", ""),
+                            price=activity_data.get("price", 0),
+                            currency=activity_data.get("currency", "USD"),
+                            duration_hours=activity_data.get("duration_hours", 2),
+                            rating=activity_data.get("rating"),
+                            review_count=activity_data.get("review_count", 0),
+                            included=activity_data.get("included", ""),
+                            meeting_point=activity_data.get("meeting_point", ""),
+                            max_group_size=activity_data.get("max_group_size"),
+                            languages=(
+                                ",".join(activity_data.get("languages", []))
+                                if isinstance(activity_data.get("languages"), list)
+                                else activity_data.get("languages", "")
+                            ),
+                            cancellation_policy=activity_data.get(
+                                "cancellation_policy", ""
+                            ),
+                            searched_destination=activity_data.get(
+                                "searched_destination", search.destination
+                            ),
+                            link=activity_data.get("link", ""),
+                            image_url=activity_data.get("image_url")
+                            or None,  # Use None instead of empty string for URLField
+                            is_mock=activity_data.get("is_mock", False),
+                        )
                     )
-
-            # Generate consensus first (or create basic consensus if OpenAI unavailable)
-            try:
-                openai_service = OpenAIService()
-                consensus_data = openai_service.generate_group_consensus(member_prefs)
-            except (ValueError, Exception) as e:
-                # OpenAI API key not configured or error - create basic consensus
-                print(f"[WARNING] OpenAI not available: {str(e)}")
-                print("[INFO] Creating basic consensus without AI...")
-
-                # Create basic consensus data from member preferences
-                destinations = [
-                    pref.get("destination", "")
-                    for pref in member_prefs
-                    if pref.get("destination")
-                ]
-                budgets = [
-                    float(pref.get("budget", "0").replace("$", "").replace(",", ""))
-                    for pref in member_prefs
-                    if pref.get("budget")
-                ]
-
-                consensus_data = {
-                    "consensus_preferences": {
-                        "destinations": list(set(destinations)),
-                        "average_budget": sum(budgets) / len(budgets) if budgets else 0,
-                        "min_budget": min(budgets) if budgets else 0,
-                        "max_budget": max(budgets) if budgets else 0,
-                    },
-                    "compromise_areas": [],
-                    "unanimous_preferences": [],
-                    "conflicting_preferences": [],
-                    "group_dynamics_notes": "Generated without AI assistance - using basic preference analysis.",
-                }
-
-            # Save consensus
-            consensus = GroupConsensus.objects.create(
-                group=group,
-                generated_by=request.user,
-                consensus_preferences=json.dumps(
-                    consensus_data.get("consensus_preferences", {})
-                ),
-                compromise_areas=json.dumps(consensus_data.get("compromise_areas", [])),
-                unanimous_preferences=json.dumps(
-                    consensus_data.get("unanimous_preferences", [])
-                ),
-                conflicting_preferences=json.dumps(
-                    consensus_data.get("conflicting_preferences", [])
-                ),
-                group_dynamics_notes=consensus_data.get("group_dynamics_notes", ""),
-                raw_openai_response=json.dumps(consensus_data),
-            )
+                ActivityResult.bulk_ingest(search, activity_rows)
 
             # OPTIMIZATION: Prepare lightweight data for OpenAI to reduce memory usage
             # Only include essential fields instead of full objects
@@ -2168,12 +2191,21 @@ def generate_voting_options(request, group_id):
             del api_results
             gc.collect()  # Force garbage collection to free memory
 
-            # Generate 5-8 itinerary options with selected dates
-            openai_available = False
+            # Consensus and option generation are independent OpenAI round-trips,
+            # so run them on threads and wait for the slower one rather than the
+            # sum of both; each result falls back to a non-AI version below
+            consensus_future = options_future = None
             try:
-                # Try OpenAI first if available
-                if "openai_service" in locals():
-                    options_data = openai_service.generate_three_itinerary_options(
+                openai_service = OpenAIService()
+            except Exception as e:
+                print(f"[WARNING] OpenAI not available: {str(e)}")
+            else:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    consensus_future = executor.submit(
+                        openai_service.generate_group_consensus, member_prefs
+                    )
+                    options_future = executor.submit(
+                        openai_service.generate_three_itinerary_options,
                         member_preferences=member_prefs,
                         flight_results=lightweight_flights,
                         hotel_results=lightweight_hotels,
@@ -2185,7 +2217,65 @@ def generate_voting_options(request, group_id):
                         },
                         unique_destinations=destinations_list,
                     )
-                    openai_available = True
+
+            # Use the AI consensus (or create basic consensus if OpenAI unavailable)
+            try:
+                if consensus_future is None:
+                    raise ValueError("OpenAI service not available")
+                consensus_data = consensus_future.result()
+            except (ValueError, Exception) as e:
+                # OpenAI API key not configured or error - create basic consensus
+                print(f"[WARNING] OpenAI not available: {str(e)}")
+                print("[INFO] Creating basic consensus without AI...")
+
+                # Create basic consensus data from member preferences
+                destinations = [
+                    pref.get("destination", "")
+                    for pref in member_prefs
+                    if pref.get("destination")
+                ]
+                budgets = [
+                    float(pref.get("budget", "0").replace("$", "").replace(",", ""))
+                    for pref in member_prefs
+                    if pref.get("budget")
+                ]
+
+                consensus_data = {
+                    "consensus_preferences": {
+                        "destinations": list(set(destinations)),
+                        "average_budget": sum(budgets) / len(budgets) if budgets else 0,
+                        "min_budget": min(budgets) if budgets else 0,
+                        "max_budget": max(budgets) if budgets else 0,
+                    },
+                    "compromise_areas": [],
+                    "unanimous_preferences": [],
+                    "conflicting_preferences": [],
+                    "group_dynamics_notes": "Generated without AI assistance - using basic preference analysis.",
+                }
+
+            # Save consensus
+            consensus = GroupConsensus.objects.create(
+                group=group,
+                generated_by=request.user,
+                consensus_preferences=json.dumps(
+                    consensus_data.get("consensus_preferences", {})
+                ),
+                compromise_areas=json.dumps(consensus_data.get("compromise_areas", [])),
+                unanimous_preferences=json.dumps(
+                    consensus_data.get("unanimous_preferences", [])
+                ),
+                conflicting_preferences=json.dumps(
+                    consensus_data.get("conflicting_preferences", [])
+                ),
+                group_dynamics_notes=consensus_data.get("group_dynamics_notes", ""),
+                raw_openai_response=json.dumps(consensus_data),
+            )
+
+            # Generate 5-8 itinerary options with selected dates
+            try:
+                # Use the OpenAI options if they were requested above
+                if options_future is not None:
+                    options_data = options_future.result()
                 else:
                     raise ValueError("OpenAI service not available")
             except Exception as e:
@@ -2325,9 +2415,6 @@ def generate_voting_options(request, group_id):
                     # Redistribute: assign options to different destinations
                     redistributed_options = []
                     dest_index = 0
-                    options_per_dest = max(
-                        3, len(raw_options) // len(destinations_list)
-                    )
 
                     for i, (option_data, _) in enumerate(intended_dests_by_option):
                         # Cycle through destinations
@@ -3075,12 +3162,9 @@ def cast_vote(request, group_id, option_id):
         ).first()
         if other_vote:
             # Update existing vote to point to current option
-            old_option = other_vote.option
             other_vote.option = option
             other_vote.comment = request.POST.get("comment", "")
             other_vote.save()
-            # Update old option's vote count
-            old_option.update_vote_count()
             message = "Vote updated successfully!"
         else:
             # New vote
@@ -3092,10 +3176,7 @@ def cast_vote(request, group_id, option_id):
             )
             message = "Vote cast successfully!"
 
-    # Ensure option's vote count is updated
-    option.update_vote_count()
-
-    # Refresh option from database to get latest state
+    # Vote counts are adjusted by ItineraryVote.save(); reload the latest state
     option.refresh_from_db()
 
     # Check if all members have voted on THIS OPTION
@@ -3326,20 +3407,24 @@ def voting_results(request, group_id):
         messages.warning(request, "No voting session found.")
         return redirect("travel_groups:group_detail", group_id=group.id)
 
-    # Get options with votes
-    options = GroupItineraryOption.objects.filter(
-        group=group, consensus=consensus
-    ).order_by("-vote_count")
+    # Get options with votes; vote_count is kept current by ItineraryVote
+    options = list(
+        GroupItineraryOption.objects.filter(group=group, consensus=consensus).order_by(
+            "-vote_count"
+        )
+    )
 
-    # Get winner
-    winner = options.filter(is_winner=True).first()
+    # Get winner from the options already loaded
+    winner = next((option for option in options if option.is_winner), None)
 
-    # Get all votes with user info
-    votes = ItineraryVote.objects.filter(group=group).select_related("user", "option")
+    # Get all votes with user info; the page lists them all, so count in Python
+    votes = list(
+        ItineraryVote.objects.filter(group=group).select_related("user", "option")
+    )
 
     # Get voting stats
     total_members = GroupMember.objects.filter(group=group).count()
-    votes_cast = ItineraryVote.objects.filter(group=group).count()
+    votes_cast = len(votes)
 
     # Get activities for winner (filtered by destination)
     winner_activities = []
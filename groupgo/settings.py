@@ -165,6 +165,13 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Supports both OPENAI_API_KEY (standard) and OPEN_AI_KEY (legacy) for compatibility
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY") or os.environ.get("OPEN_AI_KEY", "")
 OPENAI_MODEL = "gpt-4o-mini"
+# Used for short free-text answers and as the fallback when OPENAI_MODEL is
+# rate limited or failing
+OPENAI_LIGHT_MODEL = os.environ.get("OPENAI_LIGHT_MODEL", "gpt-4o-mini")
+# Retries for rate-limited (429) and failed (5xx) OpenAI calls, with backoff
+OPENAI_MAX_RETRIES = int(os.environ.get("OPENAI_MAX_RETRIES", 4))
+# Context window of OPENAI_MODEL; oversized prompts are trimmed to fit it
+OPENAI_CONTEXT_TOKENS = int(os.environ.get("OPENAI_CONTEXT_TOKENS", 128000))
 
 # Travel API Configuration
 # Amadeus API (Alternative for flights)
@@ -181,6 +188,71 @@ ACTIVITY_API_KEY = os.environ.get("ACTIVITY_API_KEY", "")
 # Get your API key from: https://serpapi.com/
 SERP_API_KEY = os.environ.get("SERP_API_KEY", "")
 
+# Cache Configuration
+# API search results are cached per process by default. Set CACHE_REDIS_URL to
+# share them across gunicorn workers and keep them warm across restarts.
+CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL", "")
+if CACHE_REDIS_URL and not TESTING:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_REDIS_URL,
+            "KEY_PREFIX": "groupgo",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# How long identical SerpApi flight searches are served from the cache (seconds).
+# Fares change quickly, so keep this short; 0 disables the cache.
+# Tests disable it so mocked responses for the same route don't leak between tests.
+if TESTING:
+    SERPAPI_FLIGHT_CACHE_TIMEOUT = 0
+else:
+    SERPAPI_FLIGHT_CACHE_TIMEOUT = int(
+        os.environ.get("SERPAPI_FLIGHT_CACHE_TIMEOUT", 600)
+    )
+
+# How long identical Amadeus flight searches are served from the cache (seconds).
+# 0 disables the cache; tests disable it for the same reason as above.
+if TESTING:
+    AMADEUS_FLIGHT_CACHE_TIMEOUT = 0
+else:
+    AMADEUS_FLIGHT_CACHE_TIMEOUT = int(
+        os.environ.get("AMADEUS_FLIGHT_CACHE_TIMEOUT", 600)
+    )
+
+# How long parsed Makcorps hotel lists are served from the cache (seconds).
+# Keyed on the normalized search, so case and spacing variants share an entry.
+# 0 disables the cache; tests disable it for the same reason as above.
+if TESTING:
+    MAKCORPS_HOTEL_CACHE_TIMEOUT = 0
+else:
+    MAKCORPS_HOTEL_CACHE_TIMEOUT = int(
+        os.environ.get("MAKCORPS_HOTEL_CACHE_TIMEOUT", 3600)
+    )
+
+# How long Open-Meteo geocoding lookups are served from the cache (seconds).
+# 0 disables the cache; tests disable it for the same reason as above.
+if TESTING:
+    GEOCODE_CACHE_TIMEOUT = 0
+else:
+    GEOCODE_CACHE_TIMEOUT = int(os.environ.get("GEOCODE_CACHE_TIMEOUT", 1800))
+
+# How long identical OpenAI completions are served from the cache (seconds).
+# Only low-temperature requests are cached; 0 disables the cache.
+# Tests disable it so mocked completions don't leak between tests.
+if TESTING:
+    OPENAI_RESPONSE_CACHE_TIMEOUT = 0
+else:
+    OPENAI_RESPONSE_CACHE_TIMEOUT = int(
+        os.environ.get("OPENAI_RESPONSE_CACHE_TIMEOUT", 3600)
+    )
+
 # Email Configuration
 # For development, use minimal console backend. In production, configure SMTP settings.
 # For tests, use locmem backend to avoid connecting to email server